@@ -19,8 +19,10 @@ SNIPPETS_FILE = CONFIG_DIR / "snippets.json"  # 快捷片段文件
 CUSTOM_CONFIG_FILE = CONFIG_DIR / "custom_config.json"  # 自定义配置文件
 AI_WEBSITES_FILE = CONFIG_DIR / "ai_websites.json"  # AI网站配置文件
 
-# 管理员密码
-ADMIN_PASSWORD = "admin"
+# 管理员密码：只保存加盐的 PBKDF2-HMAC-SHA256 摘要，不保存明文
+ADMIN_PWD_SALT = bytes.fromhex("93c693cd94c916e1ac41637634a2351d")
+ADMIN_PWD_ITERATIONS = 200_000
+ADMIN_PWD_HASH = bytes.fromhex("c887fff690d74d1e6134f074a63b1cfa4d647d25641b1faaa7f9306b0fe945c3")
 
 # 默认开发优先级（不可删除）
 DEFAULT_PRIORITIES = ["快速原型", "功能完整", "生产就绪", "最佳实践"]
@@ -6,6 +6,7 @@ import json
 import logging
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -42,6 +43,12 @@ except ImportError:
         DEFAULT_PRIORITIES,
     )
 
+# 可选依赖：安装了 orjson 时用它序列化，速度更快
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +104,7 @@ class HistoryRecord:
     framework: str
     idea_preview: str
     prompt: str
+    timestamp_display: str = ""  # 列表显示用时间（YYYY-MM-DD HH:MM:SS），旧记录可能没有
 
 
 @dataclass
@@ -116,6 +124,11 @@ class FavoriteRecord:
 class DataManager:
     """数据持久化管理器"""
 
+    # AI网站数据版本号，每次保存后递增，供界面层判断缓存是否失效
+    _ai_websites_version = 0
+    # 快捷片段数据版本号，保存后递增，使片段搜索缓存失效
+    _snippets_version = 0
+
     @staticmethod
     def _load_json(file_path: Path, default=None):
         """加载JSON文件"""
@@ -130,9 +143,22 @@ class DataManager:
         return default
 
     @staticmethod
-    def _save_json(file_path: Path, data) -> bool:
-        """保存JSON文件"""
+    def _save_json(file_path: Path, data, fast: bool = False) -> bool:
+        """保存JSON文件
+
+        Args:
+            file_path: 目标文件
+            data: 待保存的数据
+            fast: 是否优先用 orjson 序列化，只用于历史记录、快捷片段这类体积较大的文件；
+                输出同样是 UTF-8 原文、两格缩进，与 ensure_ascii=False 的标准库结果一致
+        """
         try:
+            if fast and orjson is not None:
+                try:
+                    file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                    return True
+                except orjson.JSONEncodeError:
+                    pass  # orjson 不支持的数据（如非字符串键）退回标准库
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
             return True
@@ -166,14 +192,20 @@ class DataManager:
 
     @classmethod
     def save_history(cls, history: list) -> bool:
-        """保存历史记录（最多50条）"""
-        history = history[-50:]
-        return cls._save_json(HISTORY_FILE, history)
+        """保存历史记录（最多50条，传入的列表会被原地截断）"""
+        del history[:-50]
+        return cls._save_json(HISTORY_FILE, history, fast=True)
 
     @classmethod
-    def add_history(cls, record: HistoryRecord) -> bool:
-        """添加历史记录"""
-        history = cls.load_history()
+    def add_history(cls, record: HistoryRecord, history: Optional[list] = None) -> bool:
+        """添加历史记录
+
+        Args:
+            record: 新记录
+            history: 刚读取的历史列表（会被原地追加并截断），为 None 时从磁盘读取
+        """
+        if history is None:
+            history = cls.load_history()
         history.append(asdict(record))
         return cls.save_history(history)
 
@@ -234,18 +266,33 @@ class DataManager:
     @classmethod
     def save_snippets(cls, snippets: dict) -> bool:
         """保存自定义快捷片段"""
-        return cls._save_json(SNIPPETS_FILE, snippets)
+        ok = cls._save_json(SNIPPETS_FILE, snippets, fast=True)
+        if ok:
+            cls._snippets_version += 1
+        return ok
 
     @classmethod
     def get_all_snippets(cls) -> dict:
-        """获取所有片段（预置 + 自定义）"""
+        """获取所有片段（预置 + 自定义）
+
+        每个片段附带只读的 "_preview" 字段（内容前 60 字），供列表显示，不会写回文件。
+        """
         custom = cls.load_snippets()
         # 预置片段优先，自定义片段不能覆盖预置
         all_snippets = {**DEFAULT_SNIPPETS}
         for name, snippet in custom.items():
             if name not in DEFAULT_SNIPPETS:
                 all_snippets[name] = snippet
-        return all_snippets
+        return {
+            name: {**snippet, "_preview": cls._snippet_preview(snippet.get("content", ""))}
+            for name, snippet in all_snippets.items()
+        }
+
+    @staticmethod
+    def _snippet_preview(content: str) -> str:
+        """片段内容预览：超过 60 字时截断并加省略号（只切取前 61 字判断，与内容总长无关）"""
+        head = content[:61]
+        return head[:60] + "..." if len(head) > 60 else head
 
     @classmethod
     def add_snippet(cls, name: str, category: str, content: str) -> bool:
@@ -296,8 +343,24 @@ class DataManager:
 
     @classmethod
     def search_snippets(cls, keyword: str = "", category: str = "") -> dict:
-        """搜索片段"""
-        all_snippets = cls.get_all_snippets()
+        """搜索片段（相同条件在片段数据未变化时直接返回缓存结果）
+
+        返回的每个片段都是副本，调用方修改结果不会影响缓存。
+        """
+        # 文件修改时间也参与缓存键，片段文件在程序外被改动时同样失效
+        try:
+            mtime = SNIPPETS_FILE.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        cached = cls._search_snippets_cached(keyword, category, cls._snippets_version, mtime)
+        return {name: dict(snippet) for name, snippet in cached.items()}
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _search_snippets_cached(keyword: str, category: str, version: int, mtime: int) -> dict:
+        """执行片段搜索；version 和 mtime 只参与缓存键，数据变化后自动失效"""
+        all_snippets = DataManager.get_all_snippets()
+        keyword_lower = keyword.lower()
         results = {}
 
         for name, snippet in all_snippets.items():
@@ -306,8 +369,7 @@ class DataManager:
                 continue
 
             # 按关键词过滤（名称或内容）
-            if keyword:
-                keyword_lower = keyword.lower()
+            if keyword_lower:
                 if (keyword_lower not in name.lower() and
                     keyword_lower not in snippet.get("content", "").lower()):
                     continue
@@ -475,7 +537,10 @@ class DataManager:
     @classmethod
     def save_ai_websites(cls, websites: dict) -> bool:
         """保存自定义AI网站"""
-        return cls._save_json(AI_WEBSITES_FILE, websites)
+        ok = cls._save_json(AI_WEBSITES_FILE, websites)
+        if ok:
+            cls._ai_websites_version += 1
+        return ok
 
     @classmethod
     def get_all_ai_websites(cls) -> dict:
@@ -107,7 +107,8 @@ class PromptGeneratorService:
     def generate(
         self,
         project_info: ProjectInfo,
-        callback: Optional[Callable[[str], None]] = None
+        callback: Optional[Callable[[str], None]] = None,
+        stream_callback: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         生成提示词
@@ -115,6 +116,7 @@ class PromptGeneratorService:
         Args:
             project_info: 项目信息
             callback: 进度回调函数
+            stream_callback: 流式输出回调，每收到一段文本调用一次；提供时使用流式请求
 
         Returns:
             生成的提示词
@@ -132,14 +134,27 @@ class PromptGeneratorService:
             if callback:
                 callback("正在连接 API...")
 
-            message = self._client.messages.create(
-                model=self.api_config.model,
-                max_tokens=8192,
-                system=self.SYSTEM_PROMPT,
-                messages=self.conversation_history,
-            )
-
-            content = message.content[0].text
+            if stream_callback:
+                chunks = []
+                with self._client.messages.stream(
+                    model=self.api_config.model,
+                    max_tokens=8192,
+                    system=self.SYSTEM_PROMPT,
+                    messages=self.conversation_history,
+                ) as stream:
+                    for text in stream.text_stream:
+                        if text:
+                            chunks.append(text)
+                            stream_callback(text)
+                content = "".join(chunks)
+            else:
+                message = self._client.messages.create(
+                    model=self.api_config.model,
+                    max_tokens=8192,
+                    system=self.SYSTEM_PROMPT,
+                    messages=self.conversation_history,
+                )
+                content = message.content[0].text
 
             # 保存助手回复到对话历史
             self.conversation_history.append({"role": "assistant", "content": content})
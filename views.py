@@ -2,14 +2,23 @@
 视图层 - CustomTkinter 现代化 UI
 """
 
+import hashlib
+import hmac
 import logging
 import os
+import re
+import stat
+import subprocess
+import sys
 import threading
-import webbrowser
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from tkinter import filedialog
-from typing import Optional
+from tkinter import messagebox
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional
 
 import customtkinter as ctk
 
@@ -20,9 +29,12 @@ try:
         AVAILABLE_MODELS,
         DEFAULT_TEMPLATES,
         SNIPPET_CATEGORIES,
-        ADMIN_PASSWORD,
+        ADMIN_PWD_SALT,
+        ADMIN_PWD_ITERATIONS,
+        ADMIN_PWD_HASH,
         DEFAULT_PRIORITIES,
         DEFAULT_AI_WEBSITES,
+        AI_WEBSITES_FILE,
     )
     from .models import (
         APIConfig,
@@ -31,12 +43,6 @@ try:
         FavoriteRecord,
         DataManager,
     )
-    from .services import (
-        PromptGeneratorService,
-        PyInstallerService,
-        FileService,
-        AIPackageAnalyzer,
-    )
     from .code_system import get_code_manager, PACKAGES, FEATURES
 except ImportError:
     from config import (
@@ -45,9 +51,12 @@ except ImportError:
         AVAILABLE_MODELS,
         DEFAULT_TEMPLATES,
         SNIPPET_CATEGORIES,
-        ADMIN_PASSWORD,
+        ADMIN_PWD_SALT,
+        ADMIN_PWD_ITERATIONS,
+        ADMIN_PWD_HASH,
         DEFAULT_PRIORITIES,
         DEFAULT_AI_WEBSITES,
+        AI_WEBSITES_FILE,
     )
     from models import (
         APIConfig,
@@ -56,17 +65,173 @@ except ImportError:
         FavoriteRecord,
         DataManager,
     )
-    from services import (
-        PromptGeneratorService,
-        PyInstallerService,
-        FileService,
-        AIPackageAnalyzer,
-    )
     from code_system import get_code_manager, PACKAGES, FEATURES
 
+if TYPE_CHECKING:
+    from .services import PromptGeneratorService
+
 logger = logging.getLogger(__name__)
 
 
+def _check_admin_password(password: str) -> bool:
+    """校验管理员密码：计算 PBKDF2 摘要后做常量时间比较"""
+    candidate = hashlib.pbkdf2_hmac(
+        "sha256", password.encode("utf-8"), ADMIN_PWD_SALT, ADMIN_PWD_ITERATIONS
+    )
+    return hmac.compare_digest(candidate, ADMIN_PWD_HASH)
+
+
+def _services():
+    """按需导入服务层模块（连带 anthropic / httpx），导入后由 sys.modules 缓存"""
+    try:
+        from . import services
+    except ImportError:
+        import services
+    return services
+
+
+# 零基础打包模式日志区的欢迎文本
+_BEGINNER_WELCOME = (
+    "欢迎使用零基础打包模式！\n\n"
+    "步骤：\n"
+    "1. 确保环境检测通过（如未安装 PyInstaller 请点击一键安装）\n"
+    "2. 选择你的 Python 文件\n"
+    "3. 设置程序名称和类型\n"
+    "4. 点击「一键打包」或「AI分析打包」\n"
+)
+
+# 零基础打包模式的程序类型：(显示文本, 取值)，第一项为 GUI 程序（无控制台窗口）
+_PROGRAM_TYPES = (
+    ("GUI 窗口程序", "GUI程序"),
+    ("命令行程序", "命令行程序"),
+)
+_GUI_PROGRAM_TYPE = _PROGRAM_TYPES[0][1]
+
+# AI优化输入使用的提示词模板，仅 {text} 处替换为用户原文
+_OPTIMIZE_PROMPT_TEMPLATE = """你是一个专业的技术文档优化专家。请将以下用户输入优化为更专业、清晰的技术需求描述。
+
+要求：
+1. 保持原意不变，不要添加用户没有提到的技术或功能
+2. 使用专业术语，但保持简洁
+3. 结构化表达，条理清晰
+4. 字数控制在原文的1.2倍以内
+5. 如果是中文就用中文回复，英文就用英文
+
+用户原文：
+{text}
+
+请直接输出优化后的文本，不要包含任何解释或前言："""
+
+# AI优化结果缓存：原文摘要 -> 优化结果，按最近使用淘汰
+_OPTIMIZE_CACHE: OrderedDict = OrderedDict()
+_OPTIMIZE_CACHE_SIZE = 128
+# 少于该字数的输入不调用 AI 优化
+_OPTIMIZE_MIN_CHARS = 20
+
+# 兑换码格式：本地生成的 XXXX-XXXX-XXXX-XXXX，或预设的 BASIC-2024-ABCD-1234 / PRO-2024-MNOP-3456
+_CODE_RE = re.compile(r"[A-Z0-9]{3,5}-[A-Z0-9]{4}-[A-Z0-9]{4}-[A-Z0-9]{4}")
+
+# 粘贴文本中的候选路径：按行切分，同时去掉两端的引号
+_PATH_LINE_RE = re.compile(r'[^\r\n"]+')
+
+# 快捷片段列表每页实例化的卡片数，超出部分点击“显示更多”再创建
+_SNIPPET_PAGE_SIZE = 40
+
+# 模板库每页实例化的卡片数，超出部分点击“显示更多”再创建
+_TEMPLATE_PAGE_SIZE = 30
+
+# 模板卡片、历史项每批渲染的数量，批次之间让出事件循环
+_CARD_BATCH_SIZE = 8
+
+# 上传文件选择对话框的文件类型过滤
+_FILETYPES = (
+    ("所有文件", "*.*"),
+    ("文本文件", "*.txt"),
+    ("Python文件", "*.py"),
+    ("JavaScript文件", "*.js"),
+    ("JSON文件", "*.json"),
+    ("Markdown文件", "*.md"),
+)
+
+
+def _flatten_frameworks(categories: dict) -> list:
+    """合并各分类的框架列表，按出现顺序单次遍历去重"""
+    seen = set()
+    all_frameworks = []
+    for cat_frameworks in categories.values():
+        for fw in cat_frameworks:
+            if fw not in seen:
+                seen.add(fw)
+                all_frameworks.append(fw)
+    return all_frameworks
+
+
+# 每种语言下全部分类的框架（按出现顺序去重），供模板对话框的框架下拉框使用
+# 首次打开模板对话框时才构建，激活界面等路径不会触及
+_FRAMEWORKS_BY_LANG: Optional[dict] = None
+
+
+def _frameworks_by_lang() -> dict:
+    """获取各语言的框架列表，首次调用时构建并缓存"""
+    global _FRAMEWORKS_BY_LANG
+    if _FRAMEWORKS_BY_LANG is None:
+        _FRAMEWORKS_BY_LANG = {
+            lang: _flatten_frameworks(info.get("categories", {}))
+            for lang, info in LANGUAGE_FRAMEWORKS.items()
+        }
+    return _FRAMEWORKS_BY_LANG
+
+
+# 内置模板名称集合：用于区分内置/自定义模板，自定义模板不能与之重名
+_DEFAULT_TEMPLATE_NAMES = frozenset(DEFAULT_TEMPLATES)
+
+# 打包日志文本框保留的最大行数，超出后从头部删除
+_LOG_MAX_LINES = 5000
+
+# AI 额外参数中与打包器已生成参数冲突的选项
+# 带值的选项按前缀匹配（如 --name=xxx、-nxxx），无值的短开关按整词匹配
+_SKIP_PREFIXES = (
+    "--onefile", "--onedir", "--name", "-n", "--icon", "-i",
+    "--windowed", "--console", "--distpath", "--workpath", "--specpath", "--clean",
+)
+_SKIP_EXACT = frozenset({"-F", "-D", "-w", "-c", "-y"})
+
+# 打包相关子进程的额外启动参数：Windows 下不分配控制台窗口，也不做句柄过滤
+if sys.platform == "win32":
+    _POPEN_KWARGS = {"close_fds": False, "creationflags": subprocess.CREATE_NO_WINDOW}
+else:
+    _POPEN_KWARGS = {}
+
+# 图标转换缓存：(源图片路径, mtime_ns, 大小, 输出目录) -> (ico 路径, ico 的 mtime_ns)
+_ICO_CACHE: dict = {}
+
+# PyInstaller 安装状态缓存，结果在有效期内直接复用
+_PYI_CACHE = {"ts": 0.0, "val": None}
+_PYI_CACHE_TTL = 30.0
+
+
+def _is_regular_file(path) -> bool:
+    """判断路径是否为普通文件（一次 stat 调用代替 exists + is_file）"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _is_pyinstaller_installed_cached(force: bool = False) -> bool:
+    """带有效期缓存的 PyInstaller 安装检测"""
+    now = time.monotonic()
+    if force or _PYI_CACHE["val"] is None or now - _PYI_CACHE["ts"] >= _PYI_CACHE_TTL:
+        _PYI_CACHE["val"] = _services().PyInstallerService.is_installed()
+        _PYI_CACHE["ts"] = now
+    return _PYI_CACHE["val"]
+
+
+def _invalidate_pyinstaller_cache():
+    """安装或卸载后使 PyInstaller 检测缓存失效"""
+    _PYI_CACHE["val"] = None
+
+
 # ============================================================
 #                      主应用视图
 # ============================================================
@@ -80,6 +245,13 @@ class MainApp(ctk.CTk):
         # 管理员模式标志
         self.is_admin = False
 
+        # 激活界面根容器；主界面是否已构建
+        self._activation_root = None
+        self._main_built = False
+
+        # 字体缓存：(size, weight, family) -> CTkFont
+        self._fonts: dict = {}
+
         # 兑换码管理器
         self.code_manager = get_code_manager()
 
@@ -149,22 +321,94 @@ class MainApp(ctk.CTk):
             "primary_dark": "#6D28D9",
         }
 
+        # 预计算明暗模式配色元组，构建控件时直接复用
+        c = self.colors
+        self.theme = SimpleNamespace(
+            bg=(c["bg_light"], c["bg_dark"]),
+            bg_base=(c["bg_base"], c["bg_base_dark"]),
+            bg_elevated=(c["bg_elevated"], c["bg_elevated_dark"]),
+            bg_hover=(c["bg_hover"], c["bg_hover_dark"]),
+            surface=(c["surface_light"], c["surface_dark"]),
+            text=(c["text_light"], c["text_dark"]),
+            text_primary=(c["text_primary"], c["text_primary_dark"]),
+            text_secondary=(c["text_secondary"], c["text_secondary_dark"]),
+            text_muted=(c["text_muted"], c["text_muted_dark"]),
+            text_subtle=(c["text_muted_light"], c["text_muted_dark"]),
+            border=(c["border"], c["border_dark"]),
+            border_soft=(c["border_light"], c["border_dark"]),
+            primary=(c["primary"], c["primary"]),
+            primary_dark=(c["primary_dark"], c["primary_dark"]),
+            primary_text=(c["primary"], c["primary_light"]),
+            primary_outline=(c["primary_light"], c["primary"]),
+            accent=(c["accent"], c["accent"]),
+            success=(c["success"], c["success"]),
+        )
+
         # 初始化服务
         self.api_config = APIConfig(
             api_key=self.settings.get("api_key", ""),
             base_url=self.settings.get("base_url", "https://api.anthropic.com"),
             model=self.settings.get("model", "claude-haiku-4-5-20251001"),
         )
-        self.prompt_service = PromptGeneratorService(self.api_config)
-        self.ai_analyzer = AIPackageAnalyzer(self.api_config)
+        # 服务对象在构建主界面时才创建，激活界面不必导入服务层
+        self.prompt_service = None
+        self.ai_analyzer = None
+        # AI优化专用客户端，按 (api_key, base_url) 复用连接池
+        self._anthropic_client = None
+        self._anthropic_client_key = None
+
+        # AI网站缓存：((数据版本号, 文件修改时间), 网站字典)
+        self._ai_websites_cache = None
+
+        # 字数统计的待执行回调 ID
+        self._char_count_pending = None
 
         # 状态变量
         self.current_prompt = ""
         self.current_project_info: Optional[ProjectInfo] = None
         self._generating = False
         self.uploaded_files: list = []
+        self._ingest_pending = 0  # 正在后台读取的上传批次数
+        self._files_display_count = 0  # 文件列表中已显示的文件数
+
+        # 快捷片段卡片缓存：名称 -> (片段数据, 卡片控件)
+        self._snippet_cards: dict = {}
+        self._snippet_empty_label = None
+        self._snippet_render_token = 0  # 片段分批渲染的批次标识，每次刷新递增
+        self._snippet_visible_limit = _SNIPPET_PAGE_SIZE  # 当前最多实例化的片段卡片数
+        self._snippet_more_btn = None
+        # 模板卡片、历史项分批渲染的批次标识，每次刷新递增，旧批次据此放弃
+        self._template_render_token = 0
+        self._history_render_token = 0
+
+        # 消息对话框：复用同一窗口，待显示的消息排队
+        self._msg_dialog = None
+        self._msg_title_lbl = None
+        self._msg_body_lbl = None
+        self._msg_queue: deque = deque()
+        self._msg_showing = False  # 是否有消息正在显示，后续消息据此排队
         self.conversation_pages: list = []
         self.current_page_index = 0
+        # 翻页相关控件最近一次应用的属性，未变化时跳过 configure
+        self._page_ui_state: dict = {}
+        # 输出框当前显示的页面内容，用于跳过重复写入
+        self._displayed_content: Optional[str] = None
+        # 流式生成：待写入的分片、是否已安排刷新、正在写入的结果页
+        self._stream_chunks: list = []
+        self._stream_flush_pending = False
+        self._streaming_page: Optional[dict] = None
+        # 流式结果页替换掉的原分页状态 (分页, 当前页, 当前提示词)，生成失败时恢复
+        self._stream_prev_state: Optional[tuple] = None
+        # 后台线程的状态栏更新：最新文字和是否已安排刷新
+        self._status_text = ""
+        self._status_pending = False
+        self._status_after: Optional[str] = None
+
+        # 日志缓冲：按文本框属性名暂存待写入的行，定时合并为一次插入
+        # 后台线程可直接写入缓冲区，由锁保护，刷新始终在主线程进行
+        self._log_buffers: dict = {"beginner_log_textbox": [], "pack_log_textbox": []}
+        self._log_flush_pending: set = set()
+        self._log_lock = threading.Lock()
 
         # 应用专业背景
         self.configure(fg_color=(self.colors["bg_light"], self.colors["bg_dark"]))
@@ -175,6 +419,15 @@ class MainApp(ctk.CTk):
         # 绑定关闭事件
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+    def _font(self, size: int, weight: str = None, family: str = "Microsoft YaHei UI"):
+        """获取共享字体，相同规格只创建一次"""
+        key = (size, weight, family)
+        font = self._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, weight=weight, family=family)
+            self._fonts[key] = font
+        return font
+
     def _show_splash_screen(self):
         """显示启动加载页面 - 极简设计"""
         # 创建加载容器
@@ -208,7 +461,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             logo_frame,
             text="7OZP1K",
-            font=ctk.CTkFont(size=21, weight="bold", family="Arial"),
+            font=self._font(21, "bold", family="Arial"),
             text_color="white"
         ).place(relx=0.5, rely=0.5, anchor="center")
 
@@ -216,7 +469,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             center_container,
             text="7OZP1K 编程助手vx:AE86-1w",
-            font=ctk.CTkFont(size=32, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(32, "bold"),
             text_color=(self.colors["text_light"], self.colors["text_dark"])
         ).pack(pady=(0, 10))
 
@@ -224,7 +477,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             center_container,
             text="AI智能开发工具",
-            font=ctk.CTkFont(size=14, family="Microsoft YaHei UI"),
+            font=self._font(14),
             text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"])
         ).pack(pady=(0, 45))
 
@@ -242,7 +495,7 @@ class MainApp(ctk.CTk):
         self.loading_label = ctk.CTkLabel(
             progress_container,
             text="正在初始化...",
-            font=ctk.CTkFont(size=13, family="Microsoft YaHei UI"),
+            font=self._font(13),
             text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"])
         )
         self.loading_label.pack(pady=(0, 10))
@@ -264,7 +517,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             center_container,
             text="v3.0",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"])
         ).pack(pady=(25, 0))
 
@@ -323,6 +576,7 @@ class MainApp(ctk.CTk):
             corner_radius=0
         )
         container.pack(fill="both", expand=True)
+        self._activation_root = container
 
         # 主卡片
         main_card = ctk.CTkFrame(
@@ -352,14 +606,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             logo_container,
             text="🔐",
-            font=ctk.CTkFont(size=48)
+            font=self._font(48, family=None)
         ).place(relx=0.5, rely=0.5, anchor="center")
 
         # 标题
         ctk.CTkLabel(
             main_card,
             text="7OZP1K 编程助手",
-            font=ctk.CTkFont(size=28, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(28, "bold"),
             text_color=(self.colors["text_light"], self.colors["text_dark"])
         ).pack(pady=(0, 8))
 
@@ -367,7 +621,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             main_card,
             text="请输入兑换码激活软件功能",
-            font=ctk.CTkFont(size=13, family="Microsoft YaHei UI"),
+            font=self._font(13),
             text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"]),
         ).pack(pady=(0, 35))
 
@@ -377,7 +631,7 @@ class MainApp(ctk.CTk):
             main_card,
             textvariable=self.activation_code_var,
             placeholder_text="XXXX-XXXX-XXXX-XXXX",
-            font=ctk.CTkFont(family="Consolas", size=15, weight="bold"),
+            font=self._font(15, "bold", family="Consolas"),
             width=400,
             height=52,
             justify="center",
@@ -395,16 +649,16 @@ class MainApp(ctk.CTk):
         self.activation_msg = ctk.CTkLabel(
             main_card,
             text="",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(12, "bold"),
             text_color=(self.colors["text_light"], self.colors["text_dark"]),
         )
         self.activation_msg.pack(pady=(0, 20))
 
         # 激活按钮 - 紫色渐变
-        activate_btn = ctk.CTkButton(
+        self.activate_btn = ctk.CTkButton(
             main_card,
             text="立即激活",
-            font=ctk.CTkFont(size=15, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(15, "bold"),
             width=240,
             height=48,
             corner_radius=10,
@@ -413,7 +667,7 @@ class MainApp(ctk.CTk):
             text_color="white",
             command=self._activate,
         )
-        activate_btn.pack(pady=(0, 30))
+        self.activate_btn.pack(pady=(0, 30))
 
         # 套餐说明
         info_card = ctk.CTkFrame(
@@ -427,7 +681,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             info_card,
             text="📦 套餐说明",
-            font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(13, "bold"),
             text_color=(self.colors["text_light"], self.colors["text_dark"])
         ).pack(pady=(15, 12))
 
@@ -444,21 +698,21 @@ class MainApp(ctk.CTk):
             ctk.CTkLabel(
                 pkg_row,
                 text="•",
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=self._font(14, "bold", family=None),
                 text_color=(self.colors["primary"], self.colors["primary_light"])
             ).pack(side="left", padx=(0, 10))
 
             ctk.CTkLabel(
                 pkg_row,
                 text=f"{title}：",
-                font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+                font=self._font(12, "bold"),
                 text_color=(self.colors["text_light"], self.colors["text_dark"])
             ).pack(side="left")
 
             ctk.CTkLabel(
                 pkg_row,
                 text=desc,
-                font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+                font=self._font(11),
                 text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"])
             ).pack(side="left", padx=(5, 0))
 
@@ -478,14 +732,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             admin_frame,
             text="管理员?",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"])
         ).pack(side="left", padx=(0, 8))
 
         admin_btn = ctk.CTkButton(
             admin_frame,
             text="🔧 进入管理员模式",
-            font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(13, "bold"),
             fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
             hover_color=(self.colors["primary"], self.colors["primary"]),
             text_color=(self.colors["primary"], self.colors["primary_light"]),
@@ -543,14 +797,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             icon_frame,
             text="🔧",
-            font=ctk.CTkFont(size=30)
+            font=self._font(30, family=None)
         ).place(relx=0.5, rely=0.5, anchor="center")
 
         # 标题
         ctk.CTkLabel(
             frame,
             text="管理员登录",
-            font=ctk.CTkFont(size=20, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(20, "bold"),
             text_color=(self.colors["text_light"], self.colors["text_dark"])
         ).pack(pady=(0, 20))
 
@@ -563,7 +817,7 @@ class MainApp(ctk.CTk):
             show="●",
             width=320,
             height=46,
-            font=ctk.CTkFont(size=13, family="Microsoft YaHei UI"),
+            font=self._font(13),
             corner_radius=10,
             border_width=2,
             border_color=(self.colors["border_light"], self.colors["border_dark"]),
@@ -577,12 +831,12 @@ class MainApp(ctk.CTk):
             frame,
             text="",
             text_color=(self.colors["error"], self.colors["error"]),
-            font=ctk.CTkFont(size=11, weight="bold", family="Microsoft YaHei UI")
+            font=self._font(11, "bold")
         )
         msg_label.pack(pady=(0, 15))
 
         def do_login():
-            if pwd_var.get() == ADMIN_PASSWORD:
+            if _check_admin_password(pwd_var.get()):
                 self.is_admin = True
                 dialog.destroy()
                 self._enter_main_app()
@@ -597,7 +851,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             frame,
             text="登录",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             width=220,
             height=44,
             corner_radius=10,
@@ -610,13 +864,39 @@ class MainApp(ctk.CTk):
 
     def _activate(self):
         """激活软件"""
-        code = self.activation_code_var.get().strip()
+        if self.activate_btn.cget("state") == "disabled":
+            return  # 正在兑换中，忽略重复提交
+
+        code = self.activation_code_var.get().strip().upper()
 
         if not code:
             self.activation_msg.configure(text="请输入兑换码", text_color="red")
             return
 
-        success, message = self.code_manager.redeem_code(code)
+        # 格式不对的输入直接提示，不必读取兑换码文件
+        if not _CODE_RE.fullmatch(code):
+            self.activation_msg.configure(text="兑换码格式无效", text_color="red")
+            return
+
+        # 兑换需要读写兑换码和授权文件，放到后台线程执行
+        self.activate_btn.configure(state="disabled")
+        self.activation_msg.configure(text="激活中…", text_color="gray")
+        threading.Thread(target=self._redeem_worker, args=(code,), daemon=True).start()
+
+    def _redeem_worker(self, code: str):
+        """后台线程：兑换激活码，结果交回主线程"""
+        try:
+            success, message = self.code_manager.redeem_code(code)
+        except Exception as e:
+            logger.exception("兑换激活码失败")
+            success, message = False, f"激活失败: {e}"
+        self.after(0, self._activation_done, success, message)
+
+    def _activation_done(self, success: bool, message: str):
+        """兑换完成后更新激活界面"""
+        # 期间可能已通过管理员登录离开激活界面
+        if not self.activation_msg.winfo_exists():
+            return
 
         if success:
             self.activation_msg.configure(text=message, text_color="green")
@@ -624,12 +904,19 @@ class MainApp(ctk.CTk):
             self.after(1500, self._enter_main_app)
         else:
             self.activation_msg.configure(text=message, text_color="red")
+            self.activate_btn.configure(state="normal")
 
     def _enter_main_app(self):
         """进入主应用界面"""
-        # 清空激活界面
-        for widget in self.winfo_children():
-            widget.destroy()
+        # 主界面只构建一次（如兑换成功后的延迟进入与管理员登录先后触发）
+        if self._main_built:
+            return
+
+        # 先隐藏激活界面，主界面构建并绘制后再销毁其控件
+        activation_root = self._activation_root
+        self._activation_root = None
+        if activation_root is not None:
+            activation_root.pack_forget()
 
         # 恢复窗口大小
         self.geometry("1400x900")
@@ -638,8 +925,21 @@ class MainApp(ctk.CTk):
         # 构建主界面
         self._build_ui()
 
+        if activation_root is not None:
+            self.after_idle(activation_root.destroy)
+
+    def _ensure_services(self):
+        """首次需要时创建提示词生成和打包分析服务"""
+        if self.prompt_service is None:
+            services = _services()
+            self.prompt_service = services.PromptGeneratorService(self.api_config)
+            self.ai_analyzer = services.AIPackageAnalyzer(self.api_config)
+
     def _build_ui(self):
         """构建用户界面 - 全新单页导航布局"""
+        self._main_built = True
+        self._ensure_services()
+
         # 配置网格
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1)  # 内容区可扩展
@@ -695,7 +995,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             logo_circle,
             text="7",
-            font=ctk.CTkFont(size=14, weight="bold", family="Arial"),
+            font=self._font(14, "bold", family="Arial"),
             text_color="white"
         ).place(relx=0.5, rely=0.5, anchor="center")
 
@@ -703,7 +1003,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             brand_section,
             text="7OZP1K 编程助手",
-            font=ctk.CTkFont(size=18, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(18, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left")
 
@@ -715,7 +1015,7 @@ class MainApp(ctk.CTk):
         self.api_status_label = ctk.CTkLabel(
             tools_section,
             text="",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
         )
         self.api_status_label.pack(side="left", padx=(0, 16))
@@ -724,7 +1024,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             tools_section,
             text="⚙",
-            font=ctk.CTkFont(size=18),
+            font=self._font(18, family=None),
             width=36,
             height=36,
             corner_radius=8,
@@ -739,7 +1039,7 @@ class MainApp(ctk.CTk):
         theme_btn = ctk.CTkButton(
             tools_section,
             text="◐",
-            font=ctk.CTkFont(size=18),
+            font=self._font(18, family=None),
             width=36,
             height=36,
             corner_radius=8,
@@ -754,7 +1054,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             tools_section,
             text="?",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold", family=None),
             width=36,
             height=36,
             corner_radius=8,
@@ -811,7 +1111,7 @@ class MainApp(ctk.CTk):
             btn = ctk.CTkButton(
                 btn_container,
                 text=label,
-                font=ctk.CTkFont(size=13, family="Microsoft YaHei UI"),
+                font=self._font(13),
                 height=40,
                 corner_radius=0,
                 fg_color="transparent",
@@ -848,14 +1148,14 @@ class MainApp(ctk.CTk):
                 # 选中状态
                 btn.configure(
                     text_color=(self.colors["primary"], self.colors["primary_light"]),
-                    font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI")
+                    font=self._font(13, "bold")
                 )
                 indicator.configure(fg_color=self.colors["primary"])
             else:
                 # 未选中状态
                 btn.configure(
                     text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"]),
-                    font=ctk.CTkFont(size=13, family="Microsoft YaHei UI")
+                    font=self._font(13)
                 )
                 indicator.configure(fg_color="transparent")
 
@@ -873,12 +1173,20 @@ class MainApp(ctk.CTk):
         if nav_id in self.content_frames:
             self.content_frames[nav_id].grid(row=0, column=0, sticky="nsew")
 
+        # 模板库首次显示时才加载模板列表
+        if nav_id == "templates" and not self._templates_loaded:
+            self._refresh_templates()
+
+        # 打包页首次显示时才构建当前模式界面并检测环境
+        if nav_id == "packager":
+            self._on_packager_mode_changed(self.packager_mode_menu.get())
+
         # 更新导航样式
         self._update_nav_styles()
 
         # 更新状态栏
         nav_labels = dict(self.nav_items)
-        self.status_label.configure(text=f"当前: {nav_labels.get(nav_id, '')}")
+        self._set_status(f"当前: {nav_labels.get(nav_id, '')}")
 
     # ----------------------------------------------------------
     #                       内容区域 (Content Area)
@@ -933,7 +1241,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             title_group,
             text="创建新项目",
-            font=ctk.CTkFont(size=22, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(22, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left")
 
@@ -941,7 +1249,7 @@ class MainApp(ctk.CTk):
         self.project_status_badge = ctk.CTkLabel(
             title_group,
             text="就绪",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color="white",
             fg_color=self.colors["success"],
             corner_radius=10,
@@ -954,7 +1262,7 @@ class MainApp(ctk.CTk):
         self.api_status_label = ctk.CTkLabel(
             header,
             text="",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         )
         self.api_status_label.grid(row=0, column=1, sticky="e")
@@ -983,14 +1291,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             config_header,
             text="⚙",
-            font=ctk.CTkFont(size=16),
+            font=self._font(16, family=None),
             text_color=self.colors["primary"]
         ).pack(side="left")
 
         ctk.CTkLabel(
             config_header,
             text="项目配置",
-            font=ctk.CTkFont(size=15, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(15, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left", padx=(8, 0))
 
@@ -1008,7 +1316,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             lang_row,
             text="编程语言",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(12, "bold"),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).pack(side="left")
 
@@ -1016,7 +1324,7 @@ class MainApp(ctk.CTk):
         self.lang_icon_label = ctk.CTkLabel(
             lang_row,
             text="Py",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold", family=None),
             text_color="white",
             fg_color=self.colors["primary"],
             corner_radius=6,
@@ -1039,7 +1347,7 @@ class MainApp(ctk.CTk):
             button_hover_color=self.colors["primary_hover"],
             dropdown_fg_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
             dropdown_hover_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI")
+            font=self._font(12, "bold")
         )
         self.language_menu.pack(side="left")
 
@@ -1052,7 +1360,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             fw_row,
             text="框架类别",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(12, "bold"),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=0, column=0, sticky="w")
 
@@ -1070,14 +1378,14 @@ class MainApp(ctk.CTk):
             button_hover_color=self.colors["primary"],
             dropdown_fg_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
             dropdown_hover_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")
+            font=self._font(12)
         )
         self.category_menu.grid(row=0, column=1, sticky="w", padx=(12, 24))
 
         ctk.CTkLabel(
             fw_row,
             text="具体框架",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(12, "bold"),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=0, column=2, sticky="w")
 
@@ -1094,24 +1402,21 @@ class MainApp(ctk.CTk):
             button_hover_color=self.colors["primary"],
             dropdown_fg_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
             dropdown_hover_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")
+            font=self._font(12)
         )
         self.framework_menu.grid(row=0, column=3, sticky="w", padx=(12, 0))
 
-        # ====== 开发优先级 - 芯片式选择 ======
+        # ====== 开发优先级 - 分段按钮 ======
         priority_row = ctk.CTkFrame(config_card, fg_color="transparent")
         priority_row.grid(row=4, column=0, columnspan=4, sticky="ew", padx=16, pady=(8, 16))
 
         ctk.CTkLabel(
             priority_row,
             text="开发优先级",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(12, "bold"),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).pack(side="left")
 
-        priority_chips = ctk.CTkFrame(priority_row, fg_color="transparent")
-        priority_chips.pack(side="right")
-
         self.priority_var = ctk.StringVar(value="功能完整")
         priorities = [
             ("快速原型", "⚡"),
@@ -1120,22 +1425,22 @@ class MainApp(ctk.CTk):
             ("最佳实践", "⭐")
         ]
 
-        self.priority_buttons = {}
-        for p_text, p_icon in priorities:
-            btn = ctk.CTkButton(
-                priority_chips,
-                text=f"{p_icon} {p_text}",
-                font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-                height=30,
-                width=90,
-                corner_radius=15,
-                fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]) if p_text != "功能完整" else self.colors["primary"],
-                hover_color=self.colors["primary_hover"],
-                text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"]) if p_text != "功能完整" else "white",
-                command=lambda t=p_text: self._select_priority(t)
-            )
-            btn.pack(side="left", padx=3)
-            self.priority_buttons[p_text] = btn
+        # 单个分段按钮承载全部优先级，显示文字带图标，选中后映射回优先级名称
+        self._priority_by_label = {f"{p_icon} {p_text}": p_text for p_text, p_icon in priorities}
+        self.priority_seg = ctk.CTkSegmentedButton(
+            priority_row,
+            values=list(self._priority_by_label),
+            command=self._select_priority,
+            height=30,
+            corner_radius=15,
+            selected_color=self.colors["primary"],
+            selected_hover_color=self.colors["primary_hover"],
+            unselected_color=self.theme.bg_hover,
+            unselected_hover_color=self.theme.bg_hover,
+            font=self._font(11)
+        )
+        self.priority_seg.pack(side="right")
+        self.priority_seg.set("✓ 功能完整")
 
         # 初始化框架选项
         self._on_language_changed(self.language_var.get())
@@ -1157,20 +1462,20 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             upload_header,
             text="📎",
-            font=ctk.CTkFont(size=14)
+            font=self._font(14, family=None)
         ).pack(side="left")
 
         ctk.CTkLabel(
             upload_header,
             text="附加文件",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left", padx=(6, 0))
 
         ctk.CTkLabel(
             upload_header,
             text="可选",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
             fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
             corner_radius=4,
@@ -1184,7 +1489,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_group,
             text="清空",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=60,
             height=28,
             corner_radius=6,
@@ -1194,17 +1499,18 @@ class MainApp(ctk.CTk):
             command=self._clear_files,
         ).pack(side="left", padx=(0, 6))
 
-        ctk.CTkButton(
+        self.select_files_btn = ctk.CTkButton(
             btn_group,
             text="选择文件",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=85,
             height=28,
             corner_radius=6,
             fg_color=self.colors["primary"],
             hover_color=self.colors["primary_hover"],
             command=self._select_files,
-        ).pack(side="left")
+        )
+        self.select_files_btn.pack(side="left")
 
         # 拖拽区域 - 虚线效果
         self.drop_frame = ctk.CTkFrame(
@@ -1224,13 +1530,13 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             drop_content,
             text="📂",
-            font=ctk.CTkFont(size=20)
+            font=self._font(20, family=None)
         ).pack()
 
         self.drop_label = ctk.CTkLabel(
             drop_content,
             text="点击选择或拖拽文件到此处",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
         )
         self.drop_label.pack()
@@ -1242,7 +1548,7 @@ class MainApp(ctk.CTk):
         self.files_listbox = ctk.CTkTextbox(
             upload_card,
             height=45,
-            font=ctk.CTkFont(size=10, family="Consolas"),
+            font=self._font(10, family="Consolas"),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             corner_radius=6
         )
@@ -1271,20 +1577,20 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             desc_header,
             text="✏",
-            font=ctk.CTkFont(size=14)
+            font=self._font(14, family=None)
         ).pack(side="left")
 
         ctk.CTkLabel(
             desc_header,
             text="项目描述",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left", padx=(6, 0))
 
         self.char_count_label = ctk.CTkLabel(
             desc_header,
             text="0 字",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
             fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
             corner_radius=4,
@@ -1297,7 +1603,7 @@ class MainApp(ctk.CTk):
         self.optimize_btn = ctk.CTkButton(
             desc_header,
             text="✨ AI优化",
-            font=ctk.CTkFont(size=11, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(11, "bold"),
             width=85,
             height=28,
             corner_radius=14,
@@ -1309,7 +1615,7 @@ class MainApp(ctk.CTk):
 
         self.idea_textbox = ctk.CTkTextbox(
             desc_card,
-            font=ctk.CTkFont(size=13, family="Microsoft YaHei UI"),
+            font=self._font(13),
             wrap="word",
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             corner_radius=8
@@ -1339,20 +1645,20 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             action_header,
             text="🚀",
-            font=ctk.CTkFont(size=16)
+            font=self._font(16, family=None)
         ).pack(side="left")
 
         ctk.CTkLabel(
             action_header,
             text="生成提示词",
-            font=ctk.CTkFont(size=15, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(15, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left", padx=(8, 0))
 
         self.generate_btn = ctk.CTkButton(
             action_card,
             text="开始生成",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             height=48,
             corner_radius=10,
             fg_color=self.colors["primary"],
@@ -1364,7 +1670,7 @@ class MainApp(ctk.CTk):
         self.progress_label = ctk.CTkLabel(
             action_card,
             text="",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
         )
         self.progress_label.pack(anchor="w", padx=16, pady=(0, 16))
@@ -1386,13 +1692,13 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             quick_header,
             text="⚡",
-            font=ctk.CTkFont(size=14)
+            font=self._font(14, family=None)
         ).pack(side="left")
 
         ctk.CTkLabel(
             quick_header,
             text="快捷操作",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left", padx=(6, 0))
 
@@ -1429,13 +1735,13 @@ class MainApp(ctk.CTk):
             ctk.CTkLabel(
                 inner,
                 text=icon,
-                font=ctk.CTkFont(size=14)
+                font=self._font(14, family=None)
             ).pack(side="left", padx=(8, 0))
 
             ctk.CTkLabel(
                 inner,
                 text=text,
-                font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+                font=self._font(12),
                 text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
             ).pack(side="left", padx=(10, 0))
 
@@ -1443,26 +1749,15 @@ class MainApp(ctk.CTk):
             ctk.CTkLabel(
                 btn,
                 text="›",
-                font=ctk.CTkFont(size=16),
+                font=self._font(16, family=None),
                 text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
             ).place(relx=0.95, rely=0.5, anchor="e")
 
         ctk.CTkFrame(quick_card, fg_color="transparent", height=16).pack()
 
-    def _select_priority(self, priority: str):
-        """选择开发优先级 - 更新芯片按钮样式"""
-        self.priority_var.set(priority)
-        for p_text, btn in self.priority_buttons.items():
-            if p_text == priority:
-                btn.configure(
-                    fg_color=self.colors["primary"],
-                    text_color="white"
-                )
-            else:
-                btn.configure(
-                    fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-                    text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
-                )
+    def _select_priority(self, label: str):
+        """选择开发优先级 - 分段按钮的显示文字映射回优先级名称"""
+        self.priority_var.set(self._priority_by_label.get(label, label))
 
     def _build_templates_content(self):
         """构建模板库内容页 - UI-UX-PRO-MAX 高级风格"""
@@ -1489,13 +1784,13 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             title_group,
             text="📚",
-            font=ctk.CTkFont(size=20)
+            font=self._font(20, family=None)
         ).pack(side="left")
 
         ctk.CTkLabel(
             title_group,
             text="模板库",
-            font=ctk.CTkFont(size=22, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(22, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left", padx=(10, 0))
 
@@ -1503,7 +1798,7 @@ class MainApp(ctk.CTk):
         self.template_count_badge = ctk.CTkLabel(
             title_group,
             text="0 个模板",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color="white",
             fg_color=self.colors["primary"],
             corner_radius=10,
@@ -1519,7 +1814,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_group,
             text="🔄 刷新",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=80,
             height=34,
             corner_radius=8,
@@ -1534,7 +1829,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_group,
             text="➕ 添加模板",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(12, "bold"),
             width=110,
             height=34,
             corner_radius=8,
@@ -1551,8 +1846,13 @@ class MainApp(ctk.CTk):
         )
         self.templates_scroll_frame.grid(row=1, column=0, sticky="nsew", padx=24, pady=(0, 24))
         self.templates_scroll_frame.grid_columnconfigure(0, weight=1)
-
-        self._refresh_templates()
+        # 模板卡片池：刷新时复用已创建的卡片，只更新文字与回调
+        self._template_card_pool: list[dict] = []
+        self._template_empty_frame = None
+        self._template_visible_limit = _TEMPLATE_PAGE_SIZE  # 当前最多显示的模板卡片数
+        self._template_more_btn = None
+        # 模板列表在首次切换到模板库时才加载
+        self._templates_loaded = False
 
     def _build_history_content(self):
         """构建历史记录内容页 - UI-UX-PRO-MAX 高级风格"""
@@ -1579,13 +1879,13 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             title_group,
             text="📜",
-            font=ctk.CTkFont(size=20)
+            font=self._font(20, family=None)
         ).pack(side="left")
 
         ctk.CTkLabel(
             title_group,
             text="历史记录",
-            font=ctk.CTkFont(size=22, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(22, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left", padx=(10, 0))
 
@@ -1593,7 +1893,7 @@ class MainApp(ctk.CTk):
         self.history_count_badge = ctk.CTkLabel(
             title_group,
             text="0 条记录",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color="white",
             fg_color=self.colors["accent"],
             corner_radius=10,
@@ -1609,7 +1909,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_group,
             text="🔄 刷新",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=80,
             height=34,
             corner_radius=8,
@@ -1624,7 +1924,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_group,
             text="🗑 清空全部",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=100,
             height=34,
             corner_radius=8,
@@ -1642,6 +1942,10 @@ class MainApp(ctk.CTk):
         self.history_frame.grid(row=1, column=0, sticky="nsew", padx=24, pady=(0, 24))
         self.history_frame.grid_columnconfigure(0, weight=1)
 
+        # 历史项控件池：刷新时复用已创建的行，只更新文字与回调
+        self._history_item_pool: list[dict] = []
+        self._history_empty_frame = None
+
         self._refresh_history()
 
     def _build_output_content(self):
@@ -1684,7 +1988,7 @@ class MainApp(ctk.CTk):
         self.page_label = ctk.CTkLabel(
             page_frame,
             text="0 / 0",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         )
         self.page_label.pack(side="left", padx=8)
@@ -1706,7 +2010,7 @@ class MainApp(ctk.CTk):
         self.page_title_label = ctk.CTkLabel(
             page_frame,
             text="",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(12, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         )
         self.page_title_label.pack(side="left", padx=16)
@@ -1718,7 +2022,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="复制",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=60,
             height=32,
             corner_radius=6,
@@ -1733,7 +2037,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="收藏",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=60,
             height=32,
             corner_radius=6,
@@ -1748,7 +2052,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="导出",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=60,
             height=32,
             corner_radius=6,
@@ -1773,7 +2077,7 @@ class MainApp(ctk.CTk):
             fg_color=self.colors["success"],
             button_color=self.colors["success"],
             button_hover_color="#059669",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI")
+            font=self._font(11)
         )
         self.jump_website_menu.pack(side="left", padx=2)
         self.jump_website_menu.set("跳转")
@@ -1781,7 +2085,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="清空",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=60,
             height=32,
             corner_radius=6,
@@ -1794,7 +2098,7 @@ class MainApp(ctk.CTk):
         # 输出文本框
         self.output_textbox = ctk.CTkTextbox(
             frame,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=self._font(12, family="Consolas"),
             wrap="word",
             state="disabled",
             fg_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
@@ -1814,7 +2118,7 @@ class MainApp(ctk.CTk):
         self.word_count_label = ctk.CTkLabel(
             stats_frame,
             text="字数: 0",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         )
         self.word_count_label.pack(side="left", padx=(0, 16))
@@ -1822,7 +2126,7 @@ class MainApp(ctk.CTk):
         self.line_count_label = ctk.CTkLabel(
             stats_frame,
             text="行数: 0",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         )
         self.line_count_label.pack(side="left")
@@ -1834,7 +2138,7 @@ class MainApp(ctk.CTk):
         self.followup_entry = ctk.CTkEntry(
             followup_frame,
             placeholder_text="输入追问内容...",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=300,
             height=32,
             corner_radius=6,
@@ -1847,7 +2151,7 @@ class MainApp(ctk.CTk):
         self.followup_btn = ctk.CTkButton(
             followup_frame,
             text="发送",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=60,
             height=32,
             corner_radius=6,
@@ -1861,10 +2165,10 @@ class MainApp(ctk.CTk):
         """构建打包工具内容页"""
         frame = ctk.CTkFrame(
             self.content_container,
-            fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
+            fg_color=self.theme.bg_elevated,
             corner_radius=12,
             border_width=1,
-            border_color=(self.colors["border"], self.colors["border_dark"])
+            border_color=self.theme.border
         )
         self.content_frames["packager"] = frame
 
@@ -1879,8 +2183,8 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="Python 打包工具",
-            font=ctk.CTkFont(size=20, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
+            font=self._font(20, "bold"),
+            text_color=self.theme.text_primary
         ).grid(row=0, column=0, sticky="w")
 
         # 模式切换
@@ -1890,8 +2194,8 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             mode_frame,
             text="模式:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
+            font=self._font(11),
+            text_color=self.theme.text_muted
         ).pack(side="left", padx=(0, 8))
 
         self.packager_mode_var = ctk.StringVar(value="beginner")
@@ -1902,9 +2206,9 @@ class MainApp(ctk.CTk):
             command=self._on_packager_mode_changed,
             selected_color=self.colors["primary"],
             selected_hover_color=self.colors["primary_hover"],
-            unselected_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
-            unselected_hover_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI")
+            unselected_color=self.theme.bg_base,
+            unselected_hover_color=self.theme.bg_hover,
+            font=self._font(11)
         )
         self.packager_mode_menu.pack(side="left", padx=8)
         self.packager_mode_menu.set("零基础用户")
@@ -1912,8 +2216,8 @@ class MainApp(ctk.CTk):
         self.pyinstaller_status = ctk.CTkLabel(
             mode_frame,
             text="检查中...",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
+            font=self._font(10),
+            text_color=self.theme.text_muted,
         )
         self.pyinstaller_status.pack(side="left", padx=10)
 
@@ -1923,15 +2227,10 @@ class MainApp(ctk.CTk):
         self.packager_container.grid_columnconfigure(0, weight=1)
         self.packager_container.grid_rowconfigure(0, weight=1)
 
-        # 构建两种模式界面
-        self._build_beginner_mode()
-        self._build_developer_mode()
-
-        # 默认显示零基础模式
-        self._show_beginner_mode()
-
-        # 检查 PyInstaller 状态
-        self._check_pyinstaller()
+        # 两种模式界面在首次切换到对应模式时才构建，
+        # PyInstaller 状态也随之检测（零基础模式由环境检测一并更新）
+        self.beginner_frame = None
+        self.developer_frame = None
 
     def _build_toolbox_content(self):
         """构建工具箱内容页 - Bento Grid 高级风格"""
@@ -1959,7 +2258,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             title_frame,
             text="工具箱",
-            font=ctk.CTkFont(size=22, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(22, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left")
 
@@ -1967,7 +2266,7 @@ class MainApp(ctk.CTk):
         self.toolbox_tag = ctk.CTkLabel(
             title_frame,
             text="多功能工具集",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
             fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
             corner_radius=6,
@@ -1980,7 +2279,7 @@ class MainApp(ctk.CTk):
         self.toolbox_segmented = ctk.CTkSegmentedButton(
             header,
             values=["视频解析", "系统配置"],
-            font=ctk.CTkFont(size=13, family="Microsoft YaHei UI"),
+            font=self._font(13),
             corner_radius=8,
             fg_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
             selected_color=self.colors["primary"],
@@ -2068,8 +2367,8 @@ class MainApp(ctk.CTk):
         unlock_content.place(relx=0.5, rely=0.45, anchor="center")
 
         ctk.CTkFrame(unlock_content, width=80, height=80, corner_radius=40, fg_color=bg_tertiary, border_width=2, border_color=accent).pack(pady=(0, 20))
-        ctk.CTkLabel(unlock_content, text="PRO专属功能", font=ctk.CTkFont(size=20, weight="bold"), text_color=text_primary).pack(pady=(0, 8))
-        ctk.CTkLabel(unlock_content, text="请联系管理员获取兑换码", font=ctk.CTkFont(size=12), text_color=text_muted).pack(pady=(0, 20))
+        ctk.CTkLabel(unlock_content, text="PRO专属功能", font=self._font(20, "bold", family=None), text_color=text_primary).pack(pady=(0, 8))
+        ctk.CTkLabel(unlock_content, text="请联系管理员获取兑换码", font=self._font(12, family=None), text_color=text_muted).pack(pady=(0, 20))
         ctk.CTkButton(unlock_content, text="前往配置", width=140, height=42, corner_radius=10, fg_color=accent, hover_color=accent_hover, command=lambda: self._goto_config_in_toolbox()).pack()
 
         # ============ 主功能内容 ============
@@ -2088,7 +2387,7 @@ class MainApp(ctk.CTk):
 
         self.video_url_entry = ctk.CTkEntry(
             input_inner, placeholder_text="粘贴视频链接 (腾讯/爱奇艺/优酷/B站/芒果TV/M3U8)",
-            height=48, corner_radius=10, font=ctk.CTkFont(size=13),
+            height=48, corner_radius=10, font=self._font(13, family=None),
             fg_color=bg_tertiary, border_color=border_color, text_color=text_primary,
             placeholder_text_color=text_muted, border_width=1
         )
@@ -2098,7 +2397,7 @@ class MainApp(ctk.CTk):
 
         self.parse_btn = ctk.CTkButton(
             input_inner, text="解析播放", width=120, height=48, corner_radius=10,
-            font=ctk.CTkFont(size=14, weight="bold"), fg_color=accent, hover_color=accent_hover,
+            font=self._font(14, "bold", family=None), fg_color=accent, hover_color=accent_hover,
             command=self._parse_and_play
         )
         self.parse_btn.pack(side="right")
@@ -2119,7 +2418,7 @@ class MainApp(ctk.CTk):
 
         self.cover_placeholder = ctk.CTkLabel(
             self.cover_container, text="等待解析...",
-            font=ctk.CTkFont(size=13), text_color=text_muted
+            font=self._font(13, family=None), text_color=text_muted
         )
         self.cover_placeholder.place(relx=0.5, rely=0.5, anchor="center")
 
@@ -2134,13 +2433,13 @@ class MainApp(ctk.CTk):
 
         self.video_title = ctk.CTkLabel(
             title_row, text="粘贴链接开始解析",
-            font=ctk.CTkFont(size=18, weight="bold"), text_color=text_primary,
+            font=self._font(18, "bold", family=None), text_color=text_primary,
             anchor="w", wraplength=450
         )
         self.video_title.pack(side="left", fill="x", expand=True)
 
         self.vip_tag = ctk.CTkLabel(
-            title_row, text="VIP", font=ctk.CTkFont(size=10, weight="bold"),
+            title_row, text="VIP", font=self._font(10, "bold", family=None),
             fg_color=self.colors["warning"], text_color="#000", corner_radius=4, width=40, height=20
         )
         self.vip_tag.pack(side="right", padx=(8, 0))
@@ -2151,21 +2450,21 @@ class MainApp(ctk.CTk):
         meta_row.pack(fill="x", pady=(0, 16))
 
         self.platform_tag = ctk.CTkLabel(
-            meta_row, text="", font=ctk.CTkFont(size=11),
+            meta_row, text="", font=self._font(11, family=None),
             fg_color=accent, text_color="#fff", corner_radius=4, height=22
         )
         self.platform_tag.pack(side="left")
         self.platform_tag.pack_forget()
 
         self.duration_label = ctk.CTkLabel(
-            meta_row, text="", font=ctk.CTkFont(size=11), text_color=text_muted
+            meta_row, text="", font=self._font(11, family=None), text_color=text_muted
         )
         self.duration_label.pack(side="left", padx=(12, 0))
 
         # 描述
         self.desc_label = ctk.CTkLabel(
             info_right, text="支持平台: 腾讯视频 / 爱奇艺 / 优酷 / 哔哩哔哩 / 芒果TV / M3U8直链",
-            font=ctk.CTkFont(size=12), text_color=text_muted, anchor="w", wraplength=450, justify="left"
+            font=self._font(12, family=None), text_color=text_muted, anchor="w", wraplength=450, justify="left"
         )
         self.desc_label.pack(fill="x", pady=(0, 16))
 
@@ -2173,8 +2472,8 @@ class MainApp(ctk.CTk):
         ep_frame = ctk.CTkFrame(info_right, fg_color="transparent")
         ep_frame.pack(fill="x", pady=(0, 12))
 
-        ctk.CTkLabel(ep_frame, text="选集", font=ctk.CTkFont(size=12, weight="bold"), text_color=text_secondary).pack(side="left")
-        self.ep_count_label = ctk.CTkLabel(ep_frame, text="", font=ctk.CTkFont(size=11), text_color=text_muted)
+        ctk.CTkLabel(ep_frame, text="选集", font=self._font(12, "bold", family=None), text_color=text_secondary).pack(side="left")
+        self.ep_count_label = ctk.CTkLabel(ep_frame, text="", font=self._font(11, family=None), text_color=text_muted)
         self.ep_count_label.pack(side="left", padx=(8, 0))
 
         # 剧集按钮滚动区
@@ -2194,20 +2493,20 @@ class MainApp(ctk.CTk):
         self.prev_ep_btn = ctk.CTkButton(
             action_bar, text="◀ 上一集", width=90, height=36, corner_radius=8,
             fg_color=bg_tertiary, hover_color=border_color, text_color=text_primary,
-            font=ctk.CTkFont(size=11), command=self._prev_ep, state="disabled"
+            font=self._font(11, family=None), command=self._prev_ep, state="disabled"
         )
         self.prev_ep_btn.pack(side="left", padx=(0, 8))
 
         self.next_ep_btn = ctk.CTkButton(
             action_bar, text="下一集 ▶", width=90, height=36, corner_radius=8,
             fg_color=accent, hover_color=accent_hover,
-            font=ctk.CTkFont(size=11, weight="bold"), command=self._next_ep, state="disabled"
+            font=self._font(11, "bold", family=None), command=self._next_ep, state="disabled"
         )
         self.next_ep_btn.pack(side="left")
 
         # 状态
         self.status_label = ctk.CTkLabel(
-            action_bar, text="就绪", font=ctk.CTkFont(size=11), text_color=text_muted
+            action_bar, text="就绪", font=self._font(11, family=None), text_color=text_muted
         )
         self.status_label.pack(side="right")
 
@@ -2586,6 +2885,8 @@ class MainApp(ctk.CTk):
 
         # 自动打开播放
         parse_url = f"{self._parse_api}{url}"
+        import webbrowser
+
         try:
             webbrowser.open(parse_url)
         except Exception as e:
@@ -2599,6 +2900,8 @@ class MainApp(ctk.CTk):
 
         # 即使获取信息失败，也尝试播放
         parse_url = f"{self._parse_api}{url}"
+        import webbrowser
+
         try:
             webbrowser.open(parse_url)
             self.video_title.configure(text="正在播放...")
@@ -2673,7 +2976,7 @@ class MainApp(ctk.CTk):
                 corner_radius=6,
                 fg_color=accent if is_current else bg_tertiary,
                 hover_color=self.colors["primary_hover"] if is_current else self.colors["border"],
-                font=ctk.CTkFont(size=12, weight="bold" if is_current else "normal"),
+                font=self._font(12, "bold" if is_current else "normal", family=None),
                 command=lambda idx=i: self._select_episode(idx)
             )
             btn.pack(side="left", padx=3, pady=6)
@@ -2696,7 +2999,7 @@ class MainApp(ctk.CTk):
             is_current = (i == index)
             btn.configure(
                 fg_color=accent if is_current else bg_tertiary,
-                font=ctk.CTkFont(size=12, weight="bold" if is_current else "normal")
+                font=self._font(12, "bold" if is_current else "normal", family=None)
             )
 
         self._current_ep_index = index
@@ -2715,6 +3018,8 @@ class MainApp(ctk.CTk):
 
         if ep_url:
             parse_url = f"{self._parse_api}{ep_url}"
+            import webbrowser
+
             try:
                 webbrowser.open(parse_url)
             except Exception as e:
@@ -2730,6 +3035,35 @@ class MainApp(ctk.CTk):
         if self._current_ep_index < len(self.episodes_data) - 1:
             self._select_episode(self._current_ep_index + 1)
 
+    def _queue_status(self, text: str):
+        """后台线程更新状态栏文字：只保留最新文字，最多每 50ms 刷新一次"""
+        with self._log_lock:
+            self._status_text = text
+            if self._status_pending:
+                return
+            self._status_pending = True
+        after_id = self.after(50, self._flush_status)
+        with self._log_lock:
+            self._status_after = after_id
+
+    def _flush_status(self):
+        """将最新的状态文字写入状态栏"""
+        with self._log_lock:
+            if not self._status_pending:
+                return
+            text = self._status_text
+            self._status_pending = False
+            self._status_after = None
+        self._set_status(text)
+
+    def _cancel_status(self):
+        """丢弃尚未刷新的后台状态文字，任务结束时调用，避免覆盖最终状态"""
+        with self._log_lock:
+            self._status_pending = False
+            after_id, self._status_after = self._status_after, None
+        if after_id is not None:
+            self.after_cancel(after_id)
+
     def _set_status(self, text: str, status_type: str = "info"):
         """设置状态"""
         colors = {
@@ -2740,6 +3074,11 @@ class MainApp(ctk.CTk):
         }
         self.status_label.configure(text=text, text_color=colors.get(status_type, colors["info"]))
 
+        # 状态栏指示灯同步颜色
+        if hasattr(self, "status_dot"):
+            dot_color = self.colors["primary"] if status_type == "info" else colors.get(status_type, colors["info"])
+            self.status_dot.configure(fg_color=dot_color)
+
 
     def _check_video_parser_access(self):
         """检查视频解析功能访问权限"""
@@ -2777,14 +3116,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             header,
             text="系统配置",
-            font=ctk.CTkFont(size=18, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(18, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(side="left")
 
         self.config_status_label = ctk.CTkLabel(
             header,
             text="未解锁",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=self.colors["error"],
         )
         self.config_status_label.pack(side="left", padx=16)
@@ -2813,7 +3152,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             unlock_content,
             text="需要管理员密码",
-            font=ctk.CTkFont(size=16, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(16, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(pady=(0, 16))
 
@@ -2827,7 +3166,7 @@ class MainApp(ctk.CTk):
             height=36,
             corner_radius=8,
             placeholder_text="输入密码",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
@@ -2839,7 +3178,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             pwd_frame,
             text="解锁",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=80,
             height=36,
             corner_radius=8,
@@ -2872,14 +3211,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             lang_card,
             text="添加编程语言",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=16, pady=(16, 12))
 
         ctk.CTkLabel(
             lang_card,
             text="语言名称",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=1, column=0, sticky="w", padx=16, pady=8)
 
@@ -2888,7 +3227,7 @@ class MainApp(ctk.CTk):
             placeholder_text="如: Kotlin",
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
@@ -2899,7 +3238,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             lang_card,
             text="添加",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=80,
             height=36,
             corner_radius=8,
@@ -2920,14 +3259,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             cat_card,
             text="添加框架类别",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=16, pady=(16, 12))
 
         ctk.CTkLabel(
             cat_card,
             text="选择语言",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=1, column=0, sticky="w", padx=16, pady=8)
 
@@ -2939,7 +3278,7 @@ class MainApp(ctk.CTk):
             width=150,
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             button_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
             button_hover_color=self.colors["primary"],
@@ -2951,7 +3290,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             cat_card,
             text="类别名称",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=2, column=0, sticky="w", padx=16, pady=8)
 
@@ -2960,7 +3299,7 @@ class MainApp(ctk.CTk):
             placeholder_text="如: 游戏开发",
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
@@ -2971,7 +3310,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             cat_card,
             text="添加",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=80,
             height=36,
             corner_radius=8,
@@ -2992,14 +3331,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             fw_card,
             text="添加具体框架",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=16, pady=(16, 12))
 
         ctk.CTkLabel(
             fw_card,
             text="选择语言",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=1, column=0, sticky="w", padx=16, pady=8)
 
@@ -3012,7 +3351,7 @@ class MainApp(ctk.CTk):
             width=150,
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             button_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
             button_hover_color=self.colors["primary"],
@@ -3024,7 +3363,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             fw_card,
             text="选择类别",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=2, column=0, sticky="w", padx=16, pady=8)
 
@@ -3036,7 +3375,7 @@ class MainApp(ctk.CTk):
             width=150,
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             button_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
             button_hover_color=self.colors["primary"],
@@ -3048,7 +3387,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             fw_card,
             text="框架名称",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=3, column=0, sticky="w", padx=16, pady=8)
 
@@ -3057,7 +3396,7 @@ class MainApp(ctk.CTk):
             placeholder_text="如: Pygame",
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
@@ -3068,7 +3407,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             fw_card,
             text="添加",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=80,
             height=36,
             corner_radius=8,
@@ -3089,18 +3428,18 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             web_card,
             text="添加AI网站",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=16, pady=(16, 12))
 
-        websites = DataManager.get_all_ai_websites()
-        website_names = ", ".join(list(websites.keys())[:5])
+        websites = self._ai_websites()
+        website_names = ", ".join(islice(websites, 5))
         if len(websites) > 5:
             website_names += "..."
         self.current_websites_label = ctk.CTkLabel(
             web_card,
             text=f"已有: {website_names}",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         )
         self.current_websites_label.grid(row=1, column=0, columnspan=3, sticky="w", padx=16, pady=(0, 8))
@@ -3108,7 +3447,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             web_card,
             text="网站名称",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=2, column=0, sticky="w", padx=16, pady=8)
 
@@ -3118,7 +3457,7 @@ class MainApp(ctk.CTk):
             width=120,
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
@@ -3129,7 +3468,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             web_card,
             text="网站URL",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).grid(row=3, column=0, sticky="w", padx=16, pady=8)
 
@@ -3138,7 +3477,7 @@ class MainApp(ctk.CTk):
             placeholder_text="https://...",
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
@@ -3149,7 +3488,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             web_card,
             text="添加",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=80,
             height=36,
             corner_radius=8,
@@ -3170,7 +3509,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             code_card,
             text="兑换码管理",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=16, pady=(16, 12))
 
@@ -3181,7 +3520,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             type_frame,
             text="套餐类型:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).pack(side="left")
 
@@ -3189,13 +3528,13 @@ class MainApp(ctk.CTk):
         ctk.CTkRadioButton(
             type_frame, text="基础版",
             variable=self.code_package_var, value="basic",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             fg_color=self.colors["primary"]
         ).pack(side="left", padx=(12, 8))
         ctk.CTkRadioButton(
             type_frame, text="专业版",
             variable=self.code_package_var, value="pro",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             fg_color=self.colors["primary"]
         ).pack(side="left", padx=8)
 
@@ -3206,7 +3545,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             expire_frame,
             text="有效期:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).pack(side="left")
 
@@ -3218,7 +3557,7 @@ class MainApp(ctk.CTk):
             width=45,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             justify="center"
@@ -3226,7 +3565,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             expire_frame,
             text="天",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).pack(side="left", padx=(0, 6))
 
@@ -3238,7 +3577,7 @@ class MainApp(ctk.CTk):
             width=40,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             justify="center"
@@ -3246,7 +3585,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             expire_frame,
             text="时",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).pack(side="left", padx=(0, 6))
 
@@ -3258,7 +3597,7 @@ class MainApp(ctk.CTk):
             width=40,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             justify="center"
@@ -3266,7 +3605,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             expire_frame,
             text="分",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).pack(side="left", padx=(0, 6))
 
@@ -3278,7 +3617,7 @@ class MainApp(ctk.CTk):
             width=40,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             border_color=(self.colors["border"], self.colors["border_dark"]),
             justify="center"
@@ -3286,7 +3625,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             expire_frame,
             text="秒",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).pack(side="left", padx=(0, 12))
 
@@ -3296,7 +3635,7 @@ class MainApp(ctk.CTk):
             expire_frame,
             text="永久有效",
             variable=self.expire_permanent_var,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"]),
             fg_color=self.colors["primary"],
             hover_color=self.colors["primary_hover"],
@@ -3312,7 +3651,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             gen_frame,
             text="数量:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).pack(side="left")
 
@@ -3324,7 +3663,7 @@ class MainApp(ctk.CTk):
             width=70,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             button_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
             button_hover_color=self.colors["primary"],
@@ -3335,7 +3674,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             gen_frame,
             text="生成兑换码",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             width=100,
             height=32,
             corner_radius=8,
@@ -3348,7 +3687,7 @@ class MainApp(ctk.CTk):
         self.code_result_label = ctk.CTkLabel(
             code_card,
             text="",
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=self._font(10, family="Consolas"),
             text_color=self.colors["success"],
             justify="left",
             anchor="w"
@@ -3362,14 +3701,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             list_header,
             text="已生成的兑换码:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            font=self._font(11),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"])
         ).pack(side="left")
 
         ctk.CTkButton(
             list_header,
             text="删除选中",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             width=70,
             height=26,
             corner_radius=6,
@@ -3381,7 +3720,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             list_header,
             text="刷新列表",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            font=self._font(10),
             width=70,
             height=26,
             corner_radius=6,
@@ -3397,7 +3736,7 @@ class MainApp(ctk.CTk):
         self.codes_listbox = ctk.CTkTextbox(
             code_card,
             height=100,
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=self._font(10, family="Consolas"),
             fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
             corner_radius=8
         )
@@ -3414,14 +3753,14 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             monitor_frame,
             text="⏱ 实时监控",
-            font=ctk.CTkFont(size=11, weight="bold", family="Microsoft YaHei UI"),
+            font=self._font(11, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         ).pack(anchor="w", padx=12, pady=(8, 4))
 
         self.monitor_label = ctk.CTkLabel(
             monitor_frame,
             text="加载中...",
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=self._font(10, family="Consolas"),
             text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"]),
             justify="left",
             anchor="w"
@@ -3435,7 +3774,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="刷新配置",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=100,
             height=36,
             corner_radius=8,
@@ -3450,7 +3789,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="锁定配置",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=100,
             height=36,
             corner_radius=8,
@@ -3465,7 +3804,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="重置授权",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=100,
             height=36,
             corner_radius=8,
@@ -3484,51 +3823,111 @@ class MainApp(ctk.CTk):
 
     def _refresh_templates(self):
         """刷新模板列表"""
-        # 清空
-        for widget in self.templates_scroll_frame.winfo_children():
-            widget.destroy()
-
+        self._templates_loaded = True
+        self._template_render_token += 1
         templates = DataManager.get_all_templates()
+        pool = self._template_card_pool
 
         # 更新徽章数量
         if hasattr(self, 'template_count_badge'):
             self.template_count_badge.configure(text=f"{len(templates)} 个模板")
 
         if not templates:
+            for item in pool:
+                item["frame"].grid_remove()
+            if self._template_more_btn is not None:
+                self._template_more_btn.grid_remove()
+
             # 空状态提示
-            empty_frame = ctk.CTkFrame(self.templates_scroll_frame, fg_color="transparent")
-            empty_frame.grid(row=0, column=0, sticky="nsew", pady=60)
+            if self._template_empty_frame is None:
+                empty_frame = ctk.CTkFrame(self.templates_scroll_frame, fg_color="transparent")
+                empty_frame.grid(row=0, column=0, sticky="nsew", pady=60)
 
-            ctk.CTkLabel(
-                empty_frame,
-                text="📭",
-                font=ctk.CTkFont(size=48)
-            ).pack()
+                ctk.CTkLabel(
+                    empty_frame,
+                    text="📭",
+                    font=self._font(48, family=None)
+                ).pack()
 
-            ctk.CTkLabel(
-                empty_frame,
-                text="暂无模板",
-                font=ctk.CTkFont(size=16, weight="bold", family="Microsoft YaHei UI"),
-                text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
-            ).pack(pady=(12, 4))
+                ctk.CTkLabel(
+                    empty_frame,
+                    text="暂无模板",
+                    font=self._font(16, "bold"),
+                    text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
+                ).pack(pady=(12, 4))
 
-            ctk.CTkLabel(
-                empty_frame,
-                text="点击右上角添加你的第一个模板",
-                font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
-                text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
-            ).pack()
+                ctk.CTkLabel(
+                    empty_frame,
+                    text="点击右上角添加你的第一个模板",
+                    font=self._font(12),
+                    text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
+                ).pack()
+                self._template_empty_frame = empty_frame
+            else:
+                self._template_empty_frame.grid()
+            return
+
+        if self._template_empty_frame is not None:
+            self._template_empty_frame.grid_remove()
+
+        # 只显示前 _template_visible_limit 个模板，其余的由“显示更多”按需显示
+        items = list(templates.items())
+        shown = items[:self._template_visible_limit]
+
+        # 多余的卡片隐藏而不销毁
+        for item in pool[len(shown):]:
+            item["frame"].grid_remove()
+
+        if len(items) > len(shown):
+            if self._template_more_btn is None:
+                self._template_more_btn = ctk.CTkButton(
+                    self.templates_scroll_frame,
+                    text="",
+                    font=self._font(12),
+                    fg_color="transparent",
+                    hover_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
+                    text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
+                    command=self._show_more_templates,
+                )
+            self._template_more_btn.configure(text=f"显示更多（还有 {len(items) - len(shown)} 个）")
+            self._template_more_btn.grid(row=len(shown), column=0, pady=8)
+        elif self._template_more_btn is not None:
+            self._template_more_btn.grid_remove()
+
+        # 分批填充，批次之间让出事件循环处理输入
+        self._fill_template_cards_batch(shown, 0, self._template_render_token)
+
+    def _show_more_templates(self):
+        """多显示一页模板卡片，已创建的卡片会被复用"""
+        self._template_visible_limit += _TEMPLATE_PAGE_SIZE
+        self._refresh_templates()
+
+    def _fill_template_cards_batch(self, items: list, start: int, token: int):
+        """填充一批模板卡片（池中卡片不足时补建），剩余的在空闲时继续
+
+        token 与最新一次刷新不一致时说明列表已被重新刷新，放弃剩余批次。
+        """
+        if token != self._template_render_token:
             return
 
-        for i, (name, template) in enumerate(templates.items()):
-            self._create_template_card(self.templates_scroll_frame, name, template, i)
+        pool = self._template_card_pool
+        end = min(start + _CARD_BATCH_SIZE, len(items))
+        for i in range(start, end):
+            if i == len(pool):
+                pool.append(self._create_template_card(i))
+            name, template = items[i]
+            self._fill_template_card(pool[i], name, template)
 
-    def _create_template_card(self, parent, name: str, template: dict, row: int):
-        """创建模板卡片 - UI-UX-PRO-MAX 高级风格"""
-        is_custom = name not in DEFAULT_TEMPLATES
+        if end < len(items):
+            self.after_idle(self._fill_template_cards_batch, items, end, token)
 
+    def _create_template_card(self, row: int) -> dict:
+        """创建模板卡片 - UI-UX-PRO-MAX 高级风格
+
+        只搭建控件骨架，内容由 _fill_template_card 填充。
+        """
         card = ctk.CTkFrame(
-            parent,
+            self.templates_scroll_frame,
             fg_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
             corner_radius=10,
             border_width=1,
@@ -3548,12 +3947,12 @@ class MainApp(ctk.CTk):
         icon_frame.grid(row=0, column=0, sticky="w", padx=16, pady=16)
         icon_frame.grid_propagate(False)
 
-        icon = "📝" if is_custom else "📁"
-        ctk.CTkLabel(
+        icon_label = ctk.CTkLabel(
             icon_frame,
-            text=icon,
-            font=ctk.CTkFont(size=22)
-        ).place(relx=0.5, rely=0.5, anchor="center")
+            text="",
+            font=self._font(22, family=None)
+        )
+        icon_label.place(relx=0.5, rely=0.5, anchor="center")
 
         # 中间信息区
         info_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -3563,20 +3962,20 @@ class MainApp(ctk.CTk):
         title_row = ctk.CTkFrame(info_frame, fg_color="transparent")
         title_row.pack(fill="x")
 
-        ctk.CTkLabel(
+        title_label = ctk.CTkLabel(
             title_row,
-            text=name,
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            text="",
+            font=self._font(14, "bold"),
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
-        ).pack(side="left")
+        )
+        title_label.pack(side="left")
 
         # 类型标签
         type_badge = ctk.CTkLabel(
             title_row,
-            text="自定义" if is_custom else "内置",
-            font=ctk.CTkFont(size=9, family="Microsoft YaHei UI"),
+            text="",
+            font=self._font(9),
             text_color="white",
-            fg_color=self.colors["accent"] if is_custom else self.colors["primary"],
             corner_radius=4,
             padx=6,
             pady=1
@@ -3584,73 +3983,114 @@ class MainApp(ctk.CTk):
         type_badge.pack(side="left", padx=(8, 0))
 
         # 描述
-        ctk.CTkLabel(
+        desc_label = ctk.CTkLabel(
             info_frame,
-            text=template.get("description", "自定义模板"),
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            text="",
+            font=self._font(11),
             text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
             anchor="w"
-        ).pack(fill="x", pady=(4, 0))
-
-        # 语言和框架标签
-        lang = template.get("language", "")
-        fw = template.get("framework", "")
-        if lang or fw:
-            tag_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-            tag_frame.pack(fill="x", pady=(6, 0))
-
-            if lang:
-                ctk.CTkLabel(
-                    tag_frame,
-                    text=lang,
-                    font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
-                    text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"]),
-                    fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-                    corner_radius=4,
-                    padx=8,
-                    pady=2
-                ).pack(side="left", padx=(0, 6))
+        )
+        desc_label.pack(fill="x", pady=(4, 0))
 
-            if fw:
-                ctk.CTkLabel(
-                    tag_frame,
-                    text=fw,
-                    font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
-                    text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"]),
-                    fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-                    corner_radius=4,
-                    padx=8,
-                    pady=2
-                ).pack(side="left")
+        # 语言和框架标签（有内容时才显示）
+        tag_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+        tag_style = dict(
+            text="",
+            font=self._font(10),
+            text_color=(self.colors["text_secondary"], self.colors["text_secondary_dark"]),
+            fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
+            corner_radius=4,
+            padx=8,
+            pady=2
+        )
+        lang_label = ctk.CTkLabel(tag_frame, **tag_style)
+        fw_label = ctk.CTkLabel(tag_frame, **tag_style)
 
         # 右侧按钮区
         btn_frame = ctk.CTkFrame(card, fg_color="transparent")
         btn_frame.grid(row=0, column=2, sticky="e", padx=16, pady=16)
 
-        ctk.CTkButton(
+        use_btn = ctk.CTkButton(
             btn_frame,
             text="使用模板",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=85,
             height=34,
             corner_radius=8,
             fg_color=self.colors["primary"],
             hover_color=self.colors["primary_hover"],
-            command=lambda n=name, t=template: self._use_template(n, t),
-        ).pack(side="left", padx=(0, 8))
+        )
+        use_btn.pack(side="left", padx=(0, 8))
+
+        # 删除按钮（仅自定义模板显示）
+        delete_btn = ctk.CTkButton(
+            btn_frame,
+            text="删除",
+            font=self._font(12),
+            width=60,
+            height=34,
+            corner_radius=8,
+            fg_color=self.colors["error"],
+            hover_color="#DC2626",
+        )
+
+        return {
+            "frame": card,
+            "icon_label": icon_label,
+            "title_label": title_label,
+            "type_badge": type_badge,
+            "desc_label": desc_label,
+            "tag_frame": tag_frame,
+            "lang_label": lang_label,
+            "fw_label": fw_label,
+            "tags": (False, False),  # 当前显示的 (语言, 框架) 标签
+            "use_btn": use_btn,
+            "delete_btn": delete_btn,
+        }
+
+    def _fill_template_card(self, item: dict, name: str, template: dict):
+        """将一个模板写入池中的卡片"""
+        is_custom = name not in _DEFAULT_TEMPLATE_NAMES
+
+        item["icon_label"].configure(text="📝" if is_custom else "📁")
+        item["title_label"].configure(text=name)
+        item["type_badge"].configure(
+            text="自定义" if is_custom else "内置",
+            fg_color=self.colors["accent"] if is_custom else self.colors["primary"],
+        )
+        item["desc_label"].configure(text=template.get("description", "自定义模板"))
 
+        # 语言和框架标签：显示的组合变化时才重新排布
+        lang = template.get("language", "")
+        fw = template.get("framework", "")
+        lang_label, fw_label = item["lang_label"], item["fw_label"]
+        if lang:
+            lang_label.configure(text=lang)
+        if fw:
+            fw_label.configure(text=fw)
+        tags = (bool(lang), bool(fw))
+        if tags != item["tags"]:
+            item["tags"] = tags
+            lang_label.pack_forget()
+            fw_label.pack_forget()
+            if lang:
+                lang_label.pack(side="left", padx=(0, 6))
+            if fw:
+                fw_label.pack(side="left")
+            if lang or fw:
+                item["tag_frame"].pack(fill="x", pady=(6, 0))
+            else:
+                item["tag_frame"].pack_forget()
+
+        item["use_btn"].configure(command=lambda n=name, t=template: self._use_template(n, t))
+        delete_btn = item["delete_btn"]
         if is_custom:
-            ctk.CTkButton(
-                btn_frame,
-                text="删除",
-                font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
-                width=60,
-                height=34,
-                corner_radius=8,
-                fg_color=self.colors["error"],
-                hover_color="#DC2626",
-                command=lambda n=name: self._delete_template(n),
-            ).pack(side="left")
+            delete_btn.configure(command=lambda n=name: self._delete_template(n))
+            if not delete_btn.winfo_manager():
+                delete_btn.pack(side="left")
+        elif delete_btn.winfo_manager():
+            delete_btn.pack_forget()
+        item["frame"].grid()
 
     def _add_template_dialog(self):
         """添加模板对话框"""
@@ -3672,7 +4112,7 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             dialog,
             text=f"确定要删除模板 \"{name}\" 吗？",
-            font=ctk.CTkFont(size=14),
+            font=self._font(14, family=None),
         ).pack(pady=30)
 
         btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
@@ -3690,7 +4130,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="确定",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=80,
             height=34,
             corner_radius=8,
@@ -3701,7 +4141,7 @@ class MainApp(ctk.CTk):
         ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            font=self._font(12),
             width=80,
             height=34,
             corner_radius=8,
@@ -3718,13 +4158,13 @@ class MainApp(ctk.CTk):
     def _unlock_config(self):
         """解锁配置界面"""
         password = self.config_pwd_entry.get()
-        if password == ADMIN_PASSWORD:
+        if _check_admin_password(password):
             self._config_unlocked = True
             self.config_status_label.configure(text="🔓 已解锁", text_color="green")
             self.unlock_frame.grid_forget()
             self.config_scroll.grid(row=0, column=0, sticky="nsew")
             self.config_pwd_entry.delete(0, "end")
-            self.status_label.configure(text="✅ 配置已解锁")
+            self._set_status("✅ 配置已解锁")
         else:
             self._show_message("错误", "密码错误！")
             self.config_pwd_entry.delete(0, "end")
@@ -3735,7 +4175,7 @@ class MainApp(ctk.CTk):
         self.config_status_label.configure(text="🔒 未解锁", text_color="red")
         self.config_scroll.grid_forget()
         self.unlock_frame.grid(row=0, column=0, sticky="nsew")
-        self.status_label.configure(text="🔒 配置已锁定")
+        self._set_status("🔒 配置已锁定")
 
     def _generate_codes(self):
         """生成兑换码"""
@@ -3822,7 +4262,7 @@ class MainApp(ctk.CTk):
     def _reset_license(self):
         """重置授权（测试用）"""
         self.code_manager.reset_license()
-        self.status_label.configure(text="✅ 授权已重置，重启应用后生效")
+        self._set_status("✅ 授权已重置，重启应用后生效")
 
     def _toggle_expire_inputs(self):
         """切换有效期输入框状态"""
@@ -4023,7 +4463,7 @@ class MainApp(ctk.CTk):
             return
 
         # 确保URL以http开头
-        if not url.startswith("http://") and not url.startswith("https://"):
+        if not url.startswith(("http://", "https://")):
             url = "https://" + url
 
         if DataManager.add_ai_website(name, url):
@@ -4053,28 +4493,58 @@ class MainApp(ctk.CTk):
         else:
             self._show_message("错误", "删除失败，可能是预置网站")
 
+    def _ai_websites(self) -> dict:
+        """获取AI网站（按数据版本号和文件修改时间缓存，增删或外部修改后自动失效）"""
+        try:
+            mtime = AI_WEBSITES_FILE.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        key = (DataManager._ai_websites_version, mtime)
+        cached = self._ai_websites_cache
+        if cached is None or cached[0] != key:
+            cached = (key, DataManager.get_all_ai_websites())
+            self._ai_websites_cache = cached
+        return cached[1]
+
+    @staticmethod
+    def _set_menu_values(menu, values: list) -> bool:
+        """更新下拉菜单选项，内容未变化时跳过重配置"""
+        if list(menu.cget("values") or ()) == values:
+            return False
+        menu.configure(values=values)
+        return True
+
     def _refresh_website_options(self):
         """刷新网站配置选项"""
-        websites = DataManager.get_all_ai_websites()
+        websites = self._ai_websites()
+        # 单次遍历同时收集显示名称和自定义网站
+        shown_names = []
+        custom_websites = []
+        for name, info in websites.items():
+            if len(shown_names) < 6:
+                shown_names.append(name)
+            if not info.get("is_preset", True):
+                custom_websites.append(name)
+
         # 更新已有网站显示
-        website_names = ", ".join(list(websites.keys())[:6])
+        website_names = ", ".join(shown_names)
         if len(websites) > 6:
             website_names += "..."
         self.current_websites_label.configure(text=website_names)
-        # 更新删除下拉菜单
-        custom_websites = [name for name, info in websites.items() if not info.get("is_preset", True)]
-        self.del_website_menu.configure(values=custom_websites if custom_websites else ["(无自定义网站)"])
-        if custom_websites:
-            self.del_website_var.set(custom_websites[0])
-        else:
-            self.del_website_var.set("(无自定义网站)")
+
+        # 更新删除下拉菜单（仅在已构建时）
+        del_menu = getattr(self, "del_website_menu", None)
+        if del_menu is None:
+            return
+        self._set_menu_values(del_menu, custom_websites or ["(无自定义网站)"])
+        self.del_website_var.set(custom_websites[0] if custom_websites else "(无自定义网站)")
 
     def _refresh_config_options(self):
         """刷新配置选项"""
         all_langs = list(DataManager.get_all_languages().keys())
         self.cat_lang_menu.configure(values=all_langs)
         self.fw_lang_menu.configure(values=all_langs)
-        self.status_label.configure(text="✅ 配置已刷新")
+        self._set_status("✅ 配置已刷新")
 
     def _refresh_language_options(self):
         """刷新语言选项（主界面）"""
@@ -4092,6 +4562,76 @@ class MainApp(ctk.CTk):
 
     # _build_packager_tab removed - using new _build_packager_content()
 
+    # ----------------------------------------------------------
+    #                     打包页控件工厂
+    # ----------------------------------------------------------
+
+    def _mk_label(self, parent, text: str, size: int = 11, weight: str = None, **overrides):
+        """创建打包页统一样式的标签"""
+        kwargs = {
+            "text": text,
+            "font": self._font(size, weight),
+            "text_color": self.theme.text,
+        }
+        kwargs.update(overrides)
+        return ctk.CTkLabel(parent, **kwargs)
+
+    def _mk_entry(self, parent, **overrides):
+        """创建打包页统一样式的输入框"""
+        kwargs = {
+            "height": 36,
+            "corner_radius": 8,
+            "font": self._font(11),
+            "fg_color": self.theme.bg_elevated,
+            "border_color": self.theme.border,
+            "text_color": self.theme.text_primary,
+            "placeholder_text_color": self.theme.text_muted,
+        }
+        kwargs.update(overrides)
+        return ctk.CTkEntry(parent, **kwargs)
+
+    def _mk_button_primary(self, parent, text: str, cmd, **overrides):
+        """创建打包页主色按钮"""
+        kwargs = {
+            "text": text,
+            "height": 36,
+            "corner_radius": 8,
+            "fg_color": self.theme.primary,
+            "hover_color": self.theme.primary_dark,
+            "font": self._font(11),
+            "command": cmd,
+        }
+        kwargs.update(overrides)
+        return ctk.CTkButton(parent, **kwargs)
+
+    def _mk_button_outline(self, parent, text: str, cmd, **overrides):
+        """创建打包页描边按钮"""
+        kwargs = {
+            "text": text,
+            "height": 36,
+            "corner_radius": 8,
+            "fg_color": self.theme.bg,
+            "hover_color": self.theme.border_soft,
+            "text_color": self.theme.text,
+            "border_width": 1,
+            "border_color": self.theme.border_soft,
+            "font": self._font(11),
+            "command": cmd,
+        }
+        kwargs.update(overrides)
+        return ctk.CTkButton(parent, **kwargs)
+
+    def _mk_card(self, parent, **overrides):
+        """创建打包页卡片容器"""
+        kwargs = {
+            "fg_color": self.theme.surface,
+            "corner_radius": 12,
+            "border_width": 1,
+            "border_color": self.theme.border_soft,
+        }
+        kwargs.update(overrides)
+        return ctk.CTkFrame(parent, **kwargs)
+
     def _build_beginner_mode(self):
         """构建零基础用户模式界面 - 优化版"""
         self.beginner_frame = ctk.CTkFrame(self.packager_container, fg_color="transparent")
@@ -4099,275 +4639,152 @@ class MainApp(ctk.CTk):
         self.beginner_frame.grid_rowconfigure(3, weight=1)
 
         # ===== 第一部分：环境检测卡片 =====
-        env_card = ctk.CTkFrame(
-            self.beginner_frame,
-            fg_color=(self.colors["surface_light"], self.colors["surface_dark"]),
-            corner_radius=12,
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"])
-        )
+        env_card = self._mk_card(self.beginner_frame)
         env_card.grid(row=0, column=0, sticky="ew", padx=0, pady=(0, 12))
         env_card.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(
-            env_card,
-            text="环境检测",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=12, pady=(12, 10))
+        self._mk_label(env_card, "环境检测", size=14, weight="bold").grid(
+            row=0, column=0, columnspan=3, sticky="w", padx=12, pady=(12, 10)
+        )
 
         # Python 状态
-        ctk.CTkLabel(
-            env_card,
-            text="Python 环境:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=1, column=0, sticky="w", padx=12, pady=8)
+        self._mk_label(env_card, "Python 环境:").grid(row=1, column=0, sticky="w", padx=12, pady=8)
 
-        self.python_status_label = ctk.CTkLabel(
-            env_card,
-            text="检测中...",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"])
-        )
+        self.python_status_label = self._mk_label(env_card, "检测中...", text_color=self.theme.text_subtle)
         self.python_status_label.grid(row=1, column=1, sticky="w", padx=8, pady=8)
 
         # 重新检测按钮
-        ctk.CTkButton(
-            env_card,
-            text="🔄 重新检测",
-            width=110,
-            height=36,
-            corner_radius=8,
-            fg_color=(self.colors["primary"], self.colors["primary"]),
-            hover_color=(self.colors["primary_dark"], self.colors["primary_dark"]),
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            command=self._check_environment,
-        ).grid(row=1, column=2, padx=12, pady=8)
+        self._mk_button_primary(env_card, "🔄 重新检测", self._check_environment, width=110).grid(
+            row=1, column=2, padx=12, pady=8
+        )
 
         # PyInstaller 状态
-        ctk.CTkLabel(
-            env_card,
-            text="PyInstaller:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=2, column=0, sticky="w", padx=12, pady=8)
+        self._mk_label(env_card, "PyInstaller:").grid(row=2, column=0, sticky="w", padx=12, pady=8)
 
-        self.pyinstaller_status_label = ctk.CTkLabel(
-            env_card,
-            text="检测中...",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"])
-        )
+        self.pyinstaller_status_label = self._mk_label(env_card, "检测中...", text_color=self.theme.text_subtle)
         self.pyinstaller_status_label.grid(row=2, column=1, sticky="w", padx=8, pady=8)
 
         # 一键安装按钮
-        self.install_btn = ctk.CTkButton(
+        self.install_btn = self._mk_button_primary(
             env_card,
-            text="📦 一键安装",
+            "📦 一键安装",
+            self._install_pyinstaller,
             width=110,
-            height=36,
-            corner_radius=8,
-            fg_color=(self.colors["success"], self.colors["success"]),
+            fg_color=self.theme.success,
             hover_color=("#059669", "#059669"),
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            command=self._install_pyinstaller,
         )
         self.install_btn.grid(row=2, column=2, padx=12, pady=(8, 12))
 
         # ===== 第二部分：打包设置卡片 =====
-        pack_card = ctk.CTkFrame(
-            self.beginner_frame,
-            fg_color=(self.colors["surface_light"], self.colors["surface_dark"]),
-            corner_radius=12,
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"])
-        )
+        pack_card = self._mk_card(self.beginner_frame)
         pack_card.grid(row=1, column=0, sticky="ew", padx=0, pady=(0, 12))
         pack_card.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(
-            pack_card,
-            text="打包设置",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=12, pady=(12, 10))
+        self._mk_label(pack_card, "打包设置", size=14, weight="bold").grid(
+            row=0, column=0, columnspan=3, sticky="w", padx=12, pady=(12, 10)
+        )
 
         # 选择 Python 文件
-        ctk.CTkLabel(
-            pack_card,
-            text="Python 文件:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=1, column=0, sticky="w", padx=12, pady=8)
+        self._mk_label(pack_card, "Python 文件:").grid(row=1, column=0, sticky="w", padx=12, pady=8)
 
         self.beginner_script_var = ctk.StringVar()
-        ctk.CTkEntry(
+        self._mk_entry(
             pack_card,
             textvariable=self.beginner_script_var,
             placeholder_text="选择你的 .py 文件",
             height=40,
-            corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI")
         ).grid(row=1, column=1, sticky="ew", padx=8, pady=8)
 
-        ctk.CTkButton(
-            pack_card,
-            text="📂 选择",
-            width=90,
-            height=40,
-            corner_radius=8,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            hover_color=(self.colors["border_light"], self.colors["border_dark"]),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            command=self._select_beginner_script,
-        ).grid(row=1, column=2, padx=12, pady=8)
+        self._mk_button_outline(pack_card, "📂 选择", self._select_beginner_script, width=90, height=40).grid(
+            row=1, column=2, padx=12, pady=8
+        )
 
         # 程序名称
-        ctk.CTkLabel(
-            pack_card,
-            text="程序名称:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=2, column=0, sticky="w", padx=12, pady=8)
+        self._mk_label(pack_card, "程序名称:").grid(row=2, column=0, sticky="w", padx=12, pady=8)
 
         self.beginner_name_var = ctk.StringVar(value="我的程序")
-        ctk.CTkEntry(
+        self._mk_entry(
             pack_card,
             textvariable=self.beginner_name_var,
             placeholder_text="生成的 exe 名称",
             height=40,
-            corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI")
         ).grid(row=2, column=1, columnspan=2, sticky="ew", padx=8, pady=8)
 
         # 程序类型
-        ctk.CTkLabel(
-            pack_card,
-            text="程序类型:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=3, column=0, sticky="w", padx=12, pady=8)
+        self._mk_label(pack_card, "程序类型:").grid(row=3, column=0, sticky="w", padx=12, pady=8)
 
-        self.beginner_type_var = ctk.StringVar(value="GUI程序")
+        self.beginner_type_var = ctk.StringVar(value=_GUI_PROGRAM_TYPE)
         type_frame = ctk.CTkFrame(pack_card, fg_color="transparent")
         type_frame.grid(row=3, column=1, sticky="w", padx=8, pady=8)
 
-        ctk.CTkRadioButton(
-            type_frame,
-            text="GUI 窗口程序",
-            variable=self.beginner_type_var,
-            value="GUI程序",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            fg_color=self.colors["primary"],
-            hover_color=self.colors["primary_hover"],
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
-        ).pack(side="left", padx=(0, 15))
-
-        ctk.CTkRadioButton(
-            type_frame,
-            text="命令行程序",
-            variable=self.beginner_type_var,
-            value="命令行程序",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            fg_color=self.colors["primary"],
-            hover_color=self.colors["primary_hover"],
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
-        ).pack(side="left")
+        radio_font = self._font(11)
+        for text, value in _PROGRAM_TYPES:
+            ctk.CTkRadioButton(
+                type_frame,
+                text=text,
+                variable=self.beginner_type_var,
+                value=value,
+                font=radio_font,
+                fg_color=self.colors["primary"],
+                hover_color=self.colors["primary_hover"],
+                text_color=self.theme.text_primary
+            ).pack(side="left", padx=(0, 15))
 
         # 输出位置
-        ctk.CTkLabel(
-            pack_card,
-            text="输出位置:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=4, column=0, sticky="w", padx=12, pady=8)
+        self._mk_label(pack_card, "输出位置:").grid(row=4, column=0, sticky="w", padx=12, pady=8)
 
         self.beginner_output_var = ctk.StringVar()
-        ctk.CTkEntry(
+        self._mk_entry(
             pack_card,
             textvariable=self.beginner_output_var,
             placeholder_text="exe 文件保存位置",
             height=40,
-            corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
-            border_color=(self.colors["border"], self.colors["border_dark"]),
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
-            placeholder_text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).grid(row=4, column=1, sticky="ew", padx=8, pady=(8, 12))
 
-        ctk.CTkButton(
-            pack_card,
-            text="📂 选择",
-            width=90,
-            height=40,
-            corner_radius=8,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            hover_color=(self.colors["border_light"], self.colors["border_dark"]),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            command=self._select_beginner_output,
-        ).grid(row=4, column=2, padx=12, pady=(8, 12))
+        self._mk_button_outline(pack_card, "📂 选择", self._select_beginner_output, width=90, height=40).grid(
+            row=4, column=2, padx=12, pady=(8, 12)
+        )
 
         # ===== 第三部分：打包按钮区 =====
         action_frame = ctk.CTkFrame(self.beginner_frame, fg_color="transparent")
         action_frame.grid(row=2, column=0, sticky="ew", padx=0, pady=(0, 15))
 
-        self.beginner_pack_btn = ctk.CTkButton(
+        self.beginner_pack_btn = self._mk_button_primary(
             action_frame,
-            text="🚀 一键打包",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            "🚀 一键打包",
+            self._beginner_package,
+            font=self._font(14, "bold"),
             width=180,
             height=48,
             corner_radius=10,
-            fg_color=(self.colors["primary"], self.colors["primary"]),
-            hover_color=(self.colors["primary_dark"], self.colors["primary_dark"]),
-            command=self._beginner_package,
         )
         self.beginner_pack_btn.pack(side="left", padx=(0, 8))
 
-        self.beginner_ai_pack_btn = ctk.CTkButton(
+        self.beginner_ai_pack_btn = self._mk_button_primary(
             action_frame,
-            text="🧠 AI分析打包",
-            font=ctk.CTkFont(size=14, weight="bold", family="Microsoft YaHei UI"),
+            "🧠 AI分析打包",
+            self._beginner_ai_package,
+            font=self._font(14, "bold"),
             width=180,
             height=48,
             corner_radius=10,
-            fg_color=(self.colors["accent"], self.colors["accent"]),
+            fg_color=self.theme.accent,
             hover_color=("#DB2777", "#DB2777"),
-            command=self._beginner_ai_package,
         )
         self.beginner_ai_pack_btn.pack(side="left", padx=8)
 
-        ctk.CTkButton(
+        self._mk_button_outline(
             action_frame,
-            text="📂 打开目录",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
+            "📂 打开目录",
+            self._open_beginner_output,
+            font=self._font(12),
             width=120,
             height=48,
             corner_radius=10,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            hover_color=(self.colors["border_light"], self.colors["border_dark"]),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            command=self._open_beginner_output,
         ).pack(side="left", padx=8)
 
         # ===== 第四部分：日志卡片 =====
-        log_card = ctk.CTkFrame(
-            self.beginner_frame,
-            fg_color=(self.colors["surface_light"], self.colors["surface_dark"]),
-            corner_radius=12,
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"])
-        )
+        log_card = self._mk_card(self.beginner_frame)
         log_card.grid(row=3, column=0, sticky="nsew", padx=0, pady=0)
         log_card.grid_columnconfigure(0, weight=1)
         log_card.grid_rowconfigure(1, weight=1)
@@ -4375,46 +4792,32 @@ class MainApp(ctk.CTk):
         log_header = ctk.CTkFrame(log_card, fg_color="transparent")
         log_header.grid(row=0, column=0, sticky="ew", padx=12, pady=10)
 
-        ctk.CTkLabel(
-            log_header,
-            text="运行日志",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).pack(side="left")
+        self._mk_label(log_header, "运行日志", size=12, weight="bold").pack(side="left")
 
-        ctk.CTkButton(
+        self._mk_button_outline(
             log_header,
-            text="清空",
+            "清空",
+            lambda: self._clear_log("beginner_log_textbox"),
             width=70,
             height=30,
             corner_radius=6,
             fg_color="transparent",
-            hover_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
-            command=lambda: self.beginner_log_textbox.delete("1.0", "end"),
+            hover_color=self.theme.bg,
+            text_color=self.theme.text_subtle,
+            font=self._font(10),
         ).pack(side="right")
 
         self.beginner_log_textbox = ctk.CTkTextbox(
             log_card,
-            font=ctk.CTkFont(family="Consolas", size=10),
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"])
+            font=self._font(10, family="Consolas"),
+            fg_color=self.theme.bg
         )
         self.beginner_log_textbox.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
-        self.beginner_log_textbox.insert(
-            "1.0",
-            "欢迎使用零基础打包模式！\n\n"
-            "步骤：\n"
-            "1. 确保环境检测通过（如未安装 PyInstaller 请点击一键安装）\n"
-            "2. 选择你的 Python 文件\n"
-            "3. 设置程序名称和类型\n"
-            "4. 点击「一键打包」或「AI分析打包」\n"
-        )
+        # 欢迎文本在下一个空闲周期写入，不阻塞首次布局
+        self.after_idle(lambda: self.beginner_log_textbox.insert("1.0", _BEGINNER_WELCOME))
 
-        # 初始化环境检测
-        self.after(500, self._check_environment)
+        # 环境检测推迟到零基础模式首次可见时进行
+        self._env_checked = False
 
     def _build_developer_mode(self):
         """构建独立开发模式界面 - 统一紫色主题风格"""
@@ -4426,30 +4829,23 @@ class MainApp(ctk.CTk):
         self.developer_frame.grid_rowconfigure(2, weight=1)
 
         # ===== 第一部分：提示卡片 =====
-        tip_card = ctk.CTkFrame(
+        tip_card = self._mk_card(
             self.developer_frame,
             fg_color=(self.colors["primary_subtle"], "#1e1b4b"),
             corner_radius=10,
-            border_width=1,
-            border_color=(self.colors["primary_light"], self.colors["primary"])
+            border_color=self.theme.primary_outline
         )
         tip_card.grid(row=0, column=0, sticky="ew", padx=0, pady=(0, 12))
 
-        ctk.CTkLabel(
+        self._mk_label(
             tip_card,
-            text="💡 选择入口文件后点击「AI 智能分析」自动检测依赖和配置",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
-            text_color=(self.colors["primary"], self.colors["primary_light"]),
+            "💡 选择入口文件后点击「AI 智能分析」自动检测依赖和配置",
+            size=12,
+            text_color=self.theme.primary_text,
         ).pack(padx=15, pady=12)
 
         # ===== 第二部分：配置卡片（包含 AI 分析结果）=====
-        config_card = ctk.CTkFrame(
-            self.developer_frame,
-            fg_color=(self.colors["surface_light"], self.colors["surface_dark"]),
-            corner_radius=12,
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"])
-        )
+        config_card = self._mk_card(self.developer_frame)
         config_card.grid(row=1, column=0, sticky="ew", padx=0, pady=(0, 12))
         config_card.grid_columnconfigure(0, weight=1)
         config_card.grid_columnconfigure(1, weight=1)
@@ -4459,162 +4855,74 @@ class MainApp(ctk.CTk):
         left_frame.grid(row=0, column=0, sticky="nsew", padx=(15, 8), pady=15)
         left_frame.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(
-            left_frame,
-            text="📦 打包配置",
-            font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
+        self._mk_label(left_frame, "📦 打包配置", size=13, weight="bold").grid(
+            row=0, column=0, columnspan=3, sticky="w", pady=(0, 10)
+        )
 
         # 入口文件
-        ctk.CTkLabel(
-            left_frame,
-            text="入口文件:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=1, column=0, sticky="w", pady=6)
+        self._mk_label(left_frame, "入口文件:").grid(row=1, column=0, sticky="w", pady=6)
 
         self.script_path_var = ctk.StringVar()
-        ctk.CTkEntry(
+        self._mk_entry(
             left_frame,
             textvariable=self.script_path_var,
             placeholder_text="选择入口文件 (main.py)",
-            height=36,
-            corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
-            border_color=(self.colors["border"], self.colors["border_dark"]),
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
-            placeholder_text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).grid(row=1, column=1, sticky="ew", padx=8, pady=6)
 
         btn_frame_1 = ctk.CTkFrame(left_frame, fg_color="transparent")
         btn_frame_1.grid(row=1, column=2, sticky="e", pady=6)
 
-        ctk.CTkButton(
-            btn_frame_1,
-            text="📂",
-            width=36,
-            height=36,
-            corner_radius=8,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            hover_color=(self.colors["border_light"], self.colors["border_dark"]),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            command=self._select_script,
-        ).pack(side="left", padx=(0, 5))
+        self._mk_button_outline(btn_frame_1, "📂", self._select_script, width=36).pack(side="left", padx=(0, 5))
 
-        ctk.CTkButton(
+        self._mk_button_primary(
             btn_frame_1,
-            text="🤖 AI分析",
+            "🤖 AI分析",
+            self._ai_analyze_project,
             width=80,
-            height=36,
-            corner_radius=8,
-            fg_color=(self.colors["accent"], self.colors["accent"]),
+            fg_color=self.theme.accent,
             hover_color=("#DB2777", "#DB2777"),
-            font=ctk.CTkFont(size=11, weight="bold", family="Microsoft YaHei UI"),
-            command=self._ai_analyze_project,
+            font=self._font(11, "bold"),
         ).pack(side="left")
 
         # 输出目录
-        ctk.CTkLabel(
-            left_frame,
-            text="输出目录:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=2, column=0, sticky="w", pady=6)
+        self._mk_label(left_frame, "输出目录:").grid(row=2, column=0, sticky="w", pady=6)
 
         self.output_dir_var = ctk.StringVar(value=self.settings.get("pyinstaller_output_dir", ""))
-        ctk.CTkEntry(
+        self._mk_entry(
             left_frame,
             textvariable=self.output_dir_var,
             placeholder_text="exe 保存位置",
-            height=36,
-            corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
-            border_color=(self.colors["border"], self.colors["border_dark"]),
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
-            placeholder_text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).grid(row=2, column=1, sticky="ew", padx=8, pady=6)
 
-        ctk.CTkButton(
-            left_frame,
-            text="📂",
-            width=36,
-            height=36,
-            corner_radius=8,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            hover_color=(self.colors["border_light"], self.colors["border_dark"]),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            command=self._select_output_dir,
-        ).grid(row=2, column=2, sticky="w", pady=6)
+        self._mk_button_outline(left_frame, "📂", self._select_output_dir, width=36).grid(
+            row=2, column=2, sticky="w", pady=6
+        )
 
         # 程序名称 + 图标
-        ctk.CTkLabel(
-            left_frame,
-            text="程序名称:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=3, column=0, sticky="w", pady=6)
+        self._mk_label(left_frame, "程序名称:").grid(row=3, column=0, sticky="w", pady=6)
 
         name_icon_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
         name_icon_frame.grid(row=3, column=1, columnspan=2, sticky="ew", pady=6)
 
         self.program_name_var = ctk.StringVar(value="MyApp")
-        ctk.CTkEntry(
+        self._mk_entry(
             name_icon_frame,
             textvariable=self.program_name_var,
             placeholder_text="程序名",
             width=120,
-            height=36,
-            corner_radius=8,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
-            border_color=(self.colors["border"], self.colors["border_dark"]),
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
-            placeholder_text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
         ).pack(side="left", padx=(8, 15))
 
-        ctk.CTkLabel(
-            name_icon_frame,
-            text="图标:",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).pack(side="left")
+        self._mk_label(name_icon_frame, "图标:").pack(side="left")
 
         self.icon_path_var = ctk.StringVar()
-        ctk.CTkEntry(
+        self._mk_entry(
             name_icon_frame,
             textvariable=self.icon_path_var,
-            width=120,
-            height=36,
-            corner_radius=8,
             placeholder_text="可选 .ico",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
-            border_color=(self.colors["border"], self.colors["border_dark"]),
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"]),
-            placeholder_text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
+            width=120,
         ).pack(side="left", padx=8)
 
-        ctk.CTkButton(
-            name_icon_frame,
-            text="选择",
-            width=50,
-            height=36,
-            corner_radius=8,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            hover_color=(self.colors["border_light"], self.colors["border_dark"]),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            command=self._select_icon,
-        ).pack(side="left")
+        self._mk_button_outline(name_icon_frame, "选择", self._select_icon, width=50).pack(side="left")
 
         # 打包选项
         options_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
@@ -4625,10 +4933,10 @@ class MainApp(ctk.CTk):
             options_frame,
             text="单文件 (-F)",
             variable=self.onefile_var,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            fg_color=(self.colors["primary"], self.colors["primary"]),
-            hover_color=(self.colors["primary_dark"], self.colors["primary_dark"]),
+            font=self._font(11),
+            text_color=self.theme.text,
+            fg_color=self.theme.primary,
+            hover_color=self.theme.primary_dark,
         ).pack(side="left", padx=(0, 20))
 
         self.noconsole_var = ctk.BooleanVar(value=False)
@@ -4636,34 +4944,31 @@ class MainApp(ctk.CTk):
             options_frame,
             text="无控制台 (-w)",
             variable=self.noconsole_var,
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            fg_color=(self.colors["primary"], self.colors["primary"]),
-            hover_color=(self.colors["primary_dark"], self.colors["primary_dark"]),
+            font=self._font(11),
+            text_color=self.theme.text,
+            fg_color=self.theme.primary,
+            hover_color=self.theme.primary_dark,
         ).pack(side="left")
 
         # 右侧：AI 分析结果
         right_frame = ctk.CTkFrame(
             config_card,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
+            fg_color=self.theme.bg,
             corner_radius=10
         )
         right_frame.grid(row=0, column=1, sticky="nsew", padx=(8, 15), pady=15)
         right_frame.grid_columnconfigure(0, weight=1)
         right_frame.grid_rowconfigure(1, weight=1)
 
-        ctk.CTkLabel(
-            right_frame,
-            text="🤖 AI 分析结果",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).grid(row=0, column=0, sticky="w", padx=12, pady=(10, 5))
+        self._mk_label(right_frame, "🤖 AI 分析结果", size=12, weight="bold").grid(
+            row=0, column=0, sticky="w", padx=12, pady=(10, 5)
+        )
 
         self.ai_result_textbox = ctk.CTkTextbox(
             right_frame,
             corner_radius=8,
-            font=ctk.CTkFont(family="Consolas", size=10),
-            fg_color=(self.colors["surface_light"], self.colors["surface_dark"]),
+            font=self._font(10, family="Consolas"),
+            fg_color=self.theme.surface,
         )
         self.ai_result_textbox.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
         self.ai_result_textbox.insert("1.0", "点击「AI分析」按钮分析项目...\n\n• 自动检测依赖模块\n• 自动检测数据文件\n• 自动配置特殊库")
@@ -4673,53 +4978,39 @@ class MainApp(ctk.CTk):
         btn_frame = ctk.CTkFrame(self.developer_frame, fg_color="transparent")
         btn_frame.grid(row=1, column=0, sticky="se", padx=0, pady=(0, 12))
 
-        ctk.CTkButton(
+        self._mk_button_primary(
             btn_frame,
-            text="🚀 开始打包",
-            font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI"),
+            "🚀 开始打包",
+            self._start_packaging,
+            font=self._font(13, "bold"),
             width=140,
             height=42,
             corner_radius=10,
-            fg_color=(self.colors["primary"], self.colors["primary"]),
-            hover_color=(self.colors["primary_dark"], self.colors["primary_dark"]),
-            command=self._start_packaging,
         ).pack(side="left", padx=(0, 8))
 
-        ctk.CTkButton(
+        self._mk_button_primary(
             btn_frame,
-            text="🧠 AI分析后打包",
-            font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI"),
+            "🧠 AI分析后打包",
+            self._ai_analyze_and_package,
+            font=self._font(13, "bold"),
             width=150,
             height=42,
             corner_radius=10,
-            fg_color=(self.colors["accent"], self.colors["accent"]),
+            fg_color=self.theme.accent,
             hover_color=("#DB2777", "#DB2777"),
-            command=self._ai_analyze_and_package,
         ).pack(side="left", padx=(0, 8))
 
-        ctk.CTkButton(
+        self._mk_button_outline(
             btn_frame,
-            text="📂 打开目录",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
+            "📂 打开目录",
+            self._open_output_dir,
             width=100,
             height=42,
             corner_radius=10,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            hover_color=(self.colors["border_light"], self.colors["border_dark"]),
-            text_color=(self.colors["text_light"], self.colors["text_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            command=self._open_output_dir,
         ).pack(side="left")
 
         # ===== 第三部分：打包日志 =====
-        log_card = ctk.CTkFrame(
-            self.developer_frame,
-            fg_color=(self.colors["surface_light"], self.colors["surface_dark"]),
-            corner_radius=12,
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"])
-        )
+        log_card = self._mk_card(self.developer_frame)
         log_card.grid(row=2, column=0, sticky="nsew", padx=0, pady=0)
         log_card.grid_columnconfigure(0, weight=1)
         log_card.grid_rowconfigure(1, weight=1)
@@ -4727,33 +5018,26 @@ class MainApp(ctk.CTk):
         log_header = ctk.CTkFrame(log_card, fg_color="transparent")
         log_header.grid(row=0, column=0, sticky="ew", padx=12, pady=10)
 
-        ctk.CTkLabel(
-            log_header,
-            text="📋 打包日志",
-            font=ctk.CTkFont(size=12, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_light"], self.colors["text_dark"])
-        ).pack(side="left")
+        self._mk_label(log_header, "📋 打包日志", size=12, weight="bold").pack(side="left")
 
-        ctk.CTkButton(
+        self._mk_button_outline(
             log_header,
-            text="清空",
+            "清空",
+            lambda: self._clear_log("pack_log_textbox"),
             width=60,
             height=28,
             corner_radius=6,
             fg_color="transparent",
-            hover_color=(self.colors["bg_light"], self.colors["bg_dark"]),
-            text_color=(self.colors["text_muted_light"], self.colors["text_muted_dark"]),
-            border_width=1,
-            border_color=(self.colors["border_light"], self.colors["border_dark"]),
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
-            command=lambda: self.pack_log_textbox.delete("1.0", "end"),
+            hover_color=self.theme.bg,
+            text_color=self.theme.text_subtle,
+            font=self._font(10),
         ).pack(side="right")
 
         self.pack_log_textbox = ctk.CTkTextbox(
             log_card,
-            font=ctk.CTkFont(family="Consolas", size=10),
+            font=self._font(10, family="Consolas"),
             corner_radius=8,
-            fg_color=(self.colors["bg_light"], self.colors["bg_dark"]),
+            fg_color=self.theme.bg,
         )
         self.pack_log_textbox.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
 
@@ -4766,34 +5050,79 @@ class MainApp(ctk.CTk):
 
     def _show_beginner_mode(self):
         """显示零基础用户模式"""
-        self.developer_frame.grid_forget()
-        self.beginner_frame.grid(row=0, column=0, sticky="nsew")
+        if self.developer_frame is not None:
+            self.developer_frame.grid_remove()
+        if self.beginner_frame is None:
+            self._build_beginner_mode()
+            self.beginner_frame.grid(row=0, column=0, sticky="nsew")
+        else:
+            # grid_remove 保留了布局参数，直接恢复即可
+            self.beginner_frame.grid()
+        if self.current_nav == "packager":
+            self._ensure_environment_checked()
+
+    def _ensure_environment_checked(self):
+        """零基础模式首次可见时执行一次环境检测"""
+        if self._env_checked:
+            return
+        self._env_checked = True
+        self.after_idle(self._check_environment)
 
     def _show_developer_mode(self):
         """显示独立开发模式"""
-        self.beginner_frame.grid_forget()
-        self.developer_frame.grid(row=0, column=0, sticky="nsew")
+        if self.beginner_frame is not None:
+            self.beginner_frame.grid_remove()
+        if self.developer_frame is None:
+            self._build_developer_mode()
+            self.developer_frame.grid(row=0, column=0, sticky="nsew")
+            self._check_pyinstaller()
+        else:
+            # grid_remove 保留了布局参数，直接恢复即可
+            self.developer_frame.grid()
 
     def _check_environment(self):
-        """检测环境"""
+        """检测环境（在后台线程探测，结果回到主线程更新界面）"""
         import sys
-        import subprocess
 
-        # 检测 Python
+        if getattr(self, "_env_check_running", False):
+            return
+        self._env_check_running = True
+        self.python_status_label.configure(text="检测中...")
+        self.pyinstaller_status_label.configure(text="检测中...")
+
+        # Python 版本直接读取，只有 PyInstaller 探测放到后台
         try:
             python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        except Exception:
+            python_version = ""
+
+        def worker():
+            result = {
+                "python_version": python_version,
+                "pyinstaller": _is_pyinstaller_installed_cached(force=True),
+            }
+            self.after(0, self._apply_env_result, result)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_env_result(self, result: dict):
+        """应用环境检测结果"""
+        self._env_check_running = False
+
+        # Python 状态
+        if result["python_version"]:
             self.python_status_label.configure(
-                text=f"✅ Python {python_version}",
+                text=f"✅ Python {result['python_version']}",
                 text_color="green"
             )
-        except Exception:
+        else:
             self.python_status_label.configure(
                 text="❌ 未检测到 Python",
                 text_color="red"
             )
 
-        # 检测 PyInstaller
-        if PyInstallerService.is_installed():
+        # PyInstaller 状态
+        if result["pyinstaller"]:
             self.pyinstaller_status_label.configure(
                 text="✅ 已安装",
                 text_color="green"
@@ -4824,12 +5153,14 @@ class MainApp(ctk.CTk):
                     capture_output=True,
                     text=True,
                     encoding='utf-8',
-                    errors='replace'
+                    errors='replace',
+                    **_POPEN_KWARGS,
                 )
 
                 def on_complete():
                     if result.returncode == 0:
                         self._append_beginner_log("✅ PyInstaller 安装成功！")
+                        _invalidate_pyinstaller_cache()
                         self._check_environment()
                     else:
                         self._append_beginner_log(f"❌ 安装失败: {result.stderr}")
@@ -4849,20 +5180,32 @@ class MainApp(ctk.CTk):
 
     def _select_beginner_script(self):
         """零基础模式选择脚本"""
+        from tkinter import filedialog
+
         filepath = filedialog.askopenfilename(
             filetypes=[("Python文件", "*.py")],
         )
         if filepath:
             self.beginner_script_var.set(filepath)
+            stem, script_dir = self._beginner_script_parts(filepath)
             # 自动设置程序名
-            name = Path(filepath).stem
-            self.beginner_name_var.set(name)
+            self.beginner_name_var.set(stem)
             # 自动设置输出目录为脚本所在目录的 dist 文件夹
-            output_dir = os.path.join(os.path.dirname(filepath), "dist")
+            output_dir = os.path.join(script_dir, "dist")
             self.beginner_output_var.set(output_dir)
 
+    def _beginner_script_parts(self, script_path: str) -> tuple:
+        """返回脚本的 (文件名主干, 所在目录)，同一路径只解析一次"""
+        cached = getattr(self, "_beginner_script_cache", None)
+        if cached is None or cached[0] != script_path:
+            cached = (script_path, Path(script_path).stem, os.path.dirname(script_path))
+            self._beginner_script_cache = cached
+        return cached[1], cached[2]
+
     def _select_beginner_output(self):
         """零基础模式选择输出目录"""
+        from tkinter import filedialog
+
         directory = filedialog.askdirectory()
         if directory:
             self.beginner_output_var.set(directory)
@@ -4871,14 +5214,49 @@ class MainApp(ctk.CTk):
         """打开零基础模式输出目录"""
         output_dir = self.beginner_output_var.get()
         if output_dir and os.path.exists(output_dir):
-            FileService.open_directory(output_dir)
+            _services().FileService.open_directory(output_dir)
         else:
             self._show_message("提示", "输出目录不存在")
 
+    def _buffer_log(self, textbox_name: str, msg: str):
+        """将日志行放入缓冲区，50ms 内的多行合并为一次插入（可在后台线程调用）"""
+        with self._log_lock:
+            self._log_buffers[textbox_name].append(msg)
+            if textbox_name in self._log_flush_pending:
+                return
+            self._log_flush_pending.add(textbox_name)
+        self.after(50, self._flush_log, textbox_name)
+
+    def _flush_log(self, textbox_name: str):
+        """把缓冲区中的日志一次性写入文本框"""
+        with self._log_lock:
+            self._log_flush_pending.discard(textbox_name)
+            lines = self._log_buffers[textbox_name]
+            if not lines:
+                return
+            self._log_buffers[textbox_name] = []
+
+        textbox = getattr(self, textbox_name)
+        textbox.insert("end", "\n".join(lines) + "\n")
+
+        # 限制总行数，避免长时间打包后文本框越来越慢
+        line_count = int(textbox.index("end-1c").split(".")[0])
+        if line_count > _LOG_MAX_LINES:
+            textbox.delete("1.0", f"{line_count - _LOG_MAX_LINES}.0")
+
+        # 直接滚动到底部，省去 see() 为定位目标字符所做的 bbox 计算
+        textbox.mark_set("insert", "end")
+        textbox.yview_moveto(1.0)
+
+    def _clear_log(self, textbox_name: str):
+        """清空日志文本框及其待写入缓冲"""
+        with self._log_lock:
+            self._log_buffers[textbox_name] = []
+        getattr(self, textbox_name).delete("1.0", "end")
+
     def _append_beginner_log(self, msg: str):
         """追加零基础模式日志"""
-        self.beginner_log_textbox.insert("end", msg + "\n")
-        self.beginner_log_textbox.see("end")
+        self._buffer_log("beginner_log_textbox", msg)
 
     def _beginner_package(self):
         """零基础模式一键打包"""
@@ -4896,18 +5274,19 @@ class MainApp(ctk.CTk):
             self._show_message("错误", "文件不存在")
             return
 
+        script_stem, script_dir = self._beginner_script_parts(script_path)
         if not name:
-            name = Path(script_path).stem
+            name = script_stem
 
         if not output_dir:
-            output_dir = os.path.join(os.path.dirname(script_path), "dist")
+            output_dir = os.path.join(script_dir, "dist")
 
-        if not PyInstallerService.is_installed():
+        if not _is_pyinstaller_installed_cached():
             self._show_message("错误", "请先安装 PyInstaller")
             return
 
         # 确定是否隐藏控制台
-        noconsole = (app_type == "GUI程序")
+        noconsole = (app_type == _GUI_PROGRAM_TYPE)
 
         self.beginner_pack_btn.configure(state="disabled", text="⏳ 打包中...")
         self._append_beginner_log("")
@@ -4917,12 +5296,11 @@ class MainApp(ctk.CTk):
         self._append_beginner_log(f"   类型: {app_type}")
         self._append_beginner_log(f"   输出: {output_dir}")
 
-        def log_callback(msg):
-            self.after(0, lambda: self._append_beginner_log(msg))
+        log_callback = self._append_beginner_log
 
         def worker():
             try:
-                success = PyInstallerService.build(
+                success = _services().PyInstallerService.build(
                     script_path=script_path,
                     output_dir=output_dir,
                     name=name,
@@ -4942,7 +5320,7 @@ class MainApp(ctk.CTk):
                         self._append_beginner_log("=" * 40)
                         self._append_beginner_log("✅ 打包成功！")
                         self._append_beginner_log(f"📁 文件位置: {exe_path}")
-                        self._show_message("成功", f"打包完成！\n\n生成文件：{exe_path}")
+                        self._set_status(f"✅ 打包完成: {exe_path}", "success")
                     else:
                         self._append_beginner_log("❌ 打包失败，请查看日志")
                         self._show_message("失败", "打包失败，请查看日志了解详情")
@@ -4976,13 +5354,14 @@ class MainApp(ctk.CTk):
             self._show_message("错误", "文件不存在")
             return
 
+        script_stem, script_dir = self._beginner_script_parts(script_path)
         if not name:
-            name = Path(script_path).stem
+            name = script_stem
 
         if not output_dir:
-            output_dir = os.path.join(os.path.dirname(script_path), "dist")
+            output_dir = os.path.join(script_dir, "dist")
 
-        if not PyInstallerService.is_installed():
+        if not _is_pyinstaller_installed_cached():
             self._show_message("错误", "请先安装 PyInstaller")
             return
 
@@ -4990,16 +5369,15 @@ class MainApp(ctk.CTk):
             self._show_message("错误", "请先在设置中配置 API 密钥才能使用 AI 分析功能")
             return
 
-        noconsole = (app_type == "GUI程序")
-        project_dir = os.path.dirname(script_path)
+        noconsole = (app_type == _GUI_PROGRAM_TYPE)
+        project_dir = script_dir
 
         self.beginner_ai_pack_btn.configure(state="disabled", text="⏳ AI分析中...")
         self._append_beginner_log("")
         self._append_beginner_log("=" * 40)
         self._append_beginner_log("🧠 开始 AI 智能分析项目...")
 
-        def log_callback(msg):
-            self.after(0, lambda: self._append_beginner_log(msg))
+        log_callback = self._append_beginner_log
 
         def worker():
             try:
@@ -5026,7 +5404,7 @@ class MainApp(ctk.CTk):
                 self.after(0, show_analysis_result)
 
                 # 第二步：使用 AI 配置进行打包
-                success = PyInstallerService.build(
+                success = _services().PyInstallerService.build(
                     script_path=script_path,
                     output_dir=output_dir,
                     name=name,
@@ -5047,7 +5425,7 @@ class MainApp(ctk.CTk):
                         self._append_beginner_log("=" * 40)
                         self._append_beginner_log("✅ AI 智能打包成功！")
                         self._append_beginner_log(f"📁 文件位置: {exe_path}")
-                        self._show_message("成功", f"AI 智能打包完成！\n\n生成文件：{exe_path}")
+                        self._set_status(f"✅ AI 智能打包完成: {exe_path}", "success")
                     else:
                         self._append_beginner_log("❌ 打包失败，请查看日志")
                         self._show_message("失败", "打包失败，请查看日志了解详情")
@@ -5086,8 +5464,7 @@ class MainApp(ctk.CTk):
 
         project_dir = os.path.dirname(script_path)
 
-        def log_callback(msg):
-            self.after(0, lambda: self._append_pack_log(msg))
+        log_callback = self._append_pack_log
 
         def worker():
             try:
@@ -5100,7 +5477,7 @@ class MainApp(ctk.CTk):
                 def on_success():
                     self.ai_package_config = config
                     self._display_ai_result(config)
-                    self._show_message("成功", "AI 分析完成！请查看分析结果")
+                    self._set_status("✅ AI 分析完成，请查看分析结果", "success")
 
                 self.after(0, on_success)
 
@@ -5121,20 +5498,24 @@ class MainApp(ctk.CTk):
         self.ai_result_textbox.configure(state="normal")
         self.ai_result_textbox.delete("1.0", "end")
 
-        result_text = f"""✅ AI 分析完成
-
-📦 隐藏导入模块:
-{chr(10).join('  • ' + m for m in config.get('hidden_imports', [])) or '  (无)'}
-
-📁 收集数据包:
-{chr(10).join('  • ' + m for m in config.get('collect_data', [])) or '  (无)'}
-
-📂 完整收集包:
-{chr(10).join('  • ' + m for m in config.get('collect_all', [])) or '  (无)'}
+        parts = ["✅ AI 分析完成", ""]
+        for title, key in (
+            ("📦 隐藏导入模块:", "hidden_imports"),
+            ("📁 收集数据包:", "collect_data"),
+            ("📂 完整收集包:", "collect_all"),
+        ):
+            parts.append(title)
+            items = config.get(key, [])
+            if items:
+                parts.extend("  • " + m for m in items)
+            else:
+                parts.append("  (无)")
+            parts.append("")
+        parts.append("💡 建议说明:")
+        parts.append(config.get("explanation", "无"))
+        parts.append("")
 
-💡 建议说明:
-{config.get('explanation', '无')}
-"""
+        result_text = "\n".join(parts)
         self.ai_result_textbox.insert("1.0", result_text)
         self.ai_result_textbox.configure(state="disabled")
 
@@ -5162,8 +5543,7 @@ class MainApp(ctk.CTk):
 
         project_dir = os.path.dirname(script_path)
 
-        def log_callback(msg):
-            self.after(0, lambda: self._append_pack_log(msg))
+        log_callback = self._append_pack_log
 
         def worker():
             try:
@@ -5194,7 +5574,7 @@ class MainApp(ctk.CTk):
 
                 def on_complete():
                     if success:
-                        self._show_message("成功", f"打包完成！\n输出目录: {output_dir}")
+                        self._set_status(f"✅ 打包完成，输出目录: {output_dir}", "success")
                     else:
                         self._show_message("失败", "打包失败，请查看日志")
 
@@ -5208,9 +5588,9 @@ class MainApp(ctk.CTk):
 
                 self.after(0, on_error)
 
-        self.pack_log_textbox.delete("1.0", "end")
+        self._clear_log("pack_log_textbox")
         threading.Thread(target=worker, daemon=True).start()
-        self._show_message("提示", "AI 分析和打包已开始，请查看日志...")
+        self._set_status("AI 分析和打包已开始，请查看日志...", "info")
 
     def _build_with_ai_config(
         self,
@@ -5239,10 +5619,18 @@ class MainApp(ctk.CTk):
                     if callback:
                         callback(f"[清理] 删除旧的 spec 文件: {old_spec}")
 
+            # 旧 build 目录在后台删除，与下面的命令组装并行，启动 PyInstaller 前再等待完成
             build_dir = os.path.join(output_dir, "build")
+            cleanup_thread = None
             if os.path.exists(build_dir):
                 import shutil
-                shutil.rmtree(build_dir, ignore_errors=True)
+                cleanup_thread = threading.Thread(
+                    target=shutil.rmtree,
+                    args=(build_dir,),
+                    kwargs={"ignore_errors": True},
+                    daemon=True,
+                )
+                cleanup_thread.start()
                 if callback:
                     callback(f"[清理] 删除旧的 build 目录")
 
@@ -5255,18 +5643,22 @@ class MainApp(ctk.CTk):
             if self.noconsole_var.get():
                 cmd.append("--noconsole")
 
-            cmd.append("--clean")
-
-            # 输出目录
-            cmd.extend(["--distpath", output_dir])
-            cmd.extend(["--workpath", build_dir])
-            cmd.extend(["--specpath", output_dir])
+            # 清理缓存 + 输出目录
+            cmd.extend((
+                "--clean",
+                "--distpath", output_dir,
+                "--workpath", build_dir,
+                "--specpath", output_dir,
+            ))
 
             if name:
                 cmd.extend(["--name", name])
 
             # 检查图标文件是否真实存在，支持自动转换图片格式
+            # 图片转 ICO 在单独线程进行，与下面的参数组装并行，追加 -y 前再等待结果
             icon = self.icon_path_var.get().strip()
+            icon_thread = None
+            icon_result = {}
             if icon:
                 icon = os.path.abspath(icon)
                 if os.path.exists(icon):
@@ -5275,14 +5667,15 @@ class MainApp(ctk.CTk):
                     if ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif']:
                         if callback:
                             callback(f"[图标] 检测到 {ext} 格式，正在转换为 ICO...")
-                        try:
-                            ico_path = self._convert_image_to_ico(icon, output_dir)
-                            cmd.extend(["--icon", ico_path])
-                            if callback:
-                                callback(f"[图标] 转换成功: {ico_path}")
-                        except Exception as e:
-                            if callback:
-                                callback(f"[警告] 图标转换失败: {e}")
+
+                        def convert_icon(src=icon):
+                            try:
+                                icon_result["path"] = self._cached_ico(src, output_dir)
+                            except Exception as e:
+                                icon_result["error"] = e
+
+                        icon_thread = threading.Thread(target=convert_icon, daemon=True)
+                        icon_thread.start()
                     elif ext == '.ico':
                         cmd.extend(["--icon", icon])
                         if callback:
@@ -5311,7 +5704,8 @@ class MainApp(ctk.CTk):
                 if callback:
                     callback(f"[AI] 完整收集: {package}")
 
-            # 处理 add_data，修正路径
+            # 处理 add_data，修正路径（同一路径只检查一次是否存在）
+            seen_exists = {}
             for data in ai_config.get("add_data", []):
                 if ":" in data or ";" in data:
                     # 分离源路径和目标路径
@@ -5322,7 +5716,11 @@ class MainApp(ctk.CTk):
                         # 如果源路径不是绝对路径，则相对于工作目录
                         if not os.path.isabs(src):
                             src = os.path.join(work_dir, src)
-                        if os.path.exists(src):
+                        exists = seen_exists.get(src)
+                        if exists is None:
+                            exists = os.path.exists(src)
+                            seen_exists[src] = exists
+                        if exists:
                             # Windows 使用分号
                             cmd.extend(["--add-data", f"{src};{dst}"])
                             if callback:
@@ -5332,23 +5730,28 @@ class MainApp(ctk.CTk):
                                 callback(f"[跳过] 文件不存在: {src}")
 
             # 过滤掉不合理的 extra_args（避免与已有参数冲突）
-            skip_prefixes = ("--onefile", "--onedir", "-F", "-D", "--name", "-n",
-                           "--icon", "-i", "--windowed", "-w", "--console", "-c",
-                           "--distpath", "--workpath", "--specpath", "--clean", "-y")
+            cmd_set = set(cmd)
             for arg in ai_config.get("extra_args", []):
                 # 跳过会与已有参数冲突的选项
-                should_skip = False
-                for prefix in skip_prefixes:
-                    if arg.startswith(prefix):
-                        should_skip = True
-                        if callback:
-                            callback(f"[跳过] 忽略冲突参数: {arg}")
-                        break
-                if not should_skip and arg not in cmd:
+                if arg in _SKIP_EXACT or arg.startswith(_SKIP_PREFIXES):
+                    if callback:
+                        callback(f"[跳过] 忽略冲突参数: {arg}")
+                    continue
+                if arg not in cmd_set:
                     cmd.append(arg)
+                    cmd_set.add(arg)
                     if callback:
                         callback(f"[AI] 额外参数: {arg}")
 
+            if icon_thread is not None:
+                icon_thread.join()
+                if "path" in icon_result:
+                    cmd.extend(["--icon", icon_result["path"]])
+                    if callback:
+                        callback(f"[图标] 转换成功: {icon_result['path']}")
+                elif callback:
+                    callback(f"[警告] 图标转换失败: {icon_result.get('error')}")
+
             cmd.append("-y")
             cmd.append(script_path)
 
@@ -5361,23 +5764,66 @@ class MainApp(ctk.CTk):
             env = os.environ.copy()
             env["PYTHONIOENCODING"] = "utf-8"
 
+            if cleanup_thread is not None:
+                cleanup_thread.join()
+
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
+                bufsize=0,
                 cwd=work_dir,
                 env=env,
+                **_POPEN_KWARGS,
             )
 
-            for line in process.stdout:
-                line = line.strip()
-                if line and callback:
-                    callback(line)
-
+            # 待转发的输出行：攒够 16 行或距上次转发超过 30ms 时合并为一条消息，
+            # 剩余的行由主线程定时器在 30ms 后转发，不必等到下一块输出
+            out_lines = []
+            out_lock = threading.Lock()
+            last_flush = time.monotonic()
+            flush_scheduled = False
+
+            def flush_lines():
+                # 工作线程和主线程定时器都会调用，持锁转发以保持行的先后顺序
+                nonlocal last_flush, flush_scheduled
+                with out_lock:
+                    if out_lines and callback:
+                        callback("\n".join(out_lines))
+                    out_lines.clear()
+                    last_flush = time.monotonic()
+                    flush_scheduled = False
+
+            def forward(data: bytes):
+                # 整块解码后去掉空行
+                nonlocal flush_scheduled
+                if not data:
+                    return
+                text = data.decode("utf-8", "replace")
+                with out_lock:
+                    out_lines.extend(line for line in map(str.strip, text.splitlines()) if line)
+                    due = len(out_lines) >= 16 or time.monotonic() - last_flush > 0.03
+                    schedule = bool(out_lines) and not due and not flush_scheduled
+                    if schedule:
+                        flush_scheduled = True
+                if due:
+                    flush_lines()
+                elif schedule:
+                    self.after(30, flush_lines)
+
+            # 以 64KiB 为单位读取输出，只转发完整的行，末尾不完整的部分留到下一块
+            pending = b""
+            while True:
+                chunk = process.stdout.read(65536)
+                if not chunk:
+                    break
+                complete, _, pending = (pending + chunk).rpartition(b"\n")
+                forward(complete)
+            forward(pending)
+
+            # 输出结束：立即转发剩余的行，之后触发的定时器只会看到空缓冲
             process.wait()
+            flush_lines()
 
             success = process.returncode == 0
             if callback:
@@ -5408,10 +5854,10 @@ class MainApp(ctk.CTk):
         statusbar = ctk.CTkFrame(
             self,
             height=38,
-            fg_color=(self.colors["bg_elevated"], self.colors["bg_elevated_dark"]),
+            fg_color=self.theme.bg_elevated,
             corner_radius=10,
             border_width=1,
-            border_color=(self.colors["border"], self.colors["border_dark"])
+            border_color=self.theme.border
         )
         statusbar.grid(row=3, column=0, sticky="ew", padx=32, pady=(8, 20))
 
@@ -5425,15 +5871,15 @@ class MainApp(ctk.CTk):
             width=7,
             height=7,
             corner_radius=4,
-            fg_color=(self.colors["success"], self.colors["success"])
+            fg_color=self.theme.success
         )
         self.status_dot.pack(side="left", padx=(0, 8))
 
         self.status_label = ctk.CTkLabel(
             left_container,
             text="就绪",
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
+            font=self._font(10),
+            text_color=self.theme.text_muted
         )
         self.status_label.pack(side="left")
 
@@ -5441,8 +5887,8 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             statusbar,
             text="7OZP1K v3.0 • AI编程助手",
-            text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
-            font=ctk.CTkFont(size=10, family="Microsoft YaHei UI"),
+            text_color=self.theme.text_muted,
+            font=self._font(10),
         ).pack(side="right", padx=14)
 
     # ----------------------------------------------------------
@@ -5489,77 +5935,142 @@ class MainApp(ctk.CTk):
             self.configure(fg_color=bg_color)
 
     def _update_char_count(self, event=None):
-        """更新字数统计"""
-        text = self.idea_textbox.get("1.0", "end-1c")
-        count = len(text.strip())
+        """更新字数统计（连续输入合并为一次计算）"""
+        if self._char_count_pending is not None:
+            return
+        self._char_count_pending = self.after(50, self._do_char_count)
+
+    def _do_char_count(self):
+        """实际执行字数统计：由 Tk 定位首尾非空白并计数，不把内容取到 Python"""
+        self._char_count_pending = None
+        tk_text = self.idea_textbox._textbox
+        count = 0
+        first = tk_text.search(r"\S", "1.0", stopindex="end", regexp=True)
+        if first:
+            last = tk_text.search(r"\S", "end-1c", backwards=True, regexp=True)
+            result = tk_text.count(first, f"{last}+1c", "chars")
+            count = result[0] if result else 0
         self.char_count_label.configure(text=f"{count} 字")
 
+    def _get_optimize_client(self):
+        """获取AI优化客户端，配置未变时复用已建立的连接"""
+        key = (self.api_config.api_key, self.api_config.base_url)
+        if self._anthropic_client is None or self._anthropic_client_key != key:
+            import anthropic
+            import httpx
+
+            if self._anthropic_client is not None:
+                self._anthropic_client.close()
+            self._anthropic_client = anthropic.Anthropic(
+                api_key=self.api_config.api_key,
+                base_url=self.api_config.base_url,
+                http_client=httpx.Client(
+                    # 读超时兜底：连接挂起时不会无限阻塞在流上
+                    timeout=httpx.Timeout(60.0, read=30.0),
+                    limits=httpx.Limits(max_keepalive_connections=4),
+                ),
+            )
+            self._anthropic_client_key = key
+        return self._anthropic_client
+
     def _optimize_input(self):
         """AI优化用户输入 - 使用haiku 4.5专业优化文本"""
-        text = self.idea_textbox.get("1.0", "end-1c").strip()
+        original = self.idea_textbox.get("1.0", "end-1c")
+        text = original.strip()
 
         if not text:
             self._show_message("提示", "请先输入需要优化的内容")
             return
 
+        # 过短的文本没有优化空间，直接保留原文
+        if len(text) < _OPTIMIZE_MIN_CHARS:
+            self._set_status("文本已足够简洁")
+            return
+
+        # 同样的原文优化过则直接复用结果
+        text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        cached = _OPTIMIZE_CACHE.get(text_hash)
+        if cached is not None:
+            _OPTIMIZE_CACHE.move_to_end(text_hash)
+            self.idea_textbox.delete("1.0", "end")
+            self.idea_textbox.insert("1.0", cached)
+            self._update_char_count()
+            self._set_status("✅ 输入已优化")
+            return
+
         if not self.api_config.is_configured():
             self._show_message("错误", "请先在设置中配置API密钥")
             return
 
-        # 禁用按钮防止重复点击
+        # 禁用按钮防止重复点击；流式回显期间锁定输入框，避免用户输入与回显交错
         self.optimize_btn.configure(state="disabled", text="优化中...")
-        self.status_label.configure(text="AI优化中...")
+        self.idea_textbox.configure(state="disabled")
+        self._set_status("AI优化中...")
+
+        def write_idea(chunk: str, replace: bool = False):
+            """向已锁定的输入框写入回显内容"""
+            self.idea_textbox.configure(state="normal")
+            if replace:
+                self.idea_textbox.delete("1.0", "end")
+            self.idea_textbox.insert("end", chunk)
+            self.idea_textbox.configure(state="disabled")
 
         def worker():
             try:
-                import anthropic
+                import httpx
 
-                # 使用haiku 4.5模型进行优化
-                client = anthropic.Anthropic(
-                    api_key=self.api_config.api_key,
-                    base_url=self.api_config.base_url
-                )
+                client = self._get_optimize_client()
 
-                optimize_prompt = f"""你是一个专业的技术文档优化专家。请将以下用户输入优化为更专业、清晰的技术需求描述。
+                optimize_prompt = _OPTIMIZE_PROMPT_TEMPLATE.format_map({"text": text})
 
-要求：
-1. 保持原意不变，不要添加用户没有提到的技术或功能
-2. 使用专业术语，但保持简洁
-3. 结构化表达，条理清晰
-4. 字数控制在原文的1.2倍以内
-5. 如果是中文就用中文回复，英文就用英文
-
-用户原文：
-{text}
-
-请直接输出优化后的文本，不要包含任何解释或前言："""
-
-                response = client.messages.create(
+                # 流式接收：首个分片到达即替换输入框内容并逐段回显
+                # 读超时作用在请求本身，连接挂起 30 秒无数据即报错
+                chunks = []
+                with client.messages.stream(
                     model="claude-haiku-4-5-20251001",  # 使用haiku 4.5
                     max_tokens=1024,
                     messages=[
                         {"role": "user", "content": optimize_prompt}
-                    ]
-                )
+                    ],
+                    timeout=httpx.Timeout(30.0, read=30.0),
+                ) as stream:
+                    for chunk in stream.text_stream:
+                        if not chunk:
+                            continue
+                        self.after(0, write_idea, chunk, not chunks)
+                        chunks.append(chunk)
 
-                optimized_text = response.content[0].text.strip()
+                optimized_text = "".join(chunks).strip()
 
                 def on_success():
                     # 更新文本框内容
+                    self.idea_textbox.configure(state="normal")
                     self.idea_textbox.delete("1.0", "end")
                     self.idea_textbox.insert("1.0", optimized_text)
                     self._update_char_count()
 
+                    if optimized_text:
+                        _OPTIMIZE_CACHE[text_hash] = optimized_text
+                        if len(_OPTIMIZE_CACHE) > _OPTIMIZE_CACHE_SIZE:
+                            _OPTIMIZE_CACHE.popitem(last=False)
+
                     self.optimize_btn.configure(state="normal", text="AI优化")
-                    self.status_label.configure(text="✅ 输入已优化")
+                    self._set_status("✅ 输入已优化")
 
                 self.after(0, on_success)
 
             except Exception as e:
+                error_msg = str(e)
+
                 def on_error():
+                    # 丢弃已回显的部分结果，恢复用户原文
+                    self.idea_textbox.configure(state="normal")
+                    self.idea_textbox.delete("1.0", "end")
+                    self.idea_textbox.insert("1.0", original)
+                    self._update_char_count()
                     self.optimize_btn.configure(state="normal", text="AI优化")
-                    self.status_label.configure(text="❌ 优化失败")
-                    self._show_message("错误", f"优化失败: {str(e)}")
+                    self._set_status("❌ 优化失败")
+                    self._show_message("错误", f"优化失败: {error_msg}")
 
                 self.after(0, on_error)
 
@@ -5604,7 +6115,7 @@ class MainApp(ctk.CTk):
         self._generating = True
         self.generate_btn.configure(state="disabled")
         self.progress_label.configure(text="正在生成...")
-        self.status_label.configure(text="生成中...")
+        self._set_status("生成中...")
 
         # 收集项目信息(包括上传的文件)
         self.current_project_info = ProjectInfo(
@@ -5616,21 +6127,28 @@ class MainApp(ctk.CTk):
             uploaded_files=self.uploaded_files.copy(),
         )
 
+        project_info = self.current_project_info
+
         def worker():
             try:
                 prompt = self.prompt_service.generate(
-                    self.current_project_info,
+                    project_info,
                     callback=lambda msg: self.after(
                         0, lambda: self.progress_label.configure(text=msg)
                     ),
+                    stream_callback=self._queue_output_chunk,
                 )
 
+                # 生成完成后再读取、追加并写回历史，避免覆盖生成期间的删除或清空
+                history = self._add_to_history(prompt, project_info)
+
                 def on_success():
                     self.current_prompt = prompt
-                    self._display_prompt(prompt)
-                    self._add_to_history()
+                    self._finish_output_stream(prompt)
+                    if history is not None:
+                        self._refresh_history(history)
 
-                    self.status_label.configure(text="✅ 生成完成")
+                    self._set_status("✅ 生成完成")
                     self.progress_label.configure(text="")
                     self._generating = False
                     self.generate_btn.configure(state="normal")
@@ -5641,7 +6159,8 @@ class MainApp(ctk.CTk):
 
             except Exception as e:
                 def on_error():
-                    self.status_label.configure(text="❌ 生成失败")
+                    self._abort_output_stream()
+                    self._set_status("❌ 生成失败")
                     self.progress_label.configure(text="")
                     self._generating = False
                     self.generate_btn.configure(state="normal")
@@ -5651,6 +6170,73 @@ class MainApp(ctk.CTk):
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _queue_output_chunk(self, chunk: str):
+        """暂存流式生成的文本分片（后台线程调用），合并后由主线程写入输出框"""
+        with self._log_lock:
+            self._stream_chunks.append(chunk)
+            if self._stream_flush_pending:
+                return
+            self._stream_flush_pending = True
+        self.after(30, self._flush_output_chunks)
+
+    def _flush_output_chunks(self):
+        """将暂存的分片追加到输出框，首个分片到达时新建结果页并切换过去"""
+        with self._log_lock:
+            text = "".join(self._stream_chunks)
+            self._stream_chunks.clear()
+            self._stream_flush_pending = False
+        if not text:
+            return
+
+        page = self._streaming_page
+        if page is None:
+            page = {"title": "初始生成", "content": ""}
+            self._streaming_page = page
+            self._stream_prev_state = (
+                self.conversation_pages, self.current_page_index, self.current_prompt
+            )
+            self.conversation_pages = [page]
+            self.current_page_index = 0
+            self._update_page_display()
+            self._switch_content("output")
+
+        page["content"] += text
+        self.output_textbox.configure(state="normal")
+        self.output_textbox.insert("end", text)
+        self.output_textbox.configure(state="disabled")
+        self.output_textbox.see("end")
+        # 输出框内容已与页面内容一致，翻页刷新时无需重写
+        self._displayed_content = page["content"]
+
+    def _finish_output_stream(self, prompt: str):
+        """流式生成结束：以完整结果收尾，未收到任何分片时按原方式整体显示"""
+        self._flush_output_chunks()
+        page = self._streaming_page
+        self._streaming_page = None
+        self._stream_prev_state = None
+        if page is None:
+            self._display_prompt(prompt)
+            return
+
+        if page["content"] != prompt:
+            page["content"] = prompt
+        self._update_page_display()
+
+    def _abort_output_stream(self):
+        """流式生成失败：丢弃未完成的结果页，恢复生成前的分页和当前提示词"""
+        with self._log_lock:
+            self._stream_chunks.clear()
+        page = self._streaming_page
+        self._streaming_page = None
+        prev = self._stream_prev_state
+        self._stream_prev_state = None
+        if page is None or prev is None:
+            return
+
+        self.conversation_pages, self.current_page_index, current_prompt = prev
+        self._update_page_display()
+        self.current_prompt = current_prompt
+
     def _display_prompt(self, prompt: str):
         """显示生成的提示词"""
         # 清空之前的分页，添加新的初始页
@@ -5674,49 +6260,65 @@ class MainApp(ctk.CTk):
         self.current_page_index = len(self.conversation_pages) - 1
         self._update_page_display()
 
+    def _set_page_widget(self, name: str, **kwargs):
+        """仅在属性值变化时配置翻页相关控件，减少 Tk 调用"""
+        applied = self._page_ui_state.setdefault(name, {})
+        changed = {k: v for k, v in kwargs.items() if applied.get(k) != v}
+        if changed:
+            getattr(self, name).configure(**changed)
+            applied.update(changed)
+
     def _update_page_display(self):
         """更新页面显示"""
         if not self.conversation_pages:
-            self.output_textbox.configure(state="normal")
-            self.output_textbox.delete("1.0", "end")
-            self.output_textbox.configure(state="disabled")
-            self.page_label.configure(text="0 / 0")
-            self.page_title_label.configure(text="")
-            self.prev_page_btn.configure(state="disabled")
-            self.next_page_btn.configure(state="disabled")
-            self.word_count_label.configure(text="字数: 0")
-            self.line_count_label.configure(text="行数: 0")
+            if self._displayed_content is not None:
+                self.output_textbox.configure(state="normal")
+                self.output_textbox.delete("1.0", "end")
+                self.output_textbox.configure(state="disabled")
+                self._displayed_content = None
+            self._set_page_widget("page_label", text="0 / 0")
+            self._set_page_widget("page_title_label", text="")
+            self._set_page_widget("prev_page_btn", state="disabled")
+            self._set_page_widget("next_page_btn", state="disabled")
+            self._set_page_widget("word_count_label", text="字数: 0")
+            self._set_page_widget("line_count_label", text="行数: 0")
             return
 
         # 获取当前页
         page = self.conversation_pages[self.current_page_index]
         content = page["content"]
 
-        # 更新文本框
-        self.output_textbox.configure(state="normal")
-        self.output_textbox.delete("1.0", "end")
-        self.output_textbox.insert("1.0", content)
-        self.output_textbox.configure(state="disabled")
+        # 更新文本框（内容与当前显示的是同一对象时无需重写）
+        if content is not self._displayed_content:
+            self.output_textbox.configure(state="normal")
+            self.output_textbox.delete("1.0", "end")
+            self.output_textbox.insert("1.0", content)
+            self.output_textbox.configure(state="disabled")
+            self._displayed_content = content
 
         # 更新页码
         total = len(self.conversation_pages)
-        self.page_label.configure(text=f"{self.current_page_index + 1} / {total}")
-        self.page_title_label.configure(text=page["title"])
+        self._set_page_widget("page_label", text=f"{self.current_page_index + 1} / {total}")
+        self._set_page_widget("page_title_label", text=page["title"])
 
         # 更新当前提示词（用于复制）
         self.current_prompt = content
 
         # 更新翻页按钮状态
-        self.prev_page_btn.configure(
-            state="normal" if self.current_page_index > 0 else "disabled"
+        self._set_page_widget(
+            "prev_page_btn",
+            state="normal" if self.current_page_index > 0 else "disabled",
         )
-        self.next_page_btn.configure(
-            state="normal" if self.current_page_index < total - 1 else "disabled"
+        self._set_page_widget(
+            "next_page_btn",
+            state="normal" if self.current_page_index < total - 1 else "disabled",
         )
 
-        # 更新统计
-        self.word_count_label.configure(text=f"字数: {len(content)}")
-        self.line_count_label.configure(text=f"行数: {len(content.splitlines())}")
+        # 更新统计（行数直接取 Tk 的末尾索引，无需拆分整页文本）
+        line, col = map(int, self.output_textbox.index("end-1c").split("."))
+        line_count = line if col else line - 1
+        self._set_page_widget("word_count_label", text=f"字数: {len(content)}")
+        self._set_page_widget("line_count_label", text=f"行数: {line_count}")
 
     def _prev_page(self):
         """上一页"""
@@ -5737,7 +6339,7 @@ class MainApp(ctk.CTk):
         self.current_prompt = ""
         self.prompt_service.reset_conversation()
         self._update_page_display()
-        self.status_label.configure(text="✅ 已清空所有内容")
+        self._set_status("✅ 已清空所有内容")
 
     def _copy_prompt(self):
         """复制提示词"""
@@ -5747,12 +6349,11 @@ class MainApp(ctk.CTk):
 
         self.clipboard_clear()
         self.clipboard_append(self.current_prompt)
-        self.status_label.configure(text="✅ 已复制到剪贴板")
+        self._set_status("✅ 已复制到剪贴板")
 
     def _get_website_names(self) -> list:
         """获取所有AI网站名称列表"""
-        websites = DataManager.get_all_ai_websites()
-        return list(websites.keys())
+        return list(self._ai_websites())
 
     def _copy_and_jump(self, website_name: str):
         """复制提示词并跳转到AI网站"""
@@ -5774,12 +6375,12 @@ class MainApp(ctk.CTk):
         self.clipboard_append(self.current_prompt)
 
         # 获取网站URL
-        websites = DataManager.get_all_ai_websites()
+        websites = self._ai_websites()
         if website_name in websites:
             url = websites[website_name].get("url", "")
             if url:
                 webbrowser.open(url)
-                self.status_label.configure(text=f"✅ 已复制并跳转到 {website_name}")
+                self._set_status(f"✅ 已复制并跳转到 {website_name}")
             else:
                 self._show_message("错误", f"网站 {website_name} 的URL为空")
         else:
@@ -5791,7 +6392,7 @@ class MainApp(ctk.CTk):
     def _refresh_website_menu(self):
         """刷新网站下拉菜单"""
         websites = self._get_website_names()
-        self.jump_website_menu.configure(values=websites)
+        self._set_menu_values(self.jump_website_menu, websites)
         self.jump_website_menu.set("🚀 跳转")
 
     def _add_favorite(self):
@@ -5823,6 +6424,8 @@ class MainApp(ctk.CTk):
             self._show_message("警告", "没有可导出的提示词")
             return
 
+        from tkinter import filedialog
+
         filepath = filedialog.asksaveasfilename(
             defaultextension=".md",
             filetypes=[
@@ -5833,7 +6436,7 @@ class MainApp(ctk.CTk):
         )
 
         if filepath:
-            if FileService.export_text(self.current_prompt, filepath):
+            if _services().FileService.export_text(self.current_prompt, filepath):
                 self._show_message("成功", f"已导出到: {filepath}")
             else:
                 self._show_message("错误", "导出失败")
@@ -5864,95 +6467,178 @@ class MainApp(ctk.CTk):
     #                       历史记录
     # ----------------------------------------------------------
 
-    def _add_to_history(self):
-        """添加到历史记录"""
-        if self.current_prompt and self.current_project_info:
-            record = HistoryRecord(
-                timestamp=datetime.now().isoformat(),
-                language=self.current_project_info.language,
-                framework=self.current_project_info.framework,
-                idea_preview=self.current_project_info.idea[:50] + "...",
-                prompt=self.current_prompt,
-            )
-            DataManager.add_history(record)
-            self._refresh_history()
+    def _add_to_history(self, prompt: str, project_info: ProjectInfo) -> Optional[list]:
+        """添加到历史记录（可在后台线程调用）
 
-    def _refresh_history(self):
-        """刷新历史记录"""
-        # 清空现有内容
-        for widget in self.history_frame.winfo_children():
-            widget.destroy()
+        Args:
+            prompt: 生成的提示词
+            project_info: 对应的项目信息
+
+        Returns:
+            写入后的历史列表，未写入时返回 None
+        """
+        if not (prompt and project_info):
+            return None
 
+        now = datetime.now()
+        record = HistoryRecord(
+            timestamp=now.isoformat(),
+            timestamp_display=now.strftime("%Y-%m-%d %H:%M:%S"),
+            language=project_info.language,
+            framework=project_info.framework,
+            idea_preview=project_info.idea[:50] + "...",
+            prompt=prompt,
+        )
         history = DataManager.load_history()
+        DataManager.add_history(record, history)
+        return history
+
+    def _refresh_history(self, history: Optional[list] = None):
+        """刷新历史记录
+
+        Args:
+            history: 已读取的历史列表，为 None 时从磁盘读取
+        """
+        if history is None:
+            history = DataManager.load_history()
+        pool = self._history_item_pool
+        self._history_render_token += 1
 
         # 更新徽章数量
         if hasattr(self, 'history_count_badge'):
             self.history_count_badge.configure(text=f"{len(history)} 条记录")
 
         if not history:
+            for item in pool:
+                item["frame"].grid_remove()
+
             # 空状态提示
-            empty_frame = ctk.CTkFrame(self.history_frame, fg_color="transparent")
-            empty_frame.grid(row=0, column=0, sticky="nsew", pady=60)
+            if self._history_empty_frame is None:
+                empty_frame = ctk.CTkFrame(self.history_frame, fg_color="transparent")
+                empty_frame.grid(row=0, column=0, sticky="nsew", pady=60)
 
-            ctk.CTkLabel(
-                empty_frame,
-                text="📭",
-                font=ctk.CTkFont(size=48)
-            ).pack()
+                ctk.CTkLabel(
+                    empty_frame,
+                    text="📭",
+                    font=self._font(48, family=None)
+                ).pack()
 
-            ctk.CTkLabel(
-                empty_frame,
-                text="暂无历史记录",
-                font=ctk.CTkFont(size=16, weight="bold", family="Microsoft YaHei UI"),
-                text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
-            ).pack(pady=(12, 4))
+                ctk.CTkLabel(
+                    empty_frame,
+                    text="暂无历史记录",
+                    font=self._font(16, "bold"),
+                    text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
+                ).pack(pady=(12, 4))
 
-            ctk.CTkLabel(
-                empty_frame,
-                text="生成提示词后会自动保存到这里",
-                font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
-                text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
-            ).pack()
+                ctk.CTkLabel(
+                    empty_frame,
+                    text="生成提示词后会自动保存到这里",
+                    font=self._font(12),
+                    text_color=(self.colors["text_muted"], self.colors["text_muted_dark"])
+                ).pack()
+                self._history_empty_frame = empty_frame
+            else:
+                self._history_empty_frame.grid()
             return
 
-        # 倒序显示，最新的在前面
-        for i, record in enumerate(reversed(history)):
-            # 计算实际索引（因为是倒序，需要转换）
-            actual_index = len(history) - 1 - i
-            self._create_history_item(i, record, actual_index)
+        if self._history_empty_frame is not None:
+            self._history_empty_frame.grid_remove()
 
-    def _create_history_item(self, row: int, record: dict, actual_index: int):
-        """创建历史记录项 - UI-UX-PRO-MAX 高级风格"""
-        item = ctk.CTkFrame(
-            self.history_frame,
-            fg_color=(self.colors["bg_base"], self.colors["bg_base_dark"]),
-            corner_radius=10,
-            border_width=1,
-            border_color=(self.colors["border"], self.colors["border_dark"])
-        )
+        # 多余的行隐藏而不销毁，其余分批填充
+        for item in pool[len(history):]:
+            item["frame"].grid_remove()
+        self._fill_history_batch(history, 0, self._history_render_token)
+
+    def _fill_history_batch(self, history: list, start: int, token: int):
+        """填充一批历史项（池中行数不足时补建），剩余的在空闲时继续
+
+        token 与最新一次刷新不一致时说明列表已被重新刷新，放弃剩余批次。
+        """
+        if token != self._history_render_token:
+            return
+
+        pool = self._history_item_pool
+        last = len(history) - 1
+        end = min(start + _CARD_BATCH_SIZE, len(history))
+        # 倒序显示，最新的在前面；last - i 为记录在原列表中的位置
+        for i in range(start, end):
+            if i == len(pool):
+                pool.append(self._create_history_item(i))
+            self._fill_history_item(pool[i], history[last - i], last - i)
+
+        if end < len(history):
+            self.after_idle(self._fill_history_batch, history, end, token)
+
+    def _history_item_styles(self) -> dict:
+        """历史项各控件的固定样式参数，首次使用时构建一次，之后每行直接展开复用"""
+        styles = getattr(self, "_history_styles", None)
+        if styles is None:
+            c = self.colors
+            muted = (c["text_muted"], c["text_muted_dark"])
+            hover = (c["bg_hover"], c["bg_hover_dark"])
+            styles = self._history_styles = {
+                "item": dict(
+                    fg_color=(c["bg_base"], c["bg_base_dark"]),
+                    corner_radius=10,
+                    border_width=1,
+                    border_color=(c["border"], c["border_dark"]),
+                ),
+                "icon_box": dict(width=50, height=50, fg_color=hover, corner_radius=8),
+                "icon": dict(text="📜", font=self._font(22, family=None)),
+                "time": dict(
+                    text="",
+                    font=self._font(13, "bold"),
+                    text_color=(c["text_primary"], c["text_primary_dark"]),
+                ),
+                "lang": dict(
+                    text="",
+                    font=self._font(9),
+                    text_color="white",
+                    fg_color=c["primary"],
+                    corner_radius=4,
+                    padx=6,
+                    pady=1,
+                ),
+                "preview": dict(text="", font=self._font(11), text_color=muted, anchor="w"),
+                "load_btn": dict(
+                    text="加载",
+                    font=self._font(12),
+                    width=70,
+                    height=34,
+                    corner_radius=8,
+                    fg_color=c["primary"],
+                    hover_color=c["primary_hover"],
+                ),
+                "delete_btn": dict(
+                    text="🗑",
+                    font=self._font(14, family=None),
+                    width=40,
+                    height=34,
+                    corner_radius=8,
+                    fg_color=hover,
+                    hover_color=c["error"],
+                    text_color=muted,
+                ),
+            }
+        return styles
+
+    def _create_history_item(self, row: int) -> dict:
+        """创建历史记录项 - UI-UX-PRO-MAX 高级风格
+
+        只搭建控件骨架，内容由 _fill_history_item 填充。
+        """
+        styles = self._history_item_styles()
+
+        item = ctk.CTkFrame(self.history_frame, **styles["item"])
         item.grid(row=row, column=0, sticky="ew", padx=0, pady=6)
         item.grid_columnconfigure(1, weight=1)
 
-        timestamp = record.get("timestamp", "")[:19].replace("T", " ")
-        lang = record.get("language", "")
-        preview = record.get("idea_preview", "")
-
         # 左侧时间图标
-        time_frame = ctk.CTkFrame(
-            item,
-            width=50,
-            height=50,
-            fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-            corner_radius=8
-        )
+        time_frame = ctk.CTkFrame(item, **styles["icon_box"])
         time_frame.grid(row=0, column=0, sticky="w", padx=16, pady=16)
         time_frame.grid_propagate(False)
 
-        ctk.CTkLabel(
-            time_frame,
-            text="📜",
-            font=ctk.CTkFont(size=22)
-        ).place(relx=0.5, rely=0.5, anchor="center")
+        ctk.CTkLabel(time_frame, **styles["icon"]).place(relx=0.5, rely=0.5, anchor="center")
 
         # 中间信息区
         info_frame = ctk.CTkFrame(item, fg_color="transparent")
@@ -5962,63 +6648,58 @@ class MainApp(ctk.CTk):
         title_row = ctk.CTkFrame(info_frame, fg_color="transparent")
         title_row.pack(fill="x")
 
-        ctk.CTkLabel(
-            title_row,
-            text=timestamp,
-            font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
-        ).pack(side="left")
+        time_label = ctk.CTkLabel(title_row, **styles["time"])
+        time_label.pack(side="left")
 
-        # 语言标签
-        if lang:
-            ctk.CTkLabel(
-                title_row,
-                text=lang,
-                font=ctk.CTkFont(size=9, family="Microsoft YaHei UI"),
-                text_color="white",
-                fg_color=self.colors["primary"],
-                corner_radius=4,
-                padx=6,
-                pady=1
-            ).pack(side="left", padx=(8, 0))
+        # 语言标签（有语言时才显示）
+        lang_label = ctk.CTkLabel(title_row, **styles["lang"])
 
         # 预览内容
-        ctk.CTkLabel(
-            info_frame,
-            text=preview if preview else "无描述",
-            font=ctk.CTkFont(size=11, family="Microsoft YaHei UI"),
-            text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
-            anchor="w"
-        ).pack(fill="x", pady=(4, 0))
+        preview_label = ctk.CTkLabel(info_frame, **styles["preview"])
+        preview_label.pack(fill="x", pady=(4, 0))
 
         # 右侧按钮区
         btn_frame = ctk.CTkFrame(item, fg_color="transparent")
         btn_frame.grid(row=0, column=2, sticky="e", padx=16, pady=16)
 
-        ctk.CTkButton(
-            btn_frame,
-            text="加载",
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI"),
-            width=70,
-            height=34,
-            corner_radius=8,
-            fg_color=self.colors["primary"],
-            hover_color=self.colors["primary_hover"],
-            command=lambda r=record: self._load_history_item(r),
-        ).pack(side="left", padx=(0, 8))
+        load_btn = ctk.CTkButton(btn_frame, **styles["load_btn"])
+        load_btn.pack(side="left", padx=(0, 8))
 
-        ctk.CTkButton(
-            btn_frame,
-            text="🗑",
-            font=ctk.CTkFont(size=14),
-            width=40,
-            height=34,
-            corner_radius=8,
-            fg_color=(self.colors["bg_hover"], self.colors["bg_hover_dark"]),
-            hover_color=self.colors["error"],
-            text_color=(self.colors["text_muted"], self.colors["text_muted_dark"]),
-            command=lambda idx=actual_index: self._delete_history_item(idx),
-        ).pack(side="left")
+        delete_btn = ctk.CTkButton(btn_frame, **styles["delete_btn"])
+        delete_btn.pack(side="left")
+
+        return {
+            "frame": item,
+            "time_label": time_label,
+            "lang_label": lang_label,
+            "preview_label": preview_label,
+            "load_btn": load_btn,
+            "delete_btn": delete_btn,
+        }
+
+    def _fill_history_item(self, item: dict, record: dict, actual_index: int):
+        """将一条历史记录写入池中的历史项"""
+        timestamp = (
+            record.get("timestamp_display")
+            or record.get("timestamp", "")[:19].replace("T", " ")
+        )
+        lang = record.get("language", "")
+        preview = record.get("idea_preview", "")
+
+        item["time_label"].configure(text=timestamp)
+
+        lang_label = item["lang_label"]
+        if lang:
+            lang_label.configure(text=lang)
+            if not lang_label.winfo_manager():
+                lang_label.pack(side="left", padx=(8, 0))
+        elif lang_label.winfo_manager():
+            lang_label.pack_forget()
+
+        item["preview_label"].configure(text=preview if preview else "无描述")
+        item["load_btn"].configure(command=lambda r=record: self._load_history_item(r))
+        item["delete_btn"].configure(command=lambda idx=actual_index: self._delete_history_item(idx))
+        item["frame"].grid()
 
     def _delete_history_item(self, index: int):
         """删除单条历史记录"""
@@ -6046,8 +6727,16 @@ class MainApp(ctk.CTk):
     # ----------------------------------------------------------
 
     def _check_pyinstaller(self):
-        """检查 PyInstaller 状态"""
-        if PyInstallerService.is_installed():
+        """检查 PyInstaller 状态（后台探测，避免阻塞界面）"""
+        def worker():
+            installed = _is_pyinstaller_installed_cached()
+            self.after(0, lambda: self._apply_pyinstaller_status(installed))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _apply_pyinstaller_status(self, installed: bool):
+        """更新打包页顶部的 PyInstaller 状态"""
+        if installed:
             self.pyinstaller_status.configure(
                 text="✅ PyInstaller 已安装",
                 text_color="green",
@@ -6060,6 +6749,8 @@ class MainApp(ctk.CTk):
 
     def _select_script(self):
         """选择脚本文件（支持多选）"""
+        from tkinter import filedialog
+
         filepaths = filedialog.askopenfilenames(
             filetypes=[("Python文件", "*.py")],
         )
@@ -6072,12 +6763,16 @@ class MainApp(ctk.CTk):
 
     def _select_output_dir(self):
         """选择输出目录"""
+        from tkinter import filedialog
+
         directory = filedialog.askdirectory()
         if directory:
             self.output_dir_var.set(directory)
 
     def _select_icon(self):
         """选择图标文件（支持多种图片格式）"""
+        from tkinter import filedialog
+
         filepath = filedialog.askopenfilename(
             filetypes=[
                 ("图标和图片文件", "*.ico *.png *.jpg *.jpeg *.bmp *.gif"),
@@ -6090,32 +6785,50 @@ class MainApp(ctk.CTk):
         if filepath:
             self.icon_path_var.set(filepath)
 
+    def _cached_ico(self, image_path: str, output_dir: str) -> str:
+        """获取图片对应的 ICO 文件，源图片和输出目录都未变化时复用上次的转换结果"""
+        st = os.stat(image_path)
+        key = (image_path, st.st_mtime_ns, st.st_size, os.path.abspath(output_dir))
+        cached = _ICO_CACHE.get(key)
+        if cached:
+            ico_path, ico_mtime = cached
+            try:
+                # 输出文件可能已被其他图标的转换覆盖，需同时校验其修改时间
+                if os.stat(ico_path).st_mtime_ns == ico_mtime:
+                    return ico_path
+            except OSError:
+                pass
+
+        ico_path = self._convert_image_to_ico(image_path, output_dir)
+        _ICO_CACHE[key] = (ico_path, os.stat(ico_path).st_mtime_ns)
+        return ico_path
+
     def _convert_image_to_ico(self, image_path: str, output_dir: str) -> str:
         """将图片转换为 ICO 格式"""
         try:
             from PIL import Image
 
-            img = Image.open(image_path)
-
-            # 转换为 RGBA 模式
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
+            with Image.open(image_path) as src:
+                # 转换为 RGBA 模式（convert 会读入像素，之后即可释放源文件）
+                img = src.convert('RGBA') if src.mode != 'RGBA' else src.copy()
 
             # 生成多尺寸图标
             ico_path = os.path.join(output_dir, "app_icon.ico")
 
-            # 创建多尺寸图标 (Windows 需要多种尺寸)
-            sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-            icons = []
-            for size in sizes:
-                resized = img.resize(size, Image.Resampling.LANCZOS)
-                icons.append(resized)
+            # 只生成 Windows 实际使用的尺寸：高质量缩放一次到 256，
+            # 小尺寸再从 256 图用双线性缩放得到
+            base = img.resize((256, 256), Image.Resampling.LANCZOS)
+            img.close()
+            icons = [base] + [
+                base.resize(size, Image.Resampling.BILINEAR)
+                for size in ((48, 48), (16, 16))
+            ]
 
             # 保存为 ICO
-            icons[0].save(
+            base.save(
                 ico_path,
                 format='ICO',
-                sizes=[(s.width, s.height) for s in icons],
+                sizes=[icon.size for icon in icons],
                 append_images=icons[1:]
             )
 
@@ -6130,7 +6843,7 @@ class MainApp(ctk.CTk):
         """打开输出目录"""
         output_dir = self.output_dir_var.get()
         if output_dir:
-            FileService.open_directory(output_dir)
+            _services().FileService.open_directory(output_dir)
 
     def _start_packaging(self):
         """开始打包（支持多文件）"""
@@ -6144,7 +6857,7 @@ class MainApp(ctk.CTk):
         name = self.program_name_var.get().strip()
 
         # 清空日志并输出调试信息
-        self.pack_log_textbox.delete("1.0", "end")
+        self._clear_log("pack_log_textbox")
         self._append_pack_log("[DEBUG] ===== 打包参数检查 =====")
         self._append_pack_log(f"[DEBUG] 脚本路径: '{script_paths_str}'")
         self._append_pack_log(f"[DEBUG] 输出目录: '{output_dir}'")
@@ -6163,7 +6876,7 @@ class MainApp(ctk.CTk):
             self._append_pack_log("[ERROR] 未选择输出目录")
             return
 
-        if not PyInstallerService.is_installed():
+        if not _is_pyinstaller_installed_cached():
             self._show_message("错误", "请先安装 PyInstaller")
             self._append_pack_log("[ERROR] PyInstaller 未安装")
             return
@@ -6177,11 +6890,10 @@ class MainApp(ctk.CTk):
         self._append_pack_log(f"[DEBUG] 附加文件: {additional_files}")
         self._append_pack_log("[DEBUG] ===== 开始打包 =====")
 
-        def log_callback(msg):
-            self.after(0, lambda: self._append_pack_log(msg))
+        log_callback = self._append_pack_log
 
         def worker():
-            success = PyInstallerService.build(
+            success = _services().PyInstallerService.build(
                 script_path=main_script,
                 output_dir=output_dir,
                 name=name,
@@ -6194,19 +6906,18 @@ class MainApp(ctk.CTk):
 
             def on_complete():
                 if success:
-                    self._show_message("成功", f"打包完成！\n输出目录: {output_dir}")
+                    self._set_status(f"✅ 打包完成，输出目录: {output_dir}", "success")
                 else:
                     self._show_message("失败", "打包失败，请查看日志")
 
             self.after(0, on_complete)
 
         threading.Thread(target=worker, daemon=True).start()
-        self._show_message("提示", "打包已开始，请查看日志...")
+        self._set_status("打包已开始，请查看日志...", "info")
 
     def _append_pack_log(self, msg: str):
         """追加打包日志"""
-        self.pack_log_textbox.insert("end", msg + "\n")
-        self.pack_log_textbox.see("end")
+        self._buffer_log("pack_log_textbox", msg)
 
     # ----------------------------------------------------------
     #                   文件上传功能
@@ -6238,33 +6949,8 @@ class MainApp(ctk.CTk):
 
     def _on_drop(self, event):
         """处理拖拽放下事件"""
-        files = event.data
-        # 解析文件路径（可能包含大括号）
-        if files.startswith('{'):
-            # 多个文件
-            file_list = []
-            current = ""
-            in_braces = False
-            for char in files:
-                if char == '{':
-                    in_braces = True
-                elif char == '}':
-                    in_braces = False
-                    if current:
-                        file_list.append(current)
-                        current = ""
-                elif in_braces:
-                    current += char
-                elif char == ' ' and not in_braces:
-                    if current:
-                        file_list.append(current)
-                        current = ""
-                else:
-                    current += char
-            if current:
-                file_list.append(current)
-        else:
-            file_list = files.split()
+        # 拖拽数据是 Tcl 列表格式，含空格的路径用大括号包裹，交给 Tcl 解析
+        file_list = list(self.tk.splitlist(event.data))
 
         self._process_dropped_files(file_list)
         self._on_drag_leave(None)
@@ -6290,113 +6976,126 @@ class MainApp(ctk.CTk):
         try:
             clipboard = self.clipboard_get()
             # 尝试解析为文件路径
-            lines = clipboard.strip().split('\n')
-            valid_files = []
-            for line in lines:
-                path = line.strip().strip('"')
-                if Path(path).exists() and Path(path).is_file():
-                    valid_files.append(path)
+            candidates = (m.strip() for m in _PATH_LINE_RE.findall(clipboard))
+            valid_files = [path for path in candidates if path and _is_regular_file(path)]
 
             if valid_files:
                 self._process_dropped_files(valid_files)
-                self.status_label.configure(text=f"✅ 已粘贴 {len(valid_files)} 个文件")
+                self._set_status(f"✅ 已粘贴 {len(valid_files)} 个文件")
         except Exception as e:
             logger.debug(f"粘贴处理失败: {e}")
 
     def _process_dropped_files(self, file_paths: list):
         """处理拖拽/粘贴的文件"""
-        for filepath in file_paths:
-            try:
-                filepath = filepath.strip()
-                if not filepath:
-                    continue
+        paths = [p.strip() for p in file_paths if p.strip()]
+        if paths:
+            self._ingest_files_async(paths, report_errors=False)
 
-                path = Path(filepath)
-                if not path.exists() or not path.is_file():
-                    continue
+    def _select_files(self):
+        """选择文件"""
+        if self._ingest_pending:
+            return
 
-                # 读取文件内容
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
+        from tkinter import filedialog
 
-                # 限制文件大小 (最大 1MB)
-                if len(content) > 1024 * 1024:
-                    self._show_message("警告", f"文件 {path.name} 过大，已跳过（最大1MB）")
-                    continue
+        filepaths = filedialog.askopenfilenames(filetypes=_FILETYPES)
+        if filepaths:
+            self._ingest_files_async(list(filepaths), report_errors=True)
 
-                # 添加到上传列表
-                file_info = {
-                    'filename': path.name,
-                    'content': content,
-                    'file_type': path.suffix,
-                    'size': len(content),
-                }
-                self.uploaded_files.append(file_info)
+    def _ingest_files_async(self, file_paths: list, report_errors: bool):
+        """在后台线程读取上传文件，读完后一次性加入上传列表
 
-            except Exception as e:
-                logger.error(f"处理文件失败 {filepath}: {e}")
+        Args:
+            file_paths: 文件路径列表
+            report_errors: 读取失败时是否弹窗提示（拖拽/粘贴只记录日志）
+        """
+        self._ingest_pending += 1
+        self.select_files_btn.configure(state="disabled")
 
-        self._update_files_display()
+        def worker():
+            file_infos = []
+            messages = []
+            for filepath in file_paths:
+                path = Path(filepath)
+                name = path.name
+                try:
+                    # 一次 stat 同时判断文件类型和大小
+                    st = path.stat()
+                    if not stat.S_ISREG(st.st_mode):
+                        continue
 
-    def _select_files(self):
-        """选择文件"""
-        filetypes = [
-            ("所有文件", "*.*"),
-            ("文本文件", "*.txt"),
-            ("Python文件", "*.py"),
-            ("JavaScript文件", "*.js"),
-            ("JSON文件", "*.json"),
-            ("Markdown文件", "*.md"),
-        ]
+                    # 限制文件大小 (最大 1MB)，过大的不读取
+                    size = st.st_size
+                    if size > 1024 * 1024:
+                        messages.append(("警告", f"文件 {name} 过大，已跳过（最大1MB）"))
+                        continue
 
-        filepaths = filedialog.askopenfilenames(filetypes=filetypes)
+                    # 读取文件内容（一次性解码，换行统一为 \n）
+                    content = path.read_bytes().decode('utf-8').replace('\r\n', '\n')
 
-        for filepath in filepaths:
-            try:
-                # 读取文件内容
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                    file_infos.append({
+                        'filename': name,
+                        'content': content,
+                        'file_type': path.suffix,
+                        'size': size,
+                    })
 
-                # 限制文件大小 (最大 1MB)
-                if len(content) > 1024 * 1024:
-                    self._show_message("警告", f"文件 {Path(filepath).name} 过大，已跳过（最大1MB）")
-                    continue
+                except Exception as e:
+                    logger.error(f"处理文件失败 {filepath}: {e}")
+                    if report_errors:
+                        messages.append(("错误", f"读取文件 {name} 失败: {str(e)}"))
+
+            def on_done():
+                self._ingest_pending -= 1
+                if not self._ingest_pending:
+                    self.select_files_btn.configure(state="normal")
 
                 # 添加到上传列表
-                file_info = {
-                    'filename': Path(filepath).name,
-                    'content': content,
-                    'file_type': Path(filepath).suffix,
-                    'size': len(content),
-                }
-                self.uploaded_files.append(file_info)
+                if file_infos:
+                    self.uploaded_files.extend(file_infos)
+                    self._update_files_display(append_only=file_infos)
 
-            except Exception as e:
-                self._show_message("错误", f"读取文件 {Path(filepath).name} 失败: {str(e)}")
+                for title, msg in messages:
+                    self._show_message(title, msg)
 
-        self._update_files_display()
+            self.after(0, on_done)
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def _clear_files(self):
         """清空文件列表"""
         self.uploaded_files.clear()
         self._update_files_display()
 
-    def _update_files_display(self):
-        """更新文件列表显示"""
+    @staticmethod
+    def _format_file_lines(files: list, start: int = 1) -> str:
+        """生成文件列表文本，每个文件一行：序号. 文件名 (大小 KB)"""
+        return "\n".join(
+            f"{i}. {fi.get('filename', '未知')} ({fi.get('size', 0) / 1024:.1f} KB)"
+            for i, fi in enumerate(files, start)
+        )
+
+    def _update_files_display(self, append_only: Optional[list] = None):
+        """更新文件列表显示
+
+        Args:
+            append_only: 刚追加到上传列表末尾的文件，提供时只在列表后追加这几行
+        """
+        start = len(self.uploaded_files) - len(append_only) if append_only else 0
         self.files_listbox.configure(state="normal")
-        self.files_listbox.delete("1.0", "end")
 
-        if not self.uploaded_files:
-            self.files_listbox.insert("1.0", "暂无文件上传")
+        if append_only and start and start == self._files_display_count:
+            # 已显示的行保持不变，只追加新文件
+            self.files_listbox.insert("end", "\n" + self._format_file_lines(append_only, start + 1))
         else:
-            lines = []
-            for i, file_info in enumerate(self.uploaded_files, 1):
-                filename = file_info.get('filename', '未知')
-                size = file_info.get('size', 0)
-                size_kb = size / 1024
-                lines.append(f"{i}. {filename} ({size_kb:.1f} KB)")
-            self.files_listbox.insert("1.0", "\n".join(lines))
+            self.files_listbox.delete("1.0", "end")
+
+            if not self.uploaded_files:
+                self.files_listbox.insert("1.0", "暂无文件上传")
+            else:
+                self.files_listbox.insert("1.0", self._format_file_lines(self.uploaded_files))
 
+        self._files_display_count = len(self.uploaded_files)
         self.files_listbox.configure(state="disabled")
 
     # ----------------------------------------------------------
@@ -6424,7 +7123,7 @@ class MainApp(ctk.CTk):
         self._generating = True
         self.followup_btn.configure(state="disabled")
         self.generate_btn.configure(state="disabled")
-        self.status_label.configure(text="追问中...")
+        self._set_status("追问中...")
 
         # 保存问题用于回调
         saved_question = question
@@ -6434,9 +7133,7 @@ class MainApp(ctk.CTk):
                 # 调用追问接口
                 response = self.prompt_service.followup(
                     question=saved_question,
-                    callback=lambda msg: self.after(
-                        0, lambda: self.status_label.configure(text=msg)
-                    ),
+                    callback=self._queue_status,
                 )
 
                 def on_success():
@@ -6446,7 +7143,8 @@ class MainApp(ctk.CTk):
                     # 清空输入框
                     self.followup_entry.delete(0, "end")
 
-                    self.status_label.configure(text="✅ 追问完成")
+                    self._cancel_status()
+                    self._set_status("✅ 追问完成")
                     self._generating = False
                     self.followup_btn.configure(state="normal")
                     self.generate_btn.configure(state="normal")
@@ -6455,7 +7153,8 @@ class MainApp(ctk.CTk):
 
             except Exception as e:
                 def on_error():
-                    self.status_label.configure(text="❌ 追问失败")
+                    self._cancel_status()
+                    self._set_status("❌ 追问失败")
                     self._generating = False
                     self.followup_btn.configure(state="normal")
                     self.generate_btn.configure(state="normal")
@@ -6470,10 +7169,13 @@ class MainApp(ctk.CTk):
     # ----------------------------------------------------------
 
     def _refresh_snippets(self):
-        """刷新快捷片段列表"""
-        # 清空现有内容
-        for widget in self.snippets_frame.winfo_children():
-            widget.destroy()
+        """刷新快捷片段列表
+
+        卡片按名称缓存：不再匹配的只隐藏，仍匹配的调整行号后重新显示，
+        只有新出现或内容已变化的片段才创建卡片。
+        """
+        # 先作废上一轮尚未完成的分批渲染，无结果时也不能让旧批次继续
+        self._snippet_render_token += 1
 
         # 获取搜索条件
         keyword = self.snippet_search_var.get().strip()
@@ -6483,21 +7185,79 @@ class MainApp(ctk.CTk):
 
         # 搜索片段
         snippets = DataManager.search_snippets(keyword, category)
+        cards = self._snippet_cards
+
+        # 隐藏不再匹配的卡片
+        for name in cards.keys() - snippets.keys():
+            cards[name][1].grid_remove()
 
         if not snippets:
-            ctk.CTkLabel(
-                self.snippets_frame,
-                text="没有找到匹配的片段",
-                text_color="gray",
-            ).grid(row=0, column=0, pady=20)
+            if self._snippet_empty_label is None:
+                self._snippet_empty_label = ctk.CTkLabel(
+                    self.snippets_frame,
+                    text="没有找到匹配的片段",
+                    text_color="gray",
+                )
+            self._snippet_empty_label.grid(row=0, column=0, pady=20)
+            return
+
+        if self._snippet_empty_label is not None:
+            self._snippet_empty_label.grid_remove()
+
+        # 只实例化前 _snippet_visible_limit 个卡片，其余的由“显示更多”按需创建
+        items = list(snippets.items())
+        shown = items[:self._snippet_visible_limit]
+        for name, _ in items[len(shown):]:
+            if name in cards:
+                cards[name][1].grid_remove()
+
+        if len(items) > len(shown):
+            if self._snippet_more_btn is None:
+                self._snippet_more_btn = ctk.CTkButton(
+                    self.snippets_frame,
+                    text="",
+                    fg_color="transparent",
+                    text_color="gray",
+                    command=self._show_more_snippets,
+                )
+            self._snippet_more_btn.configure(text=f"显示更多（还有 {len(items) - len(shown)} 个）")
+            self._snippet_more_btn.grid(row=len(shown), column=0, pady=8)
+        elif self._snippet_more_btn is not None:
+            self._snippet_more_btn.grid_remove()
+
+        # 显示片段卡片：分批渲染，批次之间让出事件循环处理输入
+        self._create_snippet_cards_batch(shown, 0, self._snippet_render_token)
+
+    def _show_more_snippets(self):
+        """多显示一页片段卡片，已创建的卡片会被复用"""
+        self._snippet_visible_limit += _SNIPPET_PAGE_SIZE
+        self._refresh_snippets()
+
+    def _create_snippet_cards_batch(self, items: list, start: int, token: int):
+        """渲染一批片段卡片（每批 20 个），剩余的在空闲时继续
+
+        token 与最新一次刷新不一致时说明列表已被重新刷新，放弃剩余批次。
+        """
+        if token != self._snippet_render_token:
             return
 
-        # 显示片段卡片
-        for i, (name, snippet) in enumerate(snippets.items()):
-            self._create_snippet_card(i, name, snippet)
+        cards = self._snippet_cards
+        end = min(start + 20, len(items))
+        for i in range(start, end):
+            name, snippet = items[i]
+            cached = cards.get(name)
+            if cached is not None and cached[0] == snippet:
+                cached[1].grid(row=i)
+                continue
+            if cached is not None:
+                cached[1].destroy()
+            cards[name] = (snippet, self._create_snippet_card(i, name, snippet))
+
+        if end < len(items):
+            self.after_idle(self._create_snippet_cards_batch, items, end, token)
 
     def _create_snippet_card(self, row: int, name: str, snippet: dict):
-        """创建片段卡片"""
+        """创建片段卡片，返回卡片控件"""
         is_preset = snippet.get("is_preset", False)
         category = snippet.get("category", "其他")
         content = snippet.get("content", "")
@@ -6517,23 +7277,25 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(
             title_frame,
             text=f"{'🔒 ' if is_preset else '📝 '}{name}",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold", family=None),
         ).pack(side="left")
 
         # 分类标签
         ctk.CTkLabel(
             title_frame,
             text=f"  [{category}]",
-            font=ctk.CTkFont(size=10),
+            font=self._font(10, family=None),
             text_color="gray",
         ).pack(side="left")
 
-        # 内容预览
-        preview = content[:60] + "..." if len(content) > 60 else content
+        # 内容预览（加载时已生成）
+        preview = snippet.get("_preview")
+        if preview is None:
+            preview = DataManager._snippet_preview(content)
         ctk.CTkLabel(
             info_frame,
             text=preview,
-            font=ctk.CTkFont(size=10),
+            font=self._font(10, family=None),
             text_color="gray",
         ).pack(anchor="w")
 
@@ -6567,6 +7329,8 @@ class MainApp(ctk.CTk):
                 command=lambda n=name: self._delete_snippet(n),
             ).pack(side="left", padx=2)
 
+        return card
+
     def _add_snippet_dialog(self):
         """添加片段对话框"""
         SnippetDialog(self, mode="add", callback=self._refresh_snippets)
@@ -6584,65 +7348,39 @@ class MainApp(ctk.CTk):
     def _delete_snippet(self, name: str):
         """删除片段"""
         # 确认对话框
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("确认删除")
-        dialog.geometry("300x150")
-        dialog.transient(self)
-        dialog.grab_set()
-
-        # 居中
-        dialog.update_idletasks()
-        x = self.winfo_x() + (self.winfo_width() - 300) // 2
-        y = self.winfo_y() + (self.winfo_height() - 150) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        ctk.CTkLabel(
-            dialog,
-            text=f"确定要删除片段 \"{name}\" 吗？",
-            font=ctk.CTkFont(size=14),
-        ).pack(pady=30)
-
-        btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
-        btn_frame.pack(pady=10)
-
-        def confirm():
-            if DataManager.delete_snippet(name):
-                self._refresh_snippets()
-                self._show_message("成功", f"片段 \"{name}\" 已删除")
-            else:
-                self._show_message("错误", "删除失败")
-            dialog.destroy()
-
-        ctk.CTkButton(
-            btn_frame,
-            text="确定",
-            fg_color="red",
-            command=confirm,
-        ).pack(side="left", padx=10)
+        if not messagebox.askyesno("确认删除", f"确定要删除片段 \"{name}\" 吗？", parent=self):
+            return
 
-        ctk.CTkButton(
-            btn_frame,
-            text="取消",
-            command=dialog.destroy,
-        ).pack(side="left", padx=10)
+        if DataManager.delete_snippet(name):
+            cached = self._snippet_cards.pop(name, None)
+            if cached is not None:
+                cached[1].destroy()
+            self._refresh_snippets()
+            self._show_message("成功", f"片段 \"{name}\" 已删除")
+        else:
+            self._show_message("错误", "删除失败")
 
     def _apply_snippet(self, name: str, content: str):
         """应用片段到项目描述"""
-        current_text = self.idea_textbox.get("1.0", "end-1c").strip()
-
-        if current_text:
-            # 追加到现有内容
-            new_text = f"{current_text}\n\n【{name}】\n{content}"
+        textbox = self.idea_textbox
+        # 由 Tk 定位首尾非空白字符，不必把整段内容取出来
+        last = textbox.search(r"\S", "end-1c", backwards=True, regexp=True)
+
+        if last:
+            # 去掉首尾空白后追加到现有内容
+            textbox.delete(f"{last}+1c", "end")
+            first = textbox.search(r"\S", "1.0", regexp=True)
+            if textbox.compare(first, ">", "1.0"):
+                textbox.delete("1.0", first)
+            textbox.insert("end", f"\n\n【{name}】\n{content}")
         else:
-            new_text = f"【{name}】\n{content}"
-
-        self.idea_textbox.delete("1.0", "end")
-        self.idea_textbox.insert("1.0", new_text)
+            textbox.delete("1.0", "end")
+            textbox.insert("1.0", f"【{name}】\n{content}")
         self._update_char_count()
 
         # 切换到新建项目标签页
         self.left_tabview.set("📝 新建项目")
-        self.status_label.configure(text=f"✅ 已应用片段: {name}")
+        self._set_status(f"✅ 已应用片段: {name}")
 
     # ----------------------------------------------------------
     #                       对话框
@@ -6657,40 +7395,79 @@ class MainApp(ctk.CTk):
         HelpDialog(self)
 
     def _show_message(self, title: str, message: str):
-        """显示消息"""
-        dialog = ctk.CTkToplevel(self)
+        """显示消息
+
+        复用同一个隐藏的对话框窗口；已有消息正在显示时排队，点击确定后依次显示。
+        """
+        self._msg_queue.append((title, message))
+        # 不能用 winfo_viewable 判断：窗口要等事件循环处理映射事件后才可见
+        dialog = self._msg_dialog
+        if self._msg_showing and dialog is not None and dialog.winfo_exists():
+            return
+        self._show_next_message()
+
+    def _show_next_message(self):
+        """显示队列中的下一条消息，队列为空时隐藏对话框"""
+        dialog = self._msg_dialog
+        if not self._msg_queue:
+            self._msg_showing = False
+            if dialog is not None and dialog.winfo_exists():
+                dialog.grab_release()
+                dialog.withdraw()
+            return
+
+        title, message = self._msg_queue.popleft()
+        self._msg_showing = True
+
+        if dialog is None or not dialog.winfo_exists():
+            dialog = ctk.CTkToplevel(self)
+            dialog.geometry("400x200")
+            dialog.transient(self)
+            dialog.protocol("WM_DELETE_WINDOW", self._show_next_message)
+
+            self._msg_title_lbl = ctk.CTkLabel(
+                dialog,
+                text="",
+                font=self._font(16, "bold", family=None),
+            )
+            self._msg_title_lbl.pack(pady=20)
+
+            self._msg_body_lbl = ctk.CTkLabel(
+                dialog,
+                text="",
+                wraplength=350,
+            )
+            self._msg_body_lbl.pack(pady=10)
+
+            ctk.CTkButton(
+                dialog,
+                text="确定",
+                command=self._show_next_message,
+            ).pack(pady=20)
+            self._msg_dialog = dialog
+
         dialog.title(title)
-        dialog.geometry("400x200")
-        dialog.transient(self)
-        dialog.grab_set()
+        self._msg_title_lbl.configure(text=title)
+        self._msg_body_lbl.configure(text=message)
 
         # 居中
-        dialog.update_idletasks()
         x = self.winfo_x() + (self.winfo_width() - 400) // 2
         y = self.winfo_y() + (self.winfo_height() - 200) // 2
         dialog.geometry(f"+{x}+{y}")
-
-        ctk.CTkLabel(
-            dialog,
-            text=title,
-            font=ctk.CTkFont(size=16, weight="bold"),
-        ).pack(pady=20)
-
-        ctk.CTkLabel(
-            dialog,
-            text=message,
-            wraplength=350,
-        ).pack(pady=10)
-
-        ctk.CTkButton(
-            dialog,
-            text="确定",
-            command=dialog.destroy,
-        ).pack(pady=20)
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
 
     def _on_closing(self):
-        """关闭事件"""
-        DataManager.save_settings(self.settings)
+        """关闭事件
+
+        设置在非守护线程中保存，窗口立即关闭，进程会等保存完成后再退出。
+        """
+        threading.Thread(
+            target=DataManager.save_settings,
+            args=(dict(self.settings),),
+            daemon=False,
+        ).start()
         self.destroy()
 
 
@@ -6706,7 +7483,7 @@ class SettingsDialog(ctk.CTkToplevel):
         parent,
         settings: dict,
         api_config: APIConfig,
-        prompt_service: PromptGeneratorService,
+        prompt_service: "PromptGeneratorService",
     ):
         super().__init__(parent)
 
@@ -6785,8 +7562,10 @@ class SettingsDialog(ctk.CTkToplevel):
             row=1, column=0, sticky="w", padx=10, pady=5
         )
 
+        self._api_key_var = ctk.StringVar(value=self.api_config.api_key or "")
         self.api_key_entry = ctk.CTkEntry(
             parent,
+            textvariable=self._api_key_var,
             show="•",
             width=400,
             height=36,
@@ -6797,16 +7576,16 @@ class SettingsDialog(ctk.CTkToplevel):
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         )
         self.api_key_entry.grid(row=2, column=0, sticky="w", padx=10, pady=5)
-        if self.api_config.api_key:
-            self.api_key_entry.insert(0, self.api_config.api_key)
 
         # Base URL
         ctk.CTkLabel(parent, text="API地址:").grid(
             row=3, column=0, sticky="w", padx=10, pady=5
         )
 
+        self._base_url_var = ctk.StringVar(value=self.api_config.base_url)
         self.base_url_entry = ctk.CTkEntry(
             parent,
+            textvariable=self._base_url_var,
             width=400,
             height=36,
             corner_radius=8,
@@ -6816,7 +7595,6 @@ class SettingsDialog(ctk.CTkToplevel):
             text_color=(self.colors["text_primary"], self.colors["text_primary_dark"])
         )
         self.base_url_entry.grid(row=4, column=0, sticky="w", padx=10, pady=5)
-        self.base_url_entry.insert(0, self.api_config.base_url)
 
         # Model
         ctk.CTkLabel(parent, text="模型:").grid(
@@ -6857,9 +7635,15 @@ class SettingsDialog(ctk.CTkToplevel):
             text_color=(self.colors["primary"], self.colors["primary_light"]),
             border_width=1,
             border_color=(self.colors["border"], self.colors["border_dark"]),
-            command=lambda: webbrowser.open("https://console.anthropic.com/"),
+            command=self._open_console,
         ).grid(row=8, column=0, sticky="w", padx=10, pady=5)
 
+    def _open_console(self):
+        """打开 Anthropic 控制台"""
+        import webbrowser
+
+        webbrowser.open("https://console.anthropic.com/")
+
     def _build_other_tab(self, parent):
         """构建其他设置标签页"""
         parent.grid_columnconfigure(0, weight=1)
@@ -6924,6 +7708,8 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _select_default_output(self):
         """选择默认输出目录"""
+        from tkinter import filedialog
+
         directory = filedialog.askdirectory()
         if directory:
             self.default_output_var.set(directory)
@@ -6931,8 +7717,8 @@ class SettingsDialog(ctk.CTkToplevel):
     def _save(self):
         """保存设置"""
         # 更新 API 配置
-        self.api_config.api_key = self.api_key_entry.get().strip()
-        self.api_config.base_url = self.base_url_entry.get().strip()
+        self.api_config.api_key = self._api_key_var.get().strip()
+        self.api_config.base_url = self._base_url_var.get().strip()
         self.api_config.model = self.model_var.get()
         self.prompt_service.reset_client()
 
@@ -6953,31 +7739,8 @@ class SettingsDialog(ctk.CTkToplevel):
 #                      帮助对话框
 # ============================================================
 
-class HelpDialog(ctk.CTkToplevel):
-    """帮助对话框"""
-
-    def __init__(self, parent):
-        super().__init__(parent)
-
-        self.title("❓ 帮助")
-        self.geometry("700x600")
-        self.transient(parent)
-
-        self._build_ui()
-
-    def _build_ui(self):
-        """构建界面"""
-        self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(0, weight=1)
-
-        textbox = ctk.CTkTextbox(
-            self,
-            font=ctk.CTkFont(size=12),
-            wrap="word",
-        )
-        textbox.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
-
-        help_text = """
+# 帮助对话框显示的快速开始指南
+_HELP_TEXT = """
 🚀 AI编程助手 v3.0 - 快速开始指南
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -7044,7 +7807,33 @@ class HelpDialog(ctk.CTkToplevel):
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
-        textbox.insert("1.0", help_text)
+
+
+class HelpDialog(ctk.CTkToplevel):
+    """帮助对话框"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        self.title("❓ 帮助")
+        self.geometry("700x600")
+        self.transient(parent)
+
+        self._build_ui()
+
+    def _build_ui(self):
+        """构建界面"""
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        textbox = ctk.CTkTextbox(
+            self,
+            font=ctk.CTkFont(size=12),
+            wrap="word",
+        )
+        textbox.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+
+        textbox.insert("1.0", _HELP_TEXT)
         textbox.configure(state="disabled")
 
         ctk.CTkButton(
@@ -7191,48 +7980,84 @@ class SnippetDialog(ctk.CTkToplevel):
 
     def _show_error(self, message: str):
         """显示错误提示"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("错误")
-        dialog.geometry("300x120")
-        dialog.transient(self)
-        dialog.grab_set()
-
-        ctk.CTkLabel(dialog, text=message, text_color="red").pack(pady=30)
-        ctk.CTkButton(dialog, text="确定", command=dialog.destroy).pack()
+        messagebox.showerror("错误", message, parent=self)
 
     def _show_success(self, message: str):
         """显示成功提示"""
-        self.parent.status_label.configure(text=f"✅ {message}")
+        self.parent._set_status(f"✅ {message}")
 
 
 # ============================================================
 #                     模板编辑对话框
 # ============================================================
 
+# 新建模板时内容框中预填的格式
+_DEFAULT_TEMPLATE_CONTENT = """【项目描述】
+- [描述项目的主要用途和目标]
+
+【核心功能】
+1. [功能1]
+2. [功能2]
+3. [功能3]
+
+【技术要求】
+- [技术要求1]
+- [技术要求2]
+
+【其他说明】
+- [补充说明]"""
+
+# 粘贴超过该字符数时分批插入模板内容文本框，每批插入的行数
+_LARGE_PASTE_CHARS = 100_000
+_PASTE_BATCH_LINES = 500
+
+
 class TemplateDialog(ctk.CTkToplevel):
     """模板添加对话框"""
 
+    # 已关闭对话框归还的 StringVar，再次打开时复用，省去新建 Tcl 变量
+    _var_pool: list = []
+
     def __init__(self, parent, callback=None):
         super().__init__(parent)
 
         self.parent = parent
         self.callback = callback
+        self._error_dialog = None  # 复用的错误提示窗口，首次出错时创建
+        self._error_label = None
+        self._last_framework_values = None  # 框架下拉框当前的选项列表
 
         self.title("➕ 添加模板")
-        self.geometry("600x550")
-        self.transient(parent)
-        self.grab_set()
-
-        # 居中显示
-        self.update_idletasks()
+        # 主窗口尺寸已确定，直接一次性设置大小和居中位置
         x = parent.winfo_x() + (parent.winfo_width() - 600) // 2
         y = parent.winfo_y() + (parent.winfo_height() - 550) // 2
-        self.geometry(f"+{x}+{y}")
+        self.geometry(f"600x550+{x}+{y}")
+        self.transient(parent)
+        self.grab_set()
 
         self._build_ui()
 
+    def _acquire_var(self, value: str = "") -> ctk.StringVar:
+        """从池中取出一个 StringVar 并设置初值，池为空时新建"""
+        if TemplateDialog._var_pool:
+            var = TemplateDialog._var_pool.pop()
+            var.set(value)
+            return var
+        return ctk.StringVar(value=value)
+
+    def destroy(self):
+        """销毁对话框，并把 StringVar 归还到池中"""
+        super().destroy()
+        for attr in ("lang_var", "framework_var"):
+            var = getattr(self, attr, None)
+            if var is not None:
+                setattr(self, attr, None)
+                TemplateDialog._var_pool.append(var)
+
     def _build_ui(self):
         """构建界面"""
+        # 与主窗口共用字体缓存，相同规格的字体只创建一次
+        font = self.parent._font
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(4, weight=1)
 
@@ -7241,13 +8066,13 @@ class TemplateDialog(ctk.CTkToplevel):
         name_frame.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 5))
         name_frame.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(name_frame, text="模板名称:", font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")).grid(row=0, column=0, sticky="w", padx=5)
+        ctk.CTkLabel(name_frame, text="模板名称:", font=font(12)).grid(row=0, column=0, sticky="w", padx=5)
         self.name_entry = ctk.CTkEntry(
             name_frame,
             placeholder_text="如: 电商网站",
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")
+            font=font(12)
         )
         self.name_entry.grid(row=0, column=1, sticky="ew", padx=5)
 
@@ -7256,13 +8081,13 @@ class TemplateDialog(ctk.CTkToplevel):
         desc_frame.grid(row=1, column=0, sticky="ew", padx=20, pady=5)
         desc_frame.grid_columnconfigure(1, weight=1)
 
-        ctk.CTkLabel(desc_frame, text="模板描述:", font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")).grid(row=0, column=0, sticky="w", padx=5)
+        ctk.CTkLabel(desc_frame, text="模板描述:", font=font(12)).grid(row=0, column=0, sticky="w", padx=5)
         self.desc_entry = ctk.CTkEntry(
             desc_frame,
             placeholder_text="简短描述模板用途",
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")
+            font=font(12)
         )
         self.desc_entry.grid(row=0, column=1, sticky="ew", padx=5)
 
@@ -7272,8 +8097,8 @@ class TemplateDialog(ctk.CTkToplevel):
         tech_frame.grid_columnconfigure(1, weight=1)
         tech_frame.grid_columnconfigure(3, weight=1)
 
-        ctk.CTkLabel(tech_frame, text="编程语言:", font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")).grid(row=0, column=0, sticky="w", padx=5)
-        self.lang_var = ctk.StringVar(value="Python")
+        ctk.CTkLabel(tech_frame, text="编程语言:", font=font(12)).grid(row=0, column=0, sticky="w", padx=5)
+        self.lang_var = self._acquire_var("Python")
         ctk.CTkOptionMenu(
             tech_frame,
             values=list(LANGUAGE_FRAMEWORKS.keys()),
@@ -7282,11 +8107,11 @@ class TemplateDialog(ctk.CTkToplevel):
             width=150,
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")
+            font=font(12)
         ).grid(row=0, column=1, sticky="w", padx=5)
 
-        ctk.CTkLabel(tech_frame, text="框架:", font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")).grid(row=0, column=2, sticky="w", padx=5)
-        self.framework_var = ctk.StringVar()
+        ctk.CTkLabel(tech_frame, text="框架:", font=font(12)).grid(row=0, column=2, sticky="w", padx=5)
+        self.framework_var = self._acquire_var()
         self.framework_menu = ctk.CTkOptionMenu(
             tech_frame,
             values=[""],
@@ -7294,7 +8119,7 @@ class TemplateDialog(ctk.CTkToplevel):
             width=150,
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=12, family="Microsoft YaHei UI")
+            font=font(12)
         )
         self.framework_menu.grid(row=0, column=3, sticky="w", padx=5)
 
@@ -7308,59 +8133,50 @@ class TemplateDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             content_label,
             text="模板内容:",
-            font=ctk.CTkFont(weight="bold"),
+            font=font(None, "bold", family=None),
         ).pack(side="left", padx=5)
 
         ctk.CTkLabel(
             content_label,
             text="(描述项目需求，支持Markdown格式)",
             text_color="gray",
-            font=ctk.CTkFont(size=11),
+            font=font(11, family=None),
         ).pack(side="left", padx=5)
 
         # 模板内容文本框
         self.content_textbox = ctk.CTkTextbox(
             self,
-            font=ctk.CTkFont(size=12),
+            font=font(12, family=None),
             wrap="word",
         )
         self.content_textbox.grid(row=4, column=0, sticky="nsew", padx=20, pady=5)
 
         # 插入默认模板格式
-        default_content = """【项目描述】
-- [描述项目的主要用途和目标]
-
-【核心功能】
-1. [功能1]
-2. [功能2]
-3. [功能3]
-
-【技术要求】
-- [技术要求1]
-- [技术要求2]
-
-【其他说明】
-- [补充说明]"""
-        self.content_textbox.insert("1.0", default_content)
+        self.content_textbox.insert("1.0", _DEFAULT_TEMPLATE_CONTENT)
+        # 直接持有底层 tk.Text，并清除修改标记，保存时据此判断内容是否被编辑过
+        self._text_tk = self.content_textbox._textbox
+        self._text_tk.edit_modified(False)
+        self._text_tk.bind("<<Paste>>", self._on_content_paste)
 
         # 按钮区域
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
         btn_frame.grid(row=5, column=0, sticky="ew", padx=20, pady=20)
 
-        ctk.CTkButton(
+        self.save_btn = ctk.CTkButton(
             btn_frame,
             text="保存模板",
-            font=ctk.CTkFont(size=13, weight="bold", family="Microsoft YaHei UI"),
+            font=font(13, "bold"),
             width=100,
             height=38,
             corner_radius=8,
             command=self._save,
-        ).pack(side="left", padx=10)
+        )
+        self.save_btn.pack(side="left", padx=10)
 
         ctk.CTkButton(
             btn_frame,
             text="取消",
-            font=ctk.CTkFont(size=13, family="Microsoft YaHei UI"),
+            font=font(13),
             width=80,
             height=38,
             corner_radius=8,
@@ -7372,19 +8188,44 @@ class TemplateDialog(ctk.CTkToplevel):
             command=self.destroy,
         ).pack(side="left", padx=10)
 
+    def _on_content_paste(self, event=None):
+        """大段粘贴时分批插入，避免一次性排版整段文本卡住界面"""
+        try:
+            text = self.clipboard_get()
+        except Exception:
+            return None
+        if len(text) < _LARGE_PASTE_CHARS:
+            return None  # 普通粘贴交给文本框默认处理
+
+        tk_text = self._text_tk
+        if tk_text.tag_ranges("sel"):
+            tk_text.delete("sel.first", "sel.last")
+        # 用标记记录插入位置，插入后标记随文本后移，用户移动光标也不影响后续批次
+        tk_text.mark_set("paste_at", "insert")
+        self.save_btn.configure(state="disabled")
+        self._insert_paste_batch(text.splitlines(keepends=True), 0)
+        return "break"
+
+    def _insert_paste_batch(self, lines: list, start: int):
+        """插入一批粘贴内容，未完成时在空闲时继续"""
+        if not self.winfo_exists():
+            return
+        end = start + _PASTE_BATCH_LINES
+        self.content_textbox.insert("paste_at", "".join(lines[start:end]))
+        if end < len(lines):
+            self.after_idle(self._insert_paste_batch, lines, end)
+        else:
+            self._text_tk.mark_unset("paste_at")
+            self.save_btn.configure(state="normal")
+
     def _on_lang_changed(self, lang: str):
         """语言变更事件"""
-        lang_info = LANGUAGE_FRAMEWORKS.get(lang, {})
-        categories = lang_info.get("categories", {})
-
-        # 收集所有框架
-        all_frameworks = []
-        for cat_frameworks in categories.values():
-            all_frameworks.extend(cat_frameworks)
-
-        # 去重
-        all_frameworks = list(dict.fromkeys(all_frameworks))
+        all_frameworks = _frameworks_by_lang().get(lang, [])
+        # 框架列表没有变化时保留当前选项，不重建下拉菜单
+        if all_frameworks == self._last_framework_values:
+            return
 
+        self._last_framework_values = all_frameworks
         self.framework_menu.configure(values=all_frameworks)
         if all_frameworks:
             self.framework_var.set(all_frameworks[0])
@@ -7395,51 +8236,96 @@ class TemplateDialog(ctk.CTkToplevel):
         description = self.desc_entry.get().strip()
         language = self.lang_var.get()
         framework = self.framework_var.get()
-        content = self.content_textbox.get("1.0", "end-1c").strip()
-
-        if not name:
-            self._show_error("请输入模板名称")
-            return
-
-        if not content:
-            self._show_error("请输入模板内容")
-            return
-
-        # 检查是否与默认模板重名
-        if name in DEFAULT_TEMPLATES:
-            self._show_error("不能使用与内置模板相同的名称")
-            return
+        if self._text_tk.edit_modified():
+            # 由 Tk 定位首尾非空白字符，只取出去掉首尾空白后的内容
+            tk_text = self._text_tk
+            first = tk_text.search(r"\S", "1.0", stopindex="end", regexp=True)
+            if first:
+                last = tk_text.search(r"\S", "end-1c", backwards=True, regexp=True)
+                content = tk_text.get(first, f"{last}+1c")
+            else:
+                content = ""
+        else:
+            # 未编辑过，无需整段读取文本框
+            content = _DEFAULT_TEMPLATE_CONTENT.strip()
+
+        # 校验规则表：(是否不合法, 错误提示)，按顺序报告第一个错误
+        checks = (
+            (not name, "请输入模板名称"),
+            (not content, "请输入模板内容"),
+            (name in _DEFAULT_TEMPLATE_NAMES, "不能使用与内置模板相同的名称"),
+        )
+        for bad, message in checks:
+            if bad:
+                self._show_error(message)
+                return
 
-        # 保存模板
-        templates = DataManager.load_templates()
-        templates[name] = {
+        # 保存模板（读写文件在后台线程进行，期间禁用保存按钮防止重复提交）
+        payload = {
             "description": description or "自定义模板",
             "language": language,
             "framework": framework,
             "content": content,
         }
+        self.save_btn.configure(state="disabled")
+        # 非守护线程：写入途中关闭程序时，进程会等模板文件写完再退出
+        threading.Thread(target=self._persist, args=(name, payload), daemon=False).start()
+
+    def _persist(self, name: str, payload: dict):
+        """后台线程：写入模板文件，结果交回主线程处理"""
+        ok = False
+        try:
+            templates = DataManager.load_templates()
+            templates[name] = payload
+            ok = DataManager.save_templates(templates)
+        except Exception:
+            logger.exception("保存模板失败")
 
-        if DataManager.save_templates(templates):
-            self.parent.status_label.configure(text=f"✅ 模板 \"{name}\" 已保存")
+        # 对话框可能已被关闭，经由主窗口调度回调
+        try:
+            self.parent.after(0, self._on_saved, name, ok)
+        except RuntimeError:
+            pass  # 主窗口已退出事件循环，无需再更新界面
+
+    def _on_saved(self, name: str, ok: bool):
+        """模板保存完成（主线程）"""
+        if ok:
+            self.parent._set_status(f"✅ 模板 \"{name}\" 已保存")
             if self.callback:
                 self.callback()
-            self.destroy()
-        else:
+            if self.winfo_exists():
+                self.destroy()
+        elif self.winfo_exists():
+            self.save_btn.configure(state="normal")
             self._show_error("保存失败")
 
     def _show_error(self, message: str):
-        """显示错误提示"""
-        dialog = ctk.CTkToplevel(self)
-        dialog.title("错误")
-        dialog.geometry("300x120")
-        dialog.transient(self)
-        dialog.grab_set()
+        """显示错误提示（复用同一个错误窗口，关闭时只隐藏）"""
+        dialog = self._error_dialog
+        if dialog is None:
+            dialog = ctk.CTkToplevel(self)
+            dialog.title("错误")
+            dialog.geometry("300x120")
+            dialog.transient(self)
+            dialog.protocol("WM_DELETE_WINDOW", self._hide_error)
+
+            self._error_label = ctk.CTkLabel(dialog, text="", text_color="red")
+            self._error_label.pack(pady=30)
+            ctk.CTkButton(dialog, text="确定", command=self._hide_error).pack()
+            self._error_dialog = dialog
+
+        self._error_label.configure(text=message)
 
         # 居中
-        dialog.update_idletasks()
         x = self.winfo_x() + (self.winfo_width() - 300) // 2
         y = self.winfo_y() + (self.winfo_height() - 120) // 2
         dialog.geometry(f"+{x}+{y}")
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
 
-        ctk.CTkLabel(dialog, text=message, text_color="red").pack(pady=30)
-        ctk.CTkButton(dialog, text="确定", command=dialog.destroy).pack()
\ No newline at end of file
+    def _hide_error(self):
+        """隐藏错误提示，焦点交还模板对话框"""
+        self._error_dialog.grab_release()
+        self._error_dialog.withdraw()
+        self.grab_set()
\ No newline at end of file